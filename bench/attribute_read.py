@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Measures attribute read (and write) throughput for regular, compact and
+``__fast_read__`` records.  Run it from the top of the source tree:
+
+    $ python bench/attribute_read.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+
+
+def make_point(name, **attrs):
+    attrs.update(
+        x=Property(isa=int, required=True),
+        y=Property(isa=int, required=True),
+        label=Property(isa=str, default=""),
+    )
+    return type(Record)(name, (Record,), attrs)
+
+
+Point = make_point("Point")
+CompactPoint = make_point("CompactPoint", __compact__=True)
+FastPoint = make_point("FastPoint", __fast_read__=True)
+
+
+class Plain(object):
+    def __init__(self, x, y, label=""):
+        self.x = x
+        self.y = y
+        self.label = label
+
+
+def reads(point):
+    return lambda: (point.x, point.y, point.label, point.x, point.y)
+
+
+def writes(point):
+    def write():
+        point.x = 1
+        point.y = 2
+    return write
+
+
+def main(number=500000):
+    for cls in Plain, Point, CompactPoint, FastPoint:
+        point = cls(x=1, y=2)
+        read = min(timeit.repeat(reads(point), number=number, repeat=3))
+        write = min(timeit.repeat(writes(point), number=number, repeat=3))
+        print "%-13s %10.0f reads/s  %10.0f writes/s" % (
+            cls.__name__, number * 5 / read, number * 2 / write,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Measures the cost of assigning to properties, which note the change so
+that cached primary keys and indexes are thrown away (see
+:py:func:`normalize.property.changed`).  Run it from the top of the source
+tree:
+
+    $ python bench/attribute_write.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+
+
+class Safe(Record):
+    value = Property(isa=int)
+    label = Property(isa=str)
+
+
+class WithUnsafe(Record):
+    value = Property(isa=int)
+    note = Property()
+
+
+def safe_set():
+    record = Safe(value=1, label="a")
+
+    def write():
+        record.value = 2
+    return write
+
+
+def safe_set_unsafe_sibling():
+    record = WithUnsafe(value=1, note="a")
+
+    def write():
+        record.value = 2
+    return write
+
+
+def unsafe_set():
+    record = WithUnsafe(value=1, note="a")
+
+    def write():
+        record.note = "b"
+    return write
+
+
+def safe_set_hashed():
+    record = Safe(value=1, label="a")
+
+    def write():
+        hash(record)
+        record.value = 2
+    return write
+
+
+def main(number=500000):
+    for name, make in (
+        ("safe set", safe_set),
+        ("safe set, unsafe sibling", safe_set_unsafe_sibling),
+        ("unsafe set", unsafe_set),
+        ("hash, then safe set", safe_set_hashed),
+    ):
+        elapsed = min(timeit.repeat(make(), number=number, repeat=5))
+        print "%-25s %8.0f ns" % (name, elapsed / number * 1e9)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Measures constructing records with datetime properties from strings,
+where the same timestamps repeat, with and without ``coerce_cache=``.  Run
+it from the top of the source tree:
+
+    $ python bench/coerce_cache.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Record  # noqa
+from normalize.property.types import DatetimeProperty  # noqa
+
+
+class Event(Record):
+    when = DatetimeProperty()
+
+
+class CachedEvent(Record):
+    when = DatetimeProperty(coerce_cache=1000)
+
+
+STAMPS = list(
+    "2015-03-%.2dT%.2d:00:00" % (1 + i % 28, i % 24) for i in range(500)
+) * 20
+
+
+def main(number=3):
+    baseline = None
+    for cls in Event, CachedEvent:
+        elapsed = min(timeit.repeat(
+            lambda: list(cls(when=stamp) for stamp in STAMPS),
+            number=number, repeat=3,
+        ))
+        rate = number * len(STAMPS) / elapsed
+        baseline = baseline or rate
+        print "%-12s %9.0f records/s  %5.2fx" % (
+            cls.__name__, rate, rate / baseline,
+        )
+    print CachedEvent.properties['when'].coerce_cache
+
+
+if __name__ == "__main__":
+    main()
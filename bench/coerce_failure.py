@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Measures how many failed coercions and checks per second can be caught
+and discarded, as a tolerant ingest would, compared with also formatting
+each exception's message.  Run it from the top of the source tree:
+
+    $ python bench/coerce_failure.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+
+
+class Reading(Record):
+    level = Property(isa=int)
+    sensor = Property(isa=str, check=lambda x: x.isalpha())
+
+
+BAD_LEVEL = {"raw": range(100), "note": "not a number"}
+
+
+def failing(propname, value, format_message):
+    prop = Reading.properties[propname]
+
+    def attempt():
+        try:
+            prop.validate(value)
+        except ValueError as e:
+            if format_message:
+                str(e)
+    return attempt
+
+
+def main(number=100000):
+    for propname, value in ("level", BAD_LEVEL), ("sensor", "x-1"):
+        for format_message in False, True:
+            elapsed = min(timeit.repeat(
+                failing(propname, value, format_message),
+                number=number, repeat=3,
+            ))
+            print "%-7s %-9s %9.0f failures/s" % (
+                propname, "formatted" if format_message else "discarded",
+                number / elapsed,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+"""Compares filtering a ``RecordList`` by a nested field with
+``FieldSelector.get`` against using a declared ``HashIndex``, and a range
+query against a ``SortedIndex``; and again with another record written to
+before each query, which does not make the indexes stale.  Run it from the
+top of the source tree:
+
+    $ python bench/coll_index.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import FieldSelector  # noqa
+from normalize import HashIndex  # noqa
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+from normalize import RecordList  # noqa
+from normalize import SortedIndex  # noqa
+
+
+class Owner(Record):
+    region = Property(isa=str)
+
+
+class Account(Record):
+    id = Property(isa=int)
+    owner = Property(isa=Owner)
+    balance = Property(isa=int)
+
+
+class AccountList(RecordList):
+    itemtype = Account
+    indexes = dict(
+        region=HashIndex(["owner", "region"]),
+        balance=SortedIndex("balance"),
+    )
+
+
+REGIONS = ["emea", "apac", "amer", "latam"]
+ACCOUNTS = AccountList(
+    Account(id=i, owner=Owner(region=REGIONS[i % 4]), balance=i * 7 % 5000)
+    for i in range(5000)
+)
+REGION = FieldSelector(["owner", "region"])
+SCRATCH = Account(id=-1, owner=Owner(region="none"), balance=0)
+
+
+def scan():
+    [x for x in ACCOUNTS if REGION.get(x) == "apac"]
+    [x for x in ACCOUNTS if 1000 <= x.balance < 1100]
+
+
+def indexed():
+    ACCOUNTS.lookup("region", "apac")
+    ACCOUNTS.range("balance", 1000, 1100)
+
+
+def writing(func):
+    def write_then_query():
+        SCRATCH.balance += 1
+        SCRATCH.owner.region = "none"
+        func()
+    return write_then_query
+
+
+def main(number=50):
+    for label, funcs in (
+        ("", (scan, indexed)),
+        (" +write", (writing(scan), writing(indexed))),
+    ):
+        results = []
+        for name, func in zip(("scan", "indexed"), funcs):
+            elapsed = min(timeit.repeat(func, number=number, repeat=3))
+            results.append(elapsed)
+            print "%-16s %8.0f queries/s" % (
+                name + label, number * 2 / elapsed,
+            )
+        print "%-16s %8.2fx" % ("speedup" + label, results[0] / results[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+"""Compares diffing two large ``DictCollection`` maps by key against
+matching their items by primary key.  Run it from the top of the source
+tree:
+
+    $ python bench/dict_diff.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import DictCollection  # noqa
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+from normalize.diff import compare_collection_iter  # noqa
+
+
+class Setting(Record):
+    name = Property(isa=str)
+    value = Property(isa=str)
+
+
+class SettingMap(DictCollection):
+    itemtype = Setting
+
+
+class UnkeyedSettingMap(SettingMap):
+    diff_by_key = False
+
+
+def settings(n, changed):
+    return dict(
+        ("key%d" % i, Setting(name="setting %d" % i,
+                              value="changed" if i in changed else "same"))
+        for i in range(n)
+    )
+
+
+BASE = settings(20000, ())
+OTHER = settings(20000, set(range(0, 20000, 50)))
+
+
+def main(number=3):
+    results = []
+    for name, map_type in ("by pk", UnkeyedSettingMap), ("by key", SettingMap):
+        a, b = map_type(BASE), map_type(OTHER)
+        elapsed = min(timeit.repeat(
+            lambda: list(compare_collection_iter(a, b)),
+            number=number, repeat=3,
+        ))
+        results.append(elapsed)
+        print "%-10s %8.2f diffs/s" % (name, number / elapsed)
+    print "speedup    %8.2fx" % (results[0] / results[1])
+
+
+if __name__ == "__main__":
+    main()
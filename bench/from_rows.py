@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Compares building a ``RecordList`` one record at a time with the
+``from_rows`` and ``from_columns`` bulk constructors.  Run it from the top of
+the source tree:
+
+    $ python bench/from_rows.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+from normalize import RecordList  # noqa
+
+
+class Point(Record):
+    x = Property(isa=int, required=True)
+    y = Property(isa=int, required=True)
+    label = Property(isa=str, default="")
+    weight = Property(isa=float)
+
+
+class PointList(RecordList):
+    itemtype = Point
+
+
+FIELDS = ("x", "y", "weight")
+ROWS = [(i, i * 2, i / 3.0) for i in range(10000)]
+COLUMNS = dict(zip(FIELDS, zip(*ROWS)))
+
+
+def one_at_a_time():
+    return PointList(Point(dict(zip(FIELDS, row))) for row in ROWS)
+
+
+def main(number=10):
+    cases = (
+        ("one at a time", one_at_a_time),
+        ("from_rows", lambda: Point.from_rows(FIELDS, ROWS)),
+        ("from_columns", lambda: Point.from_columns(COLUMNS)),
+        ("trusted", lambda: Point.from_rows(FIELDS, ROWS, trusted=True)),
+    )
+    baseline = None
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        rate = number * len(ROWS) / elapsed
+        baseline = baseline or rate
+        print "%-14s %9.0f records/s  %5.2fx" % (name, rate, rate / baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Parses a million distinct ISO-8601 timestamps with the fast parser used
+by ``DatetimeProperty`` and with the general parser it falls back to.  Run it
+from the top of the source tree:
+
+    $ python bench/iso8601.py [COUNT]
+
+The general parser is slow, so it is timed on a sample and scaled up.
+"""
+
+from __future__ import absolute_import
+
+from datetime import datetime
+from datetime import timedelta
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize.property.types import coerce_datetime  # noqa
+from normalize.property.types import parse_datetime  # noqa
+from normalize.property.types import parse_iso8601  # noqa
+
+
+FORMATS = (
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S.%f+05:30",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+
+def timestamps(count):
+    start = datetime(2015, 1, 1)
+    step = timedelta(seconds=31, microseconds=1234)
+    return list(
+        (start + step * i).strftime(FORMATS[i % len(FORMATS)])
+        for i in xrange(count)
+    )
+
+
+def timed(func, stamps):
+    start = time.time()
+    for stamp in stamps:
+        func(stamp)
+    return time.time() - start
+
+
+def main(count=1000000, sample=20000):
+    stamps = timestamps(count)
+    for name, func, todo in (
+        ("parse_iso8601", parse_iso8601, stamps),
+        ("coerce_datetime", coerce_datetime, stamps),
+        ("general parser", parse_datetime, stamps[:sample]),
+    ):
+        elapsed = timed(func, todo) * len(stamps) / len(todo)
+        print "%-16s %7.2fs for %d  (%8.0f/s)" % (
+            name, elapsed, count, count / elapsed,
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
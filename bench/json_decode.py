@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Measures marshalling in a nested API-style payload, with ``from_json``
+and with the ``JsonRecord`` constructor.  Run it from the top of the source
+tree:
+
+    $ python bench/json_decode.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import from_json  # noqa
+from normalize import JsonListProperty  # noqa
+from normalize import JsonProperty  # noqa
+from normalize import JsonRecord  # noqa
+
+
+class Media(JsonRecord):
+    url = JsonProperty(isa=str)
+    width = JsonProperty(isa=int)
+    height = JsonProperty(isa=int)
+    kind = JsonProperty(isa=str, json_name="type")
+
+
+class User(JsonRecord):
+    id = JsonProperty(isa=int, required=True)
+    screen_name = JsonProperty(isa=str)
+    name = JsonProperty(isa=str)
+    followers = JsonProperty(isa=int, json_name="followers_count")
+    avatar = JsonProperty(isa=Media)
+
+
+class Post(JsonRecord):
+    id = JsonProperty(isa=int, required=True)
+    text = JsonProperty(isa=str)
+    author = JsonProperty(isa=User)
+    media = JsonListProperty(of=Media)
+    likes = JsonProperty(isa=int, json_name="like_count")
+
+
+class Thread(JsonRecord):
+    id = JsonProperty(isa=int, required=True)
+    title = JsonProperty(isa=str)
+    posts = JsonListProperty(of=Post)
+
+
+def media(i):
+    return {"url": "http://example.com/%d.jpg" % i, "width": 640,
+            "height": 480, "type": "photo", "alt": "picture %d" % i}
+
+
+def post(i):
+    return {
+        "id": i, "text": "post number %d" % i, "like_count": i * 3,
+        "author": {"id": i % 7, "screen_name": "user%d" % (i % 7),
+                   "name": "User %d" % (i % 7), "followers_count": 100,
+                   "avatar": media(i), "verified": False},
+        "media": [media(i * 10 + j) for j in range(i % 3)],
+        "lang": "en",
+    }
+
+
+THREAD = {"id": 1, "title": "a thread",
+          "posts": [post(i) for i in range(50)]}
+
+
+def main(number=200):
+    for name, func in (
+        ("from_json", lambda: from_json(Thread, THREAD)),
+        ("JsonRecord()", lambda: Thread(THREAD)),
+    ):
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        print "%-13s %7.0f threads/s" % (name, number / elapsed)
+
+
+if __name__ == "__main__":
+    main()
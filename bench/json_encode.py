@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Measures marshalling out the nested API-style payload from
+``json_decode.py``, with ``to_json`` and ``JsonRecord.json_data``.  Run it
+from the top of the source tree:
+
+    $ python bench/json_encode.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import to_json  # noqa
+
+from json_decode import Thread  # noqa
+from json_decode import THREAD  # noqa
+
+THREAD_RECORD = Thread(THREAD)
+
+
+def main(number=200):
+    for name, func in (
+        ("to_json", lambda: to_json(THREAD_RECORD)),
+        ("json_data()", lambda: THREAD_RECORD.json_data(extraneous=True)),
+    ):
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        print "%-13s %7.0f threads/s" % (name, number / elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+"""Measures passing records through from JSON to JSON while reading one
+property, with and without ``__lazy_json__``.  Run it from the top of the
+source tree:
+
+    $ python bench/json_lazy.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import from_json  # noqa
+from normalize import JsonListProperty  # noqa
+from normalize import JsonProperty  # noqa
+from normalize import JsonRecord  # noqa
+from normalize import to_json  # noqa
+
+
+class Item(JsonRecord):
+    sku = JsonProperty(isa=str)
+    quantity = JsonProperty(isa=int)
+    price = JsonProperty(isa=float)
+
+
+class Order(JsonRecord):
+    id = JsonProperty(isa=int)
+    customer = JsonProperty(isa=str)
+    status = JsonProperty(isa=str)
+    notes = JsonProperty(isa=str)
+    items = JsonListProperty(of=Item)
+
+
+class LazyItem(Item):
+    __lazy_json__ = True
+
+
+class LazyOrder(Order):
+    __lazy_json__ = True
+    items = JsonListProperty(of=LazyItem)
+
+
+ORDER = {
+    "id": 1,
+    "customer": "cust-1",
+    "status": "open",
+    "notes": "leave at the door",
+    "items": [{"sku": "sku-%d" % i, "quantity": i, "price": i * 1.25}
+              for i in range(50)],
+}
+
+
+def pass_through(record_type):
+    order = from_json(record_type, ORDER)
+    order.status
+    return to_json(order)
+
+
+def main(number=1000):
+    for record_type in (Order, LazyOrder):
+        elapsed = min(timeit.repeat(
+            lambda: pass_through(record_type), number=number, repeat=3,
+        ))
+        print "%-10s %8.0f records/s" % (
+            record_type.__name__, number / elapsed,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Compares the peak memory use of writing a large ``JsonRecordList`` to a
+file with ``json.dump(to_json(...))`` and with the streaming
+``normalize.record.json.dump``.  Each is run in a forked child, so that
+the peak resident size of one does not hide the other.  Run it from the
+top of the source tree:
+
+    $ python bench/json_stream.py [ITEMS]
+"""
+
+from __future__ import absolute_import
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import JsonProperty  # noqa
+from normalize import JsonRecord  # noqa
+from normalize import JsonRecordList  # noqa
+from normalize import to_json  # noqa
+from normalize.record.json import dump  # noqa
+
+
+class Event(JsonRecord):
+    id = JsonProperty(isa=int)
+    kind = JsonProperty(isa=str, json_name="type")
+    payload = JsonProperty(isa=str)
+    score = JsonProperty(isa=float)
+
+
+class EventList(JsonRecordList):
+    itemtype = Event
+
+
+def measure(func):
+    pid = os.fork()
+    if not pid:
+        with open(os.devnull, "w") as devnull:
+            func(devnull)
+        os._exit(0)
+    start = time.time()
+    _, status, rusage = os.wait4(pid, 0)
+    return time.time() - start, rusage.ru_maxrss / 1024.0
+
+
+def main(items=200000):
+    events = EventList(
+        {"id": i, "type": "click", "payload": "x" * 40, "score": i / 7.0,
+         "session": "s%d" % (i % 100)} for i in xrange(items)
+    )
+    for name, func in (
+        ("baseline", lambda fp: None),
+        ("json.dump(to_json())",
+         lambda fp: json.dump(to_json(events), fp)),
+        ("json.dumps(to_json())",
+         lambda fp: fp.write(json.dumps(to_json(events)))),
+        ("dump()", lambda fp: dump(events, fp)),
+    ):
+        elapsed, peak = measure(func)
+        print "%-22s %6.2fs  peak %7.1f MB" % (name, elapsed, peak)
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
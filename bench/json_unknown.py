@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+"""Measures marshalling in records which carry a large sub-document that
+is not modelled, with each ``unknown_json_keys_mode``.  Run it from the top
+of the source tree:
+
+    $ python bench/json_unknown.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import from_json  # noqa
+from normalize import JsonProperty  # noqa
+from normalize import JsonRecord  # noqa
+
+
+class Event(JsonRecord):
+    id = JsonProperty(isa=int)
+    kind = JsonProperty(isa=str)
+
+
+EVENT = {
+    "id": 1,
+    "kind": "page_view",
+    "context": {
+        "headers": dict(("x-header-%d" % i, "value %d" % i)
+                        for i in range(40)),
+        "trace": [{"span": i, "tags": ["a", "b", "c"], "ms": i * 0.5}
+                  for i in range(100)],
+    },
+}
+
+
+def main(number=2000):
+    for mode in ("copy", "cow", "share"):
+        elapsed = min(timeit.repeat(
+            lambda: from_json(Event, EVENT, unknown_json_keys_mode=mode),
+            number=number, repeat=3,
+        ))
+        print "%-6s %8.0f records/s" % (mode, number / elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Measures JSON lines throughput, in and out, for the nested ``Post``
+records from ``json_decode.py``, compared with loops calling
+``json.loads``/``json.dumps`` for each line.  Run it from the top of the source
+tree:
+
+    $ python bench/jsonl.py [LINES]
+"""
+
+from __future__ import absolute_import
+
+from cStringIO import StringIO
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import dump_jsonl  # noqa
+from normalize import load_jsonl  # noqa
+
+from json_decode import post  # noqa
+from json_decode import Post  # noqa
+
+
+def timed(name, lines, func):
+    elapsed = min(timeit.repeat(func, number=1, repeat=3))
+    print "%-28s %8.0f lines/s" % (name, lines / elapsed)
+
+
+def main(lines=20000):
+    text = "".join(json.dumps(post(i)) + "\n" for i in xrange(lines))
+    posts = list(load_jsonl(Post, StringIO(text)))
+
+    timed("json.loads + Post()", lines, lambda: list(
+        Post(json.loads(line)) for line in StringIO(text)
+    ))
+    timed("load_jsonl", lines, lambda: list(
+        load_jsonl(Post, StringIO(text))
+    ))
+    timed("load_jsonl(batch_size=1000)", lines, lambda: list(
+        load_jsonl(Post, StringIO(text), batch_size=1000)
+    ))
+    timed("load_jsonl(trusted=True)", lines, lambda: list(
+        load_jsonl(Post, StringIO(text), trusted=True)
+    ))
+
+    def dumps_loop():
+        out = StringIO()
+        for record in posts:
+            out.write(json.dumps(record.json_data(extraneous=True)) + "\n")
+
+    timed("json.dumps(json_data()) loop", lines, dumps_loop)
+    timed("dump_jsonl", lines, lambda: dump_jsonl(posts, StringIO()))
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
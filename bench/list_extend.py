@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+"""Compares adding a few checked items to a large ``RecordList`` with
+``extend()`` against rebuilding the collection from its tuples.  Run it
+from the top of the source tree:
+
+    $ python bench/list_extend.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+from normalize import RecordList  # noqa
+
+
+class Reading(Record):
+    sensor = Property(isa=str)
+    value = Property(isa=float)
+
+
+class ReadingList(RecordList):
+    itemtype = Reading
+
+
+READINGS = ReadingList(
+    Reading(sensor="s%d" % (i % 10), value=i * 0.5) for i in range(20000)
+)
+NEW = [{"sensor": "s1", "value": "1.5"}] * 10
+
+
+def rebuild():
+    readings = ReadingList.trusted(READINGS.values)
+    readings.values = ReadingList.tuples_to_coll(
+        ReadingList.coerce_tuples(
+            ReadingList.coll_to_tuples(list(readings) + NEW)
+        )
+    )
+
+
+def extend():
+    readings = ReadingList.trusted(READINGS.values)
+    readings.extend(NEW)
+
+
+def main(number=20):
+    results = []
+    for name, func in ("rebuild", rebuild), ("extend", extend):
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        results.append(elapsed)
+        print "%-10s %8.0f batches/s" % (name, number / elapsed)
+    print "speedup    %8.2fx" % (results[0] / results[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Measures how ``parallel_from_json`` scales with the number of worker
+processes, converting JSON strings of the nested ``Post`` records from
+``json_decode.py``.  Run it from the top of the source tree:
+
+    $ python bench/parallel.py [DOCS]
+"""
+
+from __future__ import absolute_import
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize.record.json import parallel_from_json  # noqa
+
+from json_decode import post  # noqa
+from json_decode import Post  # noqa
+
+
+def main(docs=20000):
+    json_docs = list(json.dumps(post(i)) for i in xrange(docs))
+
+    start = time.time()
+    for doc in json_docs:
+        Post(json.loads(doc))
+    serial = time.time() - start
+    print "%-12s %8.0f docs/s" % ("serial", docs / serial)
+
+    processes = 1
+    while processes <= multiprocessing.cpu_count():
+        pool = multiprocessing.Pool(processes)
+        start = time.time()
+        for _ in parallel_from_json(Post, json_docs, pool=pool):
+            pass
+        elapsed = time.time() - start
+        pool.terminate()
+        print "%2d processes %8.0f docs/s  (%.1fx)" % (
+            processes, docs / elapsed, serial / elapsed,
+        )
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+"""Compares looking up nested records in a ``dict`` using their cached
+primary keys against working the keys out each time with ``record_id``,
+while other records are being modified between lookups.  Run it from the
+top of the source tree:
+
+    $ python bench/pk_cache.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import ListProperty  # noqa
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+from normalize.identity import record_id  # noqa
+
+
+class Line(Record):
+    sku = Property(isa=str)
+    quantity = Property(isa=int)
+
+
+class Order(Record):
+    id = Property(isa=int)
+    lines = ListProperty(of=Line)
+
+
+ORDERS = list(
+    Order(id=i, lines=list(Line(sku="sku%d" % j, quantity=j)
+                           for j in range(20)))
+    for i in range(200)
+)
+BY_ID = dict((record_id(x), x) for x in ORDERS)
+BY_HASH = dict((x, x) for x in ORDERS)
+SCRATCH = Line(sku="scratch", quantity=0)
+
+
+def uncached():
+    for order in ORDERS:
+        SCRATCH.quantity += 1
+        BY_ID[record_id(order)]
+
+
+def cached():
+    for order in ORDERS:
+        SCRATCH.quantity += 1
+        BY_HASH[order]
+
+
+def main(number=20):
+    results = []
+    for name, func in ("record_id", uncached), ("cached", cached):
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        results.append(elapsed)
+        print "%-10s %8.0f lookups/s" % (name, number * len(ORDERS) / elapsed)
+    print "speedup    %8.2fx" % (results[0] / results[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+"""Compares finding records in a ``RecordList`` by primary key with
+``get_by_pk()`` against scanning the list.  Run it from the top of the
+source tree:
+
+    $ python bench/pk_index.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+from normalize import RecordList  # noqa
+
+
+class Account(Record):
+    primary_key = ["id"]
+    id = Property(isa=int)
+    name = Property(isa=str)
+
+
+class AccountList(RecordList):
+    itemtype = Account
+
+
+ACCOUNTS = AccountList(
+    Account(id=i, name="account %d" % i) for i in range(5000)
+)
+
+
+def scan():
+    for i in range(0, 5000, 500):
+        next(x for x in ACCOUNTS if x.__pk__ == (i,))
+
+
+def indexed():
+    for i in range(0, 5000, 500):
+        ACCOUNTS.get_by_pk(i)
+
+
+def main(number=20):
+    results = []
+    for name, func in ("scan", scan), ("indexed", indexed):
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        results.append(elapsed)
+        print "%-10s %8.0f lookups/s" % (name, number * 10 / elapsed)
+    print "speedup    %8.2fx" % (results[0] / results[1])
+
+
+if __name__ == "__main__":
+    main()
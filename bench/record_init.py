@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Compares the constructor generated by ``RecordMeta`` with the generic
+``Record.__init__``.  Run it from the top of the source tree:
+
+    $ python bench/record_init.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+
+
+class Point(Record):
+    x = Property(isa=int, required=True)
+    y = Property(isa=int, required=True)
+    label = Property(isa=str, default="")
+    weight = Property(isa=float)
+
+
+def generic():
+    point = Point.__new__(Point)
+    Record.__init__(point, x=1, y=2, weight=0.5)
+    return point
+
+
+def generated():
+    point = Point.__new__(Point)
+    Point.__init__(point, x=1, y=2, weight=0.5)
+    return point
+
+
+def main(number=200000):
+    results = []
+    for name, func in ("generic", generic), ("generated", generated):
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        results.append(elapsed)
+        print "%-10s %8.0f records/s" % (name, number / elapsed)
+    print "speedup    %8.2fx" % (results[0] / results[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Compares the memory used by regular and ``__compact__`` Records, and the
+cost of reading attributes from each.  Run it from the top of the source
+tree:
+
+    $ python bench/record_memory.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+
+
+class Point(Record):
+    x = Property(isa=int, required=True)
+    y = Property(isa=int, required=True)
+    label = Property(isa=str, default="")
+
+
+class CompactPoint(Record):
+    __compact__ = True
+    x = Property(isa=int, required=True)
+    y = Property(isa=int, required=True)
+    label = Property(isa=str, default="")
+
+
+def instance_size(record):
+    size = sys.getsizeof(record)
+    if not getattr(record, "__compact__", False):
+        size += sys.getsizeof(record.__dict__)
+    return size
+
+
+def main(count=100000):
+    for record_type in Point, CompactPoint:
+        records = list(record_type(x=i, y=i) for i in xrange(count))
+        total = sum(instance_size(x) for x in records)
+        reads = min(timeit.repeat(
+            lambda: records[0].x, number=count, repeat=3,
+        ))
+        print "%-13s %4d bytes/record  %6.1f MB per %d  %8.0f reads/s" % (
+            record_type.__name__, total / count, total / 1048576.0, count,
+            count / reads,
+        )
+
+
+if __name__ == "__main__":
+    main()
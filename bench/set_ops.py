@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+"""Compares intersecting two large collections of records in a
+``SetCollection`` against doing it with ``in`` on a ``ListCollection``.
+Run it from the top of the source tree:
+
+    $ python bench/set_ops.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import ListCollection  # noqa
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+from normalize import SetCollection  # noqa
+
+
+class Tag(Record):
+    primary_key = ["name"]
+    name = Property(isa=str)
+
+
+class TagList(ListCollection):
+    itemtype = Tag
+
+
+class TagSet(SetCollection):
+    itemtype = Tag
+
+
+A = list(Tag(name="tag%d" % i) for i in range(2000))
+B = list(Tag(name="tag%d" % i) for i in range(1000, 3000))
+
+
+def list_intersection():
+    a, b = TagList(A), TagList(B)
+    return list(x for x in a if x in b)
+
+
+def set_intersection():
+    return TagSet(A) & TagSet(B)
+
+
+def main(number=3):
+    results = []
+    for name, func in ("list", list_intersection), ("set", set_intersection):
+        elapsed = min(timeit.repeat(func, number=number, repeat=3))
+        results.append(elapsed)
+        print "%-10s %8.2f ops/s" % (name, number / elapsed)
+    print "speedup    %8.2fx" % (results[0] / results[1])
+
+
+if __name__ == "__main__":
+    main()
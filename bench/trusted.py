@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Compares the validating constructors with the ``trusted`` ones, both
+directly and when loading JSON.  Run it from the top of the source tree:
+
+    $ python bench/trusted.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import from_json  # noqa
+from normalize import ListProperty  # noqa
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+
+
+class Point(Record):
+    x = Property(isa=int, required=True, check=lambda x: x >= 0)
+    y = Property(isa=int, required=True, check=lambda y: y >= 0)
+    label = Property(isa=str, default="")
+    weight = Property(isa=float)
+
+
+class Path(Record):
+    name = Property(isa=str)
+    points = ListProperty(of=Point)
+
+
+PATH_JSON = {
+    "name": "zigzag",
+    "points": [
+        {"x": i, "y": i % 2, "label": "p%d" % i, "weight": 1.0}
+        for i in range(20)
+    ],
+}
+
+
+def main(number=100000):
+    cases = (
+        ("__init__", lambda: Point(x=1, y=2, weight=0.5), 1),
+        ("trusted", lambda: Point.trusted(x=1, y=2, weight=0.5), 1),
+        ("from_json", lambda: from_json(Path, PATH_JSON), 50),
+        ("trusted json", lambda: from_json(Path, PATH_JSON, trusted=True), 50),
+    )
+    results = []
+    for name, func, scale in cases:
+        elapsed = min(
+            timeit.repeat(func, number=number // scale, repeat=3)
+        )
+        results.append(elapsed)
+        print "%-13s %8.0f calls/s" % (name, number // scale / elapsed)
+    print "init speedup  %8.2fx" % (results[0] / results[1])
+    print "json speedup  %8.2fx" % (results[2] / results[3])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Compares the generic ``Property.type_safe_value`` with the validators
+which are made for each property when it is bound.  Run it from the top of
+the source tree:
+
+    $ python bench/validators.py
+"""
+
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from normalize import Property  # noqa
+from normalize import Record  # noqa
+
+
+class Point(Record):
+    x = Property(isa=int, required=True)
+    y = Property(isa=int, check=lambda y: y >= 0)
+    label = Property()
+    weight = Property(isa=float)
+
+
+def main(number=500000):
+    point = Point(x=1, y=2, weight=0.5)
+    for propname, value in ("x", 3), ("y", 4), ("label", "a"), \
+            ("weight", "0.5"):
+        prop = Point.properties[propname]
+        generic = min(timeit.repeat(
+            lambda: prop.type_safe_value(value), number=number, repeat=3,
+        ))
+        compiled = min(timeit.repeat(
+            lambda: prop.validate(value), number=number, repeat=3,
+        ))
+        print "%-8s generic %6.0f ns  compiled %6.0f ns  %5.2fx" % (
+            propname, generic * 1e9 / number, compiled * 1e9 / number,
+            generic / compiled,
+        )
+    setattr_time = min(timeit.repeat(
+        lambda: setattr(point, "y", 5), number=number, repeat=3,
+    ))
+    print "point.y = 5: %6.0f ns" % (setattr_time * 1e9 / number)
+
+
+if __name__ == "__main__":
+    main()
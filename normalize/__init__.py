@@ -18,7 +18,10 @@ from __future__ import absolute_import
 
 from normalize.coll import DictCollection
 from normalize.coll import ListCollection
+from normalize.coll import SetCollection
 import normalize.exc as exc
+from normalize.index import HashIndex
+from normalize.index import SortedIndex
 from normalize.property import LazyProperty
 from normalize.property import LazySafeProperty
 from normalize.property import make_property_type
@@ -26,15 +29,19 @@ from normalize.property import Property
 from normalize.property import ROProperty
 from normalize.property import SafeProperty
 from normalize.property.coll import ListProperty
+from normalize.property.coll import SetProperty
 from normalize.property.json import JsonProperty
 from normalize.property.json import JsonListProperty
 from normalize.property.json import JsonCollectionProperty
 from normalize.property.json import SafeJsonProperty
+from normalize.record import FrozenRecord
 from normalize.record import Record
 from normalize.record.meta import RecordMeta
+from normalize.record.json import dump_jsonl
 from normalize.record.json import from_json
 from normalize.record.json import JsonRecord
 from normalize.record.json import JsonRecordList
+from normalize.record.json import load_jsonl
 from normalize.record.json import to_json
 from normalize.selector import FieldSelector
 from normalize.selector import FieldSelectorException
@@ -47,10 +54,13 @@ JsonCollection = ListCollection
 
 __all__ = [
     "DictCollection",
+    "dump_jsonl",
     "exc",
     "FieldSelector",
     "FieldSelectorException",
+    "FrozenRecord",
     "from_json",
+    "HashIndex",
     "JsonCollection",  # deprecated - use JsonRecordList
     "JsonCollectionProperty",  # deprecated
     "JsonListProperty",
@@ -61,6 +71,7 @@ __all__ = [
     "LazySafeProperty",
     "ListCollection",
     "ListProperty",
+    "load_jsonl",
     "make_property_type",
     "MultiFieldSelector",
     "Property",
@@ -70,5 +81,8 @@ __all__ = [
     "RecordMeta",
     "SafeJsonProperty",
     "SafeProperty",
+    "SetCollection",
+    "SetProperty",
+    "SortedIndex",
     "to_json",
 ]
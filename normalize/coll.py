@@ -17,11 +17,15 @@
 
 from __future__ import absolute_import
 
+import bisect
 import collections
 import sys
 import types
+import weakref
 
 import normalize.exc as exc
+from normalize.property import changed
+import normalize.record
 from normalize.record import Record
 
 """This class contains container classes which can act like collections but
@@ -101,6 +105,18 @@ class Collection(Record):
         )
         super(Collection, self).__init__(**kwargs)
 
+    @classmethod
+    def trusted(cls, values=None, **kwargs):
+        """Alternate constructor for collections whose values are already of
+        the right type; see :py:meth:`normalize.record.Record.trusted`.  The
+        values are copied into a new underlying collection, but not
+        coerced."""
+        if normalize.record.validate_trusted:
+            return cls(values, **kwargs)
+        self = super(Collection, cls).trusted(**kwargs)
+        self.values = cls.tuples_to_coll(cls.coll_to_tuples(values), False)
+        return self
+
     def __iter__(self):
         """The default iterator always iterates over the *values* of a
         Collection."""
@@ -132,6 +148,18 @@ class Collection(Record):
         for k, v in generator:
             yield k, v if isinstance(v, cls.itemtype) else cls.coerceitem(v)
 
+    @classmethod
+    def coerce_values(cls, values):
+        """Returns a list of ``values``, with those which are not of the
+        correct type converted using the ``coerceitem`` class property.
+        Used by the mutation methods, which only check the items they
+        add."""
+        itemtype = cls.itemtype
+        coerceitem = cls.coerceitem
+        return [
+            v if isinstance(v, itemtype) else coerceitem(v) for v in values
+        ]
+
     @classmethod
     def tuples_to_coll(cls, generator, coerce=False):
         """*required virtual method* This class method, part of the sub-class
@@ -163,18 +191,357 @@ class Collection(Record):
         )
 
 
+def _item_pk(itemtype, value):
+    """Returns the primary key of a collection item, as used by
+    :py:meth:`KeyedCollection.pk_index`; items which are not records are
+    their own key."""
+    if type(value) is itemtype:
+        return value.__pk__ if issubclass(itemtype, Record) else value
+    elif issubclass(itemtype, Record):
+        return normalize.record.record_id(value, itemtype)
+    else:
+        return value
+
+
+def _lookup_pk(itemtype, pk):
+    """Returns the key to look up for ``pk`` as passed to ``get_by_pk``.
+    The value of a single-column primary key may be passed bare; items which
+    are not records are their own key."""
+    if not isinstance(pk, tuple) and issubclass(itemtype, Record) and \
+            len(itemtype.primary_key or ()) <= 1:
+        return (pk,)
+    return pk
+
+
+def _pk_records(itemtype, item):
+    """Returns the records which the primary key of ``item`` (as an
+    ``itemtype``) is worked out from, or ``None`` if changes to them can't
+    be tracked"""
+    if not isinstance(item, Record):
+        return ()
+    if type(item) is itemtype:
+        item.__pk__
+        if item._pk_cached():
+            # the item notes what its cached key depends on itself
+            return (item,)
+    depends = list()
+    normalize.record.record_id(item, itemtype, depends=depends)
+    if any(type(x)._volatile_pk for x in depends):
+        return None
+    return depends
+
+
+class _KeyIndex(object):
+    """Base class for the indexes kept by :py:class:`KeyedCollection`, which
+    map values worked out from each item to the keys of the items, in a
+    dictionary of sorted lists.  Sub-classes define ``item_values``.
+
+    Index objects only describe an index; the data is passed to each
+    method, and kept by the collection.
+    """
+    def item_values(self, itemtype, item):
+        """Returns the values which ``item`` is indexed under"""
+        raise exc.CollectionDefinitionError(
+            property='item_values',
+            coll=type(self).__name__,
+        )
+
+    def item_records(self, itemtype, item):
+        """Returns the records which the values ``item`` is indexed under
+        were read from; the collection throws the index away when one of
+        them changes.  By default, these are those which its primary key
+        depends on.  Returns ``None`` if changes to them can't be tracked
+        (see :py:attr:`normalize.record.Record.__pk__`), so the index can't
+        be kept."""
+        return _pk_records(itemtype, item)
+
+    def build(self, tuples, itemtype):
+        """Returns the data of the index, given ``(key, item)`` tuples in
+        key order"""
+        data = dict()
+        for key, item in tuples:
+            for value in self.item_values(itemtype, item):
+                if value in data:
+                    data[value].append(key)
+                else:
+                    data[value] = [key]
+        return data
+
+    def add(self, data, key, item, itemtype):
+        for value in self.item_values(itemtype, item):
+            if value in data:
+                bisect.insort(data[value], key)
+            else:
+                data[value] = [key]
+
+    def remove(self, data, key, item, itemtype):
+        for value in self.item_values(itemtype, item):
+            keys = data[value]
+            keys.remove(key)
+            if not keys:
+                del data[value]
+
+    def get(self, data, value, default=()):
+        """Returns the keys of the items with ``value``"""
+        return data.get(value, default)
+
+    def shift(self, data, start, delta):
+        """Adds ``delta`` to all (list) keys from ``start`` on"""
+        for keys in data.itervalues():
+            if keys[-1] >= start:
+                keys[:] = [k + delta if k >= start else k for k in keys]
+
+
+class _PkIndex(_KeyIndex):
+    """The primary key index of a collection"""
+    def __init__(self, id_func=None, id_key=None):
+        self.id_func = id_func
+        self.id_key = id_func if id_key is None else id_key
+
+    def item_values(self, itemtype, item):
+        return (
+            self.id_func(item) if self.id_func else _item_pk(itemtype, item),
+        )
+
+
+# the name of the primary key index which is made with an id_func
+_ID_FUNC_INDEX = ("pk_index", "id_func")
+
+
 class KeyedCollection(Collection):
+    """Base class for collections whose items are looked up by key (list
+    index or dictionary key).
+
+    These collections keep an index from the primary key of each item (see
+    :py:func:`normalize.identity.record_id`) to its key, which is built
+    when first needed.  Other indexes can be declared with the ``indexes``
+    class property; see :py:mod:`normalize.index`.  Like
+    :py:attr:`normalize.record.Record.__pk__`, indexes are thrown away when
+    an item (or a record within one) changes, but the collection's own
+    mutation methods update them in place.  Changes made to ``values``
+    directly are not noticed, unless ``values`` is replaced.
+
+        *classproperty* **indexes**\ =\ *{NAME: INDEX}*
+            Indexes which may be used with :py:meth:`lookup` and
+            :py:meth:`range`; eg ``dict(region=HashIndex("region"))``.
+    """
+    __slots__ = ("__indexes",)
+    indexes = {}
+
     def __getitem__(self, item):
         return self.values[item]
 
+    def __setitem__(self, key, item):
+        """Replaces (or adds) an item, which is type-checked and coerced
+        like those passed to the constructor."""
+        item = type(self).coerce_values([item])[0]
+        cache = self._fresh_indexes()
+        old = self._old_items([key])
+        self.values[key] = item
+        self._changed(cache, old, [(key, item)])
+
+    def __delitem__(self, key):
+        cache = self._fresh_indexes()
+        old = self._old_items([key])
+        del self.values[key]
+        self._changed(cache, old)
+
+    def __contains__(self, item):
+        """Membership is checked by equality, as for the underlying
+        collection, but only the items with the same primary key as
+        ``item`` are compared."""
+        itemtype = type(self).itemtype
+        if isinstance(item, itemtype) and issubclass(itemtype, Record):
+            keys = self.pk_index().get(_item_pk(itemtype, item), ())
+            return any(self.values[key] == item for key in keys)
+        return any(v == item for k, v in self.itertuples())
+
+    def get_by_pk(self, pk, default=None):
+        """Returns the first item with the primary key ``pk``, or
+        ``default`` if there is none.  ``pk`` is a tuple, as returned by
+        :py:func:`normalize.identity.record_id`; any other value is taken
+        to be the value of a single-column primary key.  Items which are
+        not records are their own primary key."""
+        keys = self.pk_index().get(_lookup_pk(type(self).itemtype, pk), None)
+        return self.values[keys[0]] if keys else default
+
+    def pk_index(self, id_func=None, id_key=None):
+        """Returns a dictionary which maps the primary key of each item to
+        a list of the keys of the items which have it, in order.  The
+        dictionary is kept by the collection, and must not be modified.
+
+        args:
+
+            ``id_func=``\ *FUNCTION*
+                Used to work out primary keys instead of
+                :py:func:`normalize.identity.record_id`; eg,
+                :py:meth:`normalize.diff.DiffOptions.record_id`.  One
+                index made this way is kept, as well as the one made with
+                ``record_id``; using a different function rebuilds it.
+
+            ``id_key=``\ *HASHABLE*
+                Identifies what ``id_func`` computes, so that equivalent
+                functions can share the index; eg,
+                :py:meth:`normalize.diff.DiffOptions.record_id_key`.  By
+                default, the function itself is compared.
+        """
+        if id_func is None:
+            entry = self._index_entry(None)
+            if entry is not None:
+                return entry[1]
+            return self._build_index(None, _PkIndex())
+        if id_key is None:
+            id_key = id_func
+        entry = self._index_entry(_ID_FUNC_INDEX)
+        if entry is not None and entry[0].id_key == id_key:
+            return entry[1]
+        return self._build_index(_ID_FUNC_INDEX, _PkIndex(id_func, id_key))
+
+    def lookup(self, index, value):
+        """Returns a list of the items which have ``value`` in the index
+        called ``index``, in key order."""
+        index_type = self._index_type(index)
+        data = self._index(index)
+        return [self.values[key] for key in index_type.get(data, value)]
+
+    def range(self, index, low=None, high=None):
+        """Returns a list of the items whose values in the index called
+        ``index`` are at least ``low`` and less than ``high``, in order of
+        value; either bound may be ``None``.  The index must be a
+        :py:class:`normalize.index.SortedIndex`."""
+        index_type = self._index_type(index)
+        if not hasattr(index_type, "range"):
+            raise exc.CollectionIndexNotSorted(
+                index=index, typename=type(self).__name__,
+            )
+        data = self._index(index)
+        return [
+            self.values[key] for key in index_type.range(data, low, high)
+        ]
+
+    def _index_type(self, name):
+        try:
+            return type(self).indexes[name]
+        except KeyError:
+            raise exc.CollectionIndexNotFound(
+                index=name, typename=type(self).__name__,
+            )
+
+    def _index(self, name):
+        """Returns the data of the declared index called ``name``"""
+        index_type = self._index_type(name)
+        entry = self._index_entry(name)
+        if entry is not None:
+            return entry[1]
+        return self._build_index(name, index_type)
+
+    def _index_entry(self, name):
+        cache = self._fresh_indexes()
+        return None if cache is None else cache[1].get(name, None)
+
+    def _build_index(self, name, index_type):
+        data = index_type.build(self.itertuples(), type(self).itemtype)
+        try:
+            ref = weakref.ref(self)
+        except TypeError:
+            # can't be told when the items change
+            return data
+        if not self._depend_on(
+            index_type, (v for k, v in self.itertuples()), ref,
+        ):
+            return data
+        cache = self._fresh_indexes()
+        if cache is None:
+            cache = self.__indexes = (self.values, dict())
+        cache[1][name] = (index_type, data)
+        return data
+
+    def _depend_on(self, index_type, items, ref):
+        """Notes the collection (``ref`` is a weak reference to it) as a
+        dependent of the records which the index values of ``items`` were
+        read from, so that its indexes are thrown away when they change.
+        Returns false if changes to some of them can't be tracked."""
+        itemtype = type(self).itemtype
+        for item in items:
+            records = index_type.item_records(itemtype, item)
+            if records is None:
+                return False
+            for record in records:
+                record._add_dependent(ref)
+        return True
+
+    def _fresh_indexes(self):
+        """Returns the indexes of the collection, if they are up to date,
+        otherwise ``None``.  Mutation methods call this before they change
+        anything, and pass the result to :py:meth:`_changed`."""
+        try:
+            cache = self.__indexes
+        except AttributeError:
+            return None
+        if cache[0] is self.values:
+            return cache
+        return None
+
+    def _drop_caches(self):
+        """Throws away the cached primary key and the indexes"""
+        self._drop_indexes()
+        return super(KeyedCollection, self)._drop_caches()
+
+    def _drop_indexes(self):
+        if getattr(self, "_KeyedCollection__indexes", None) is not None:
+            object.__delattr__(self, "_KeyedCollection__indexes")
+
+    def _old_items(self, keys):
+        """Returns ``(key, item)`` for those of ``keys`` which are in the
+        collection."""
+        values = self.values
+        old = list()
+        for key in keys:
+            try:
+                old.append((key, values[key]))
+            except (KeyError, IndexError, TypeError):
+                pass
+        return old
+
+    def _changed(self, cache, removed=(), added=(), shift=None):
+        """Called by mutation methods after changing ``values``, with the
+        ``(key, item)`` pairs which were removed and added, and for lists,
+        ``(start, delta)`` if the items from ``start`` on have moved.
+        Calls :py:func:`normalize.property.changed`, and brings the indexes
+        up to date if ``cache`` is not ``None``."""
+        changed(self)
+        if cache is None:
+            return
+        values, entries = cache
+        itemtype = type(self).itemtype
+        for index_type, data in entries.itervalues():
+            for key, item in removed:
+                index_type.remove(data, key, item, itemtype)
+            if shift:
+                index_type.shift(data, *shift)
+            for key, item in added:
+                index_type.add(data, key, item, itemtype)
+            if added and not self._depend_on(
+                index_type, (item for key, item in added),
+                weakref.ref(self),
+            ):
+                self._drop_indexes()
+                return
+
 
 class DictCollection(KeyedCollection):
     """An implementation of keyed collections which obey the `Record` property
-    protocol and the tuple collection protocol.  *Warning*: largely untested,
-    patches welcome.
+    protocol and the tuple collection protocol.  Iterating over the
+    collection, and ``in``, use the keys, as for ``dict``.
+
+        *classproperty* **diff_by_key**\ =\ *BOOL*
+            If true (the default), :py:mod:`normalize.diff` compares the
+            items with the same key in each collection, rather than
+            matching items by their primary keys as it does for lists.
     """
     suffix = "Map"
     colltype = dict
+    diff_by_key = True
 
     @classmethod
     def tuples_to_coll(cls, generator, coerce=True):
@@ -184,7 +551,10 @@ class DictCollection(KeyedCollection):
 
     @classmethod
     def coll_to_tuples(cls, coll):
-        if isinstance(coll, collections.Mapping):
+        if isinstance(coll, Collection):
+            for k, v in coll.itertuples():
+                yield k, v
+        elif isinstance(coll, collections.Mapping):
             for k, v in coll.iteritems():
                 yield k, v
         elif isinstance(coll, collections.Sequence):
@@ -204,6 +574,42 @@ class DictCollection(KeyedCollection):
     def itertuples(self):
         return self.values.iteritems()
 
+    def __contains__(self, key):
+        return key in self.values
+
+    def get(self, key, default=None):
+        """``Mapping`` API, passed through to the underlying ``dict``"""
+        return self.values.get(key, default)
+
+    def keys(self):
+        """``Mapping`` API; returns a list of the keys"""
+        return self.values.keys()
+
+    def items(self):
+        """``Mapping`` API; returns a list of ``(key, item)``"""
+        return self.values.items()
+
+    def iteritems(self):
+        return self.values.iteritems()
+
+    def __str__(self):
+        """Informal stringification returns the type of collection, and the
+        number of items.  For example, ``<MyRecordMap: 8 item(s)>``
+        """
+        return "<%s: %d item(s)>" % (
+            type(self).__name__, len(self.values)
+        )
+
+    def __repr__(self):
+        """Implemented: prints a valid constructor.
+        """
+        property_info = super(DictCollection, self).__repr__()
+        dict_info = "{%s}" % ", ".join(
+            "%r: %r" % kv for kv in sorted(self.values.iteritems())
+        )
+        optional_comma = "" if property_info.endswith("()") else ", "
+        return property_info.replace("(", "(" + dict_info + optional_comma, 1)
+
 
 class ListCollection(KeyedCollection):
     """An implementation of sequences which obey the `Record` property protocol
@@ -246,10 +652,55 @@ class ListCollection(KeyedCollection):
             )
 
     def append(self, item):
-        """``Sequence`` API, currently passed through to underlying collection.
-        Type-checking is currently TODO.
-        """
+        """``Sequence`` API; the item is type-checked and coerced like
+        those passed to the constructor."""
+        item = type(self).coerce_values([item])[0]
+        cache = self._fresh_indexes()
         self.values.append(item)
+        self._changed(cache, added=[(len(self.values) - 1, item)])
+
+    def extend(self, items):
+        """``Sequence`` API; like :py:meth:`append`, but the new items are
+        checked in one pass, and the existing items are not looked at."""
+        items = type(self).coerce_values(items)
+        cache = self._fresh_indexes()
+        start = len(self.values)
+        self.values.extend(items)
+        self._changed(cache, added=list(enumerate(items, start)))
+
+    def insert(self, index, item):
+        """``Sequence`` API; see :py:meth:`append`"""
+        item = type(self).coerce_values([item])[0]
+        length = len(self.values)
+        if index < 0:
+            index = max(index + length, 0)
+        index = min(index, length)
+        cache = self._fresh_indexes()
+        self.values.insert(index, item)
+        self._changed(cache, added=[(index, item)], shift=(index, 1))
+
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            self.values[index] = type(self).coerce_values(item)
+            self._drop_indexes()
+            changed(self)
+            return
+        if index < 0:
+            index += len(self.values)
+        super(ListCollection, self).__setitem__(index, item)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            del self.values[index]
+            self._drop_indexes()
+            changed(self)
+            return
+        if index < 0:
+            index += len(self.values)
+        cache = self._fresh_indexes()
+        old = self._old_items([index])
+        del self.values[index]
+        self._changed(cache, old, shift=(index + 1, -1))
 
     def itertuples(self):
         return type(self).coll_to_tuples(self.values)
@@ -271,18 +722,197 @@ class ListCollection(KeyedCollection):
         return property_info.replace("(", "(" + list_info + optional_comma, 1)
 
 
+class SetCollection(Collection):
+    """An implementation of sets which obey the `Record` property protocol
+    and the tuple collection protocol (as ``(V, V)`` tuples).
+
+    Items are the same if they have the same primary key (see
+    :py:func:`normalize.identity.record_id`), so adding an item with the
+    same primary key as one already in the set does nothing.  The set is
+    kept in a ``dict`` of items by primary key, so membership tests and
+    the set operations (``|``, ``&`` and ``-``) take time in proportion to
+    the number of items, and never compare items with ``==``.  As with
+    Python sets, items should not be changed in ways which change their
+    primary key while they are in a set.
+    """
+    suffix = "Set"
+    colltype = dict
+
+    @classmethod
+    def tuples_to_coll(cls, generator, coerce=True):
+        tuples = cls.coerce_tuples(generator) if coerce else generator
+        itemtype = cls.itemtype
+        values = cls.colltype()
+        for k, v in tuples:
+            pk = _item_pk(itemtype, v)
+            if pk not in values:
+                values[pk] = v
+        return values
+
+    @classmethod
+    def coll_to_tuples(cls, coll):
+        """Unpacks other collections, ``collections.Mapping`` objects (using
+        their values), and iterables.  Returns ``(Value, Value)``.  Does not
+        coerce items."""
+        if isinstance(coll, Collection):
+            items = (v for k, v in coll.itertuples())
+        elif isinstance(coll, collections.Mapping):
+            items = coll.itervalues()
+        elif hasattr(coll, "__iter__") and callable(coll.__iter__):
+            items = coll
+        elif not coll:
+            return
+        else:
+            raise exc.CollectionCoerceError(
+                giventype=type(coll).__name__,
+                fortype=cls.__name__,
+            )
+        for v in items:
+            yield v, v
+
+    def itertuples(self):
+        for v in self.values.itervalues():
+            yield v, v
+
+    def __iter__(self):
+        return self.values.itervalues()
+
+    def __contains__(self, item):
+        """Checks for an item with the same primary key as ``item``, which is
+        coerced first, as for :py:meth:`add`; values which can't be coerced
+        are not in the set."""
+        itemtype = type(self).itemtype
+        if not isinstance(item, itemtype):
+            try:
+                item = type(self).coerceitem(item)
+            except (TypeError, ValueError, exc.StringFormatException):
+                return False
+        return _item_pk(itemtype, item) in self.values
+
+    def get_by_pk(self, pk, default=None):
+        """Returns the item with the primary key ``pk``, or ``default``;
+        see :py:meth:`KeyedCollection.get_by_pk`.  Items which are not
+        records are their own primary key."""
+        return self.values.get(_lookup_pk(type(self).itemtype, pk), default)
+
+    def add(self, item):
+        """``Set`` API; the item is type-checked and coerced like those
+        passed to the constructor."""
+        self.update([item])
+
+    def update(self, items):
+        """Adds several items, which are checked in one pass"""
+        values = self.values
+        itemtype = type(self).itemtype
+        for item in type(self).coerce_values(items):
+            pk = _item_pk(itemtype, item)
+            if pk not in values:
+                values[pk] = item
+        changed(self)
+
+    def discard(self, item):
+        """``Set`` API; removes the item with the same primary key as
+        ``item``, if there is one."""
+        self.values.pop(_item_pk(type(self).itemtype, item), None)
+        changed(self)
+
+    def remove(self, item):
+        """``Set`` API; like :py:meth:`discard`, but raises ``KeyError`` if
+        there is no such item."""
+        del self.values[_item_pk(type(self).itemtype, item)]
+        changed(self)
+
+    def _other_values(self, other):
+        """Returns the items of ``other`` by primary key"""
+        if isinstance(other, SetCollection):
+            return other.values
+        cls = type(self)
+        return cls.tuples_to_coll(cls.coll_to_tuples(other))
+
+    def _from_values(self, values):
+        rv = type(self).trusted()
+        rv.values = values
+        return rv
+
+    def union(self, other):
+        """Returns a new set with the items of both sets; where both have
+        an item with the same primary key, this set's is used."""
+        values = dict(self._other_values(other))
+        values.update(self.values)
+        return self._from_values(values)
+
+    def intersection(self, other):
+        """Returns a new set with the items of this set which have the same
+        primary key as an item of ``other``"""
+        other_values = self._other_values(other)
+        return self._from_values(dict(
+            (pk, v) for pk, v in self.values.iteritems()
+            if pk in other_values
+        ))
+
+    def difference(self, other):
+        """Returns a new set with the items of this set which do not have
+        the same primary key as any item of ``other``"""
+        other_values = self._other_values(other)
+        return self._from_values(dict(
+            (pk, v) for pk, v in self.values.iteritems()
+            if pk not in other_values
+        ))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def sorted_items(self):
+        """Returns a list of the items in order of primary key"""
+        return [self.values[pk] for pk in sorted(self.values)]
+
+    def __str__(self):
+        """Informal stringification returns the type of collection, and the
+        number of items.  For example, ``<MyRecordSet: 8 item(s)>``
+        """
+        return "<%s: %d item(s)>" % (
+            type(self).__name__, len(self.values)
+        )
+
+    def __repr__(self):
+        """Implemented: prints a valid constructor, with the items in order
+        of primary key.
+        """
+        property_info = super(SetCollection, self).__repr__()
+        set_info = "[%s]" % ", ".join(repr(x) for x in self.sorted_items())
+        optional_comma = "" if property_info.endswith("()") else ", "
+        return property_info.replace("(", "(" + set_info + optional_comma, 1)
+
+
 GENERIC_TYPES = dict()
 
 
 class _GenericPickler(object):
     """'pickle' doesn't like pickling classes which are dynamically created.
     This object is used instead, to keep pickle happy.
+
+    Each generic type has one of these, so that pickling many collections
+    of the same type stores it once.  As the ``coll`` base class is kept,
+    the generic type is made again if it does not exist in the process
+    doing the unpickling (for instance, if it was first used in a
+    ``multiprocessing`` worker).  Values are not checked again.
     """
-    def __init__(self, typekey):
+    def __init__(self, typekey, coll=None):
         self.typekey = typekey
+        self.coll = coll
 
     def __call__(self, values):
-        return GENERIC_TYPES[self.typekey](values=values)
+        generic_type = GENERIC_TYPES.get(self.typekey, None)
+        if generic_type is None and getattr(self, "coll", None):
+            module, _, name = self.typekey[1].rpartition(".")
+            __import__(module)
+            generic_type = _make_generic(
+                getattr(sys.modules[module], name), self.coll,
+            )
+        elif generic_type is None:
+            raise KeyError(self.typekey)
+        return generic_type.trusted(values)
 
 
 class _Generic(Collection):
@@ -290,7 +920,7 @@ class _Generic(Collection):
     things."""
     def __reduce__(self):
         """helper method for pickling"""
-        return (_GenericPickler(type(self).generic_key), (self.values,))
+        return (type(self).pickler, (self.values,))
 
 
 def _make_generic(of, coll):
@@ -316,7 +946,10 @@ def _make_generic(of, coll):
         # oh, we get to name it?  Goodie!
         generic_name = "%s%s" % (of.__name__, coll.suffix)
         GENERIC_TYPES[key] = type(
-            generic_name, (coll, _Generic), dict(itemtype=of, generic_key=key)
+            generic_name, (coll, _Generic), dict(
+                itemtype=of, generic_key=key,
+                pickler=_GenericPickler(key, coll),
+            )
         )
         mod = sys.modules[of.__module__]
         if not hasattr(mod, generic_name):
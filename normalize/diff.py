@@ -28,7 +28,10 @@ from richenum import OrderedRichEnumValue
 
 from normalize.property import SafeProperty
 from normalize.coll import Collection
+from normalize.coll import DictCollection
+from normalize.coll import KeyedCollection
 from normalize.coll import ListCollection
+from normalize.coll import SetCollection
 import normalize.exc as exc
 from normalize.record import Record
 from normalize.record import record_id
@@ -63,6 +66,10 @@ class DiffInfo(Record):
     """
     Container for storing diff information that can be used to reconstruct the
     values diffed.
+
+    Items of :py:class:`normalize.coll.SetCollection` values are referred to
+    by their position in the sorted primary keys of both sets, which is only
+    meaningful within one comparison; see :py:func:`compare_set_iter`.
     """
     diff_type = SafeProperty(
         coerce=_coerce_diff,
@@ -308,6 +315,21 @@ class DiffOptions(object):
         pk = record_id(record, type_, selector, self.normalize_object_slot)
         return pk
 
+    def record_id_key(self):
+        """Returns a hashable value which is the same for any two options
+        objects whose :py:meth:`record_id` methods return the same values,
+        so that collections can keep the primary key indexes made with them
+        between diffs (see
+        :py:meth:`normalize.coll.KeyedCollection.pk_index`).  The default
+        is the type and the settings which :py:meth:`normalize_val` uses;
+        sub-classes whose normalization depends on other state should
+        extend it, or return ``None`` to always build a new index.
+        """
+        return (
+            type(self), self.ignore_ws, self.ignore_case,
+            self.unicode_normal, self.ignore_empty_slots,
+        )
+
     def id_args(self, type_, fs):
         options = dict()
         if self.duck_type:
@@ -576,7 +598,23 @@ def compare_collection_iter(propval_a, propval_b, fs_a=None, fs_b=None,
     coll_type = (
         type(propval_a) if propval_a is not _nothing else type(propval_b)
     )
+    if issubclass(coll_type, SetCollection):
+        for diff in compare_set_iter(
+            propval_a, propval_b, fs_a, fs_b, options,
+        ):
+            yield diff
+        return
+
     force_descent = (propval_a is _nothing) or (propval_b is _nothing)
+    if not force_descent and issubclass(coll_type, DictCollection) and \
+            coll_type.diff_by_key and \
+            isinstance(propval_b, (DictCollection, dict)):
+        for diff in compare_map_iter(
+            propval_a, propval_b, fs_a, fs_b, options,
+        ):
+            yield diff
+        return
+
     id_args = options.id_args(coll_type.itemtype, fs_a)
     if 'selector' in id_args and not id_args['selector']:
         # early exit shortcut
@@ -587,6 +625,18 @@ def compare_collection_iter(propval_a, propval_b, fs_a=None, fs_b=None,
         vals = values[x] = set()
         rev_key = rev_keys[x] = dict()
 
+        if not id_args and isinstance(propval_x, KeyedCollection):
+            # the collection keeps the primary keys of its items
+            for pk, keys in propval_x.pk_index(
+                options.record_id, options.record_id_key(),
+            ).iteritems():
+                if compare_values is None:
+                    compare_values = isinstance(pk, tuple)
+                for seq, k in enumerate(keys):
+                    vals.add((pk, seq))
+                    rev_key[(pk, seq)] = k
+            continue
+
         seen = collections.Counter()
 
         for k, v in collection_generator(propval_x):
@@ -685,6 +735,166 @@ def compare_collection_iter(propval_a, propval_b, fs_a=None, fs_b=None,
             )
 
 
+def compare_map_iter(propval_a, propval_b, fs_a=None, fs_b=None,
+                     options=None):
+    """Generator for comparing two :py:class:`normalize.coll.DictCollection`
+    objects, by comparing the items with the same key, in linear time.
+    Keys in only one of the collections are reported as removed or added,
+    and items which are not records are compared with
+    :py:meth:`DiffOptions.items_equal`.  :py:func:`compare_collection_iter`
+    calls this for ``DictCollection`` types with ``diff_by_key`` set.
+    Arguments are as per other ``compare_``\ *X* functions.
+    """
+    if fs_a is None:
+        fs_a = FieldSelector(tuple())
+        fs_b = FieldSelector(tuple())
+    if options is None:
+        options = DiffOptions()
+
+    # with duck_type, the other value may be a plain dict
+    values_a = propval_a.values if isinstance(propval_a, Collection) else \
+        propval_a
+    values_b = propval_b.values if isinstance(propval_b, Collection) else \
+        propval_b
+    compare_filter = options.compare_filter
+    descend = issubclass(type(propval_a).itemtype, Record)
+
+    for key, a_val in values_a.iteritems():
+        selector_a = fs_a + [key]
+        if compare_filter and selector_a not in compare_filter:
+            continue
+        selector_b = fs_b + [key]
+        if key not in values_b:
+            yield DiffInfo(
+                diff_type=DiffTypes.REMOVED,
+                base=selector_a,
+                other=fs_b,
+            )
+            continue
+
+        b_val = values_b[key]
+        if descend:
+            any_diffs = False
+            for diff in compare_record_iter(
+                a_val, b_val, selector_a, selector_b, options,
+            ):
+                if diff.diff_type != DiffTypes.NO_CHANGE:
+                    any_diffs = True
+                yield diff
+        else:
+            any_diffs = not options.items_equal(
+                options.normalize_item(a_val, propval_a, key),
+                options.normalize_item(b_val, propval_b, key),
+            )
+            if any_diffs:
+                yield DiffInfo(
+                    diff_type=DiffTypes.MODIFIED,
+                    base=selector_a,
+                    other=selector_b,
+                )
+
+        if options.unchanged and not any_diffs:
+            yield DiffInfo(
+                diff_type=DiffTypes.NO_CHANGE,
+                base=selector_a,
+                other=selector_b,
+            )
+
+    for key in values_b:
+        if key not in values_a:
+            selector_b = fs_b + [key]
+            if compare_filter and fs_a + [key] not in compare_filter:
+                continue
+            yield DiffInfo(
+                diff_type=DiffTypes.ADDED,
+                base=fs_a,
+                other=selector_b,
+            )
+
+
+def _set_values(coll_type, propval):
+    """Returns the items of a set by primary key, for ``compare_set_iter``"""
+    if propval is _nothing:
+        return {}
+    elif isinstance(propval, SetCollection):
+        return propval.values
+    else:
+        # duck typing
+        return coll_type.tuples_to_coll(
+            coll_type.coll_to_tuples(propval), coerce=False,
+        )
+
+
+def compare_set_iter(propval_a, propval_b, fs_a=None, fs_b=None,
+                     options=None):
+    """Generator for comparing two :py:class:`normalize.coll.SetCollection`
+    objects.  Items are matched by the primary keys the sets keep them by,
+    so this takes linear time (plus sorting the keys), and the
+    normalization done by :py:class:`DiffOptions` does not affect which
+    items match.  Matched items which are records are then compared with
+    :py:func:`compare_record_iter`.
+
+    As field selectors cannot contain primary keys, items are referred to
+    by their position in the sorted primary keys of *both* sets; so the same
+    position refers to the same item in the base and the other set.  These
+    positions depend on what is in the other set, so are only meaningful
+    within one comparison; the item at position ``i`` has the primary key
+    ``sorted(set(a.values) | set(b.values))[i]`` (see
+    :py:meth:`normalize.coll.SetCollection.get_by_pk`).
+    :py:func:`compare_collection_iter` calls this for ``SetCollection``
+    types.  Arguments are as per other ``compare_``\ *X* functions.
+    """
+    if fs_a is None:
+        fs_a = FieldSelector(tuple())
+        fs_b = FieldSelector(tuple())
+    if options is None:
+        options = DiffOptions()
+
+    coll_type = (
+        type(propval_a) if propval_a is not _nothing else type(propval_b)
+    )
+    values_a = _set_values(coll_type, propval_a)
+    values_b = _set_values(coll_type, propval_b)
+    positions = dict(
+        (pk, i) for i, pk in
+        enumerate(sorted(values_a.viewkeys() | values_b.viewkeys()))
+    )
+    descend = issubclass(coll_type.itemtype, Record)
+
+    for pk, a_val in values_a.iteritems():
+        selector_a = fs_a + [positions[pk]]
+        if pk not in values_b:
+            yield DiffInfo(
+                diff_type=DiffTypes.REMOVED,
+                base=selector_a,
+                other=fs_b,
+            )
+            continue
+        selector_b = fs_b + [positions[pk]]
+        any_diffs = False
+        if descend:
+            for diff in compare_record_iter(
+                a_val, values_b[pk], selector_a, selector_b, options,
+            ):
+                if diff.diff_type != DiffTypes.NO_CHANGE:
+                    any_diffs = True
+                yield diff
+        if options.unchanged and not any_diffs:
+            yield DiffInfo(
+                diff_type=DiffTypes.NO_CHANGE,
+                base=selector_a,
+                other=selector_b,
+            )
+
+    for pk in values_b:
+        if pk not in values_a:
+            yield DiffInfo(
+                diff_type=DiffTypes.ADDED,
+                base=fs_a,
+                other=fs_b + [positions[pk]],
+            )
+
+
 def compare_list_iter(propval_a, propval_b, fs_a=None, fs_b=None,
                       options=None):
     """Generator for comparing 'simple' lists when they are encountered.  This
@@ -25,27 +25,53 @@ easy to change without affecting downstream users.
 
 
 class StringFormatException(Exception):
+    """Base class for structured exceptions.  The arguments are saved, and
+    only formatted into ``message`` when the exception is displayed (or the
+    ``formatted`` attribute is read), so that exceptions which are caught
+    and discarded are cheap to raise.  Sub-classes can override
+    :py:meth:`format_kwargs` to accept raw values from the caller, and only
+    work out how to describe them when needed.
+    """
     message = "(uncustomized exception!)"
 
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
+
+    def format_kwargs(self):
+        """Returns the keyword arguments to ``message.format()``"""
+        return self.kwargs
+
+    def format(self):
+        """Formats the message.  Raises a ``StringFormatExceptionError`` if
+        the arguments do not match the message; ``tests/test_exc.py`` checks
+        the exceptions raised by this library for this."""
         try:
-            self.formatted = self.message.format(*args, **kwargs)
+            return self.message.format(*self.args, **self.format_kwargs())
         except IndexError:
             raise PositionalExceptionFormatError(
                 typename=type(self).__name__,
-                received=repr(args),
+                received=repr(self.args),
             )
         except KeyError, e:
             raise KeywordExceptionFormatError(
                 typename=type(self).__name__,
                 missing=e[0],
-                passed=repr(kwargs.keys()),
+                passed=repr(self.kwargs.keys()),
             )
 
+    @property
+    def formatted(self):
+        formatted = self.__dict__.get("_formatted", None)
+        if formatted is None:
+            formatted = self.__dict__["_formatted"] = self.format()
+        return formatted
+
     def __str__(self):
-        return self.formatted
+        try:
+            return self.formatted
+        except StringFormatExceptionError as e:
+            return "%s (%s)" % (self.message, e)
 
     def __getattr__(self, attrname):
         try:
@@ -70,9 +96,27 @@ class StringFormatException(Exception):
         )
 
 
+def _describe_type(valuetype):
+    return (
+        "(" + ", ".join(x.__name__ for x in valuetype) + ")" if
+        isinstance(valuetype, tuple) else valuetype.__name__
+    )
+
+
 # exception base classes
 class CoercionError(StringFormatException, ValueError):
-    pass
+    def format_kwargs(self):
+        """``prop`` may be passed as a ``Property``, and is described by its
+        full name; ``value`` (and ``coerced``) are the values involved, and
+        are described by ``repr``"""
+        kwargs = dict(self.kwargs)
+        if "prop" in kwargs:
+            kwargs["prop"] = getattr(kwargs["prop"], "fullname",
+                                     kwargs["prop"])
+        for key in "value", "coerced":
+            if key in kwargs:
+                kwargs[key] = repr(kwargs[key])
+        return kwargs
 
 
 class FieldSelectorException(StringFormatException):
@@ -112,12 +156,26 @@ class AmbiguousConstruction(UsageException):
     message = "only init_dict or kwargs may be specified"
 
 
+class CheckFailed(CoercionError):
+    message = "{prop} value '{value}' failed type check"
+
+
 class CoerceError(CoercionError):
     message = (
         "coerce to {valuetype} for {prop} failed with value {value}: "
         "{func} raised: {exc}"
     )
 
+    def format_kwargs(self):
+        """``func`` is the coerce function, and ``valuetype`` the type (or
+        tuple of types) of the property"""
+        kwargs = super(CoerceError, self).format_kwargs()
+        func = kwargs["func"]
+        if isinstance(func, type):
+            kwargs["func"] = "%s constructor" % func.__name__
+        kwargs["valuetype"] = _describe_type(kwargs["valuetype"])
+        return kwargs
+
 
 class CoerceWithoutType(PropertyDefinitionError):
     message = (
@@ -134,6 +192,17 @@ class CollectionDefinitionError(SubclassError):
     message = "{property} must be defined in a {coll} subclass"
 
 
+class CollectionIndexNotFound(UsageException, KeyError):
+    message = "{typename} has no index called {index!r}"
+
+
+class CollectionIndexNotSorted(UsageException):
+    message = (
+        "index {index!r} of {typename} is not a SortedIndex, so it can't be "
+        "used for range queries"
+    )
+
+
 class CollRequiredError(PropertyDefinitionError):
     message = (
         "coll is required; specify coll type or use a sub-class "
@@ -147,6 +216,13 @@ class CollTypeMismatch(PropertyDefinitionError):
     )
 
 
+class ColumnLengthMismatch(UsageException):
+    message = (
+        "columns passed to {typename}.from_columns differ in length: "
+        "{lengths}"
+    )
+
+
 class CompareAsSignatureError(PropertyDefinitionError):
     message = (
         "compare_as functions may take 0 or 1 arguments; {module}.{func} "
@@ -154,6 +230,20 @@ class CompareAsSignatureError(PropertyDefinitionError):
     )
 
 
+class CompactRecordBaseHasDict(RecordDefinitionError):
+    message = (
+        "{typename} is compact, but its base class {basename} does not "
+        "define __slots__"
+    )
+
+
+class CompactRecordSubclass(RecordDefinitionError):
+    message = (
+        "{typename} may not set __compact__ false, as it derives compact "
+        "class {basename}"
+    )
+
+
 class DefaultSignatureError(PropertyDefinitionError):
     message = (
         "default functions must have no required arguments (except "
@@ -165,6 +255,10 @@ class DiffOptionsException(UsageException):
     message = "pass options= or DiffOptions constructor arguments; not both"
 
 
+class FastReadCompactRecord(RecordDefinitionError):
+    message = "{typename} cannot be both compact and fast-read"
+
+
 class FieldSelectorAttributeError(FieldSelectorException, AttributeError):
     message = "Could not find property specified by name: {name}"
 
@@ -289,13 +383,41 @@ class ReadOnlyAttributeError(StringFormatException, AttributeError):
 
 
 class JsonRecordCoerceError(CoercionError):
-    message = "Cannot interpret {given} as a {typename} constructor"
+    message = "Cannot interpret {given!r} as a {typename} constructor"
 
 
 class ReservedPropertyName(RecordDefinitionError):
     message = "Attribute {attrname} is reserved"
 
 
+class RowLengthMismatch(UsageException):
+    message = (
+        "row {rownum} passed to {typename}.from_rows has {length} value(s); "
+        "expected {expected}"
+    )
+
+
+class SetOfWhat(PropertyDefinitionError):
+    message = (
+        "Set Properties must have a defined item type; pass of= "
+        "or set_of= to the declaration"
+    )
+
+
+class SetPropertyMustDeriveSetCollection(PropertyDefinitionError):
+    message = (
+        "Set Property collections must derive SetCollection, and "
+        "{got} doesn't"
+    )
+
+
+class UnknownJsonKeysModeInvalid(UsageException):
+    message = (
+        "unknown_json_keys mode must be 'copy', 'share' or 'cow'; "
+        "not {mode!r}"
+    )
+
+
 class ValueCoercionError(CoercionError):
     message = (
         "Coerce function on proprety {prop} returned a bad coerced "
@@ -318,14 +440,14 @@ class VisitorPropError(VisitorException):
 
 class VisitorGrokRecordError(VisitorException):
     message = (
-        u"{val} found where I'm expecting to unpack a "
+        u"{val!r} found where I'm expecting to unpack a "
         u"{record_type_name} record at {field_selector}"
     )
 
 
 class VisitorGrokCollectionError(VisitorGrokRecordError):
     message = (
-        u"{val} found where I'm expecting to unpack a "
+        u"{val!r} found where I'm expecting to unpack a "
         u"{record_type_name} collection at {field_selector}"
     )
 
@@ -340,5 +462,6 @@ class VisitorTooSimple(VisitorException):
 
 class VisitorUnpackError(VisitorException, TypeError):
     message = (
-        "Can't unpack collection at {fs}; expected {colltype}, got {value}"
+        "Can't unpack collection at {fs}; expected {colltype}, got "
+        "{value!r}"
     )
@@ -19,16 +19,24 @@ import normalize.exc as exc
 import normalize.record
 
 
-def record_id(object_, type_=None, selector=None, normalize_object_slot=None):
+def record_id(object_, type_=None, selector=None, normalize_object_slot=None,
+              depends=None):
     """Implementation of id() which is overridable and knows about record's
     primary_key property.  Returns if the two objects may be the "same";
     returns None for other types, meaning all bets about identity are off.
 
     Curiously, this function resembles conversion between a "record" and a
     "tuple": stripping the logical names from the atomic values.
+
+    If ``depends`` is passed, it should be a list; the records and
+    collections which the result was worked out from are appended to it.
+    :py:attr:`normalize.record.Record.__pk__` uses this to know which
+    records' changes make its cached value stale.
     """
     if type_ is None:
         type_ = type(object_)
+    if depends is not None and isinstance(object_, normalize.record.Record):
+        depends.append(object_)
 
     key_vals = list()
     pk_cols = type_.primary_key
@@ -43,14 +51,35 @@ def record_id(object_, type_=None, selector=None, normalize_object_slot=None):
             object_.itertuples() if hasattr(object_, "itertuples") else
             type_.coll_to_tuples(object_)
         )
-        return tuple(
-            record_id(
-                v, type_.itemtype, selector[k], normalize_object_slot,
-            ) for k, v in gen if k in selector
-        ) if selector else tuple(
-            record_id(v, type_.itemtype, None, normalize_object_slot) for
-            k, v in gen
-        )
+        itemtype = type_.itemtype
+        if issubclass(type_, normalize.coll.SetCollection):
+            # sets are unordered, so their items' keys are sorted
+            if not selector and not normalize_object_slot and \
+                    isinstance(object_, type_):
+                return tuple(sorted(object_.values))
+            return tuple(sorted(
+                record_id(
+                    v, itemtype, selector[any] if selector else None,
+                    normalize_object_slot, depends,
+                ) for k, v in gen
+            ))
+        if selector:
+            return tuple(
+                record_id(
+                    v, itemtype, selector[k], normalize_object_slot, depends,
+                ) for k, v in gen if k in selector
+            )
+        elif not normalize_object_slot and hasattr(itemtype, "__pk__"):
+            # use (and fill) the cached primary keys of the items
+            return tuple(
+                _cached_pk(v, depends) if type(v) is itemtype else
+                record_id(v, itemtype, depends=depends) for k, v in gen
+            )
+        else:
+            return tuple(
+                record_id(v, itemtype, None, normalize_object_slot, depends)
+                for k, v in gen
+            )
 
     if not pk_cols:
         all_properties = type_._sorted_properties
@@ -75,14 +104,19 @@ def record_id(object_, type_=None, selector=None, normalize_object_slot=None):
             val_pk = ()
             set_elements = 0
             for value_type in value_type_list:
-                if issubclass(value_type, normalize.record.Record):
+                if not issubclass(value_type, normalize.record.Record):
+                    continue
+                if type(val) is value_type and not selector and \
+                        not normalize_object_slot:
+                    pk = _cached_pk(val, depends)
+                else:
                     pk = record_id(val, value_type,
                                    selector[prop.name] if selector else None,
-                                   normalize_object_slot)
-                    pk_elements = len([x for x in pk if x is not None])
-                    if not val_pk or pk_elements > set_elements:
-                        val_pk = pk
-                        set_elements = pk_elements
+                                   normalize_object_slot, depends)
+                pk_elements = len([x for x in pk if x is not None])
+                if not val_pk or pk_elements > set_elements:
+                    val_pk = pk
+                    set_elements = pk_elements
 
             val_pk = val_pk or val
             try:
@@ -94,6 +128,24 @@ def record_id(object_, type_=None, selector=None, normalize_object_slot=None):
                 )
             key_vals.append(val_pk)
         else:
+            if depends is not None and \
+                    isinstance(val, normalize.record.Record):
+                # an untyped property holding a record, which is hashed by
+                # its primary key
+                _cached_pk(val, depends)
             key_vals.append(val)
 
     return tuple(key_vals)
+
+
+def _cached_pk(record, depends):
+    """Returns the (cached) primary key of ``record``, noting it in
+    ``depends`` as for :py:func:`record_id`.  If the key could not be
+    cached, the records it was worked out from are noted too."""
+    pk = record.__pk__
+    if depends is not None:
+        if record._pk_cached():
+            depends.append(record)
+        else:
+            return record_id(record, type(record), depends=depends)
+    return pk
@@ -0,0 +1,193 @@
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+
+"""Secondary indexes for collections.  These are declared on
+:py:class:`normalize.coll.ListCollection` and
+:py:class:`normalize.coll.DictCollection` sub-classes using the ``indexes``
+class property, and are used with the ``lookup()`` and ``range()``
+collection methods::
+
+    class AccountList(RecordList):
+        itemtype = Account
+        indexes = dict(
+            region=HashIndex(["owner", "region"]),
+            opened=SortedIndex("opened"),
+        )
+
+    accounts.lookup("region", "emea")
+    accounts.range("opened", low=datetime(2014, 1, 1))
+
+Indexes are built the first time they are used, and again after a record
+they were read from has changed (see :py:func:`normalize.property.changed`);
+otherwise, they are updated as items are added to and removed from the
+collection.  Changes to other records do not affect them.  As a change to
+one item makes the whole index stale, indexes suit collections which are
+queried more often than their items are modified.  Assignments to unsafe
+and lazy properties are not tracked, so indexes which read them (or
+primary keys which do) are built every time they are used.
+
+Items are indexed under the value the index's
+:py:class:`normalize.selector.FieldSelector` finds in them.  Items where it
+finds nothing (eg, the attribute is not set) are not indexed.  If the
+selector contains ``None`` (meaning all members of a collection), each item
+is indexed under each of the distinct values found.
+"""
+
+from __future__ import absolute_import
+
+import bisect
+
+from normalize.coll import _KeyIndex
+from normalize.coll import _pk_records
+from normalize.record import Record
+from normalize.selector import FieldSelector
+from normalize.selector import FieldSelectorException
+
+
+class HashIndex(_KeyIndex):
+    """An index for looking up items by the exact value of a field.  Values
+    must be hashable."""
+    def __init__(self, selector):
+        """args:
+
+            ``selector=``\ *FieldSelector*\ \|\ *LIST*\ \|\ *STRING*
+                The field to index, as a ``FieldSelector``, a list of its
+                components, or the name of a property.
+        """
+        if isinstance(selector, basestring):
+            selector = [selector]
+        self.selector = FieldSelector(selector)
+        self.multi = None in self.selector.selectors
+
+    def item_values(self, itemtype, item):
+        try:
+            value = self.selector.get(item)
+        except FieldSelectorException:
+            return ()
+        return _unique(_flatten(value)) if self.multi else (value,)
+
+    def item_records(self, itemtype, item):
+        """Returns the records along the selector's path through ``item``,
+        and those which the primary key of a record found at its end
+        depends on; or ``None`` if changes to them can't be tracked"""
+        records = list()
+        if not _path_records(item, self.selector.selectors, records):
+            return None
+        return records
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.selector)
+
+
+class SortedIndex(HashIndex):
+    """An index for finding items with values of a field in a range, as well
+    as by exact value.  It is kept as a sorted list of ``(value, key)``, so
+    values must be ordered, but need not be hashable."""
+    def build(self, tuples, itemtype):
+        return sorted(
+            (value, key) for key, item in tuples
+            for value in self.item_values(itemtype, item)
+        )
+
+    def add(self, data, key, item, itemtype):
+        for value in self.item_values(itemtype, item):
+            bisect.insort(data, (value, key))
+
+    def remove(self, data, key, item, itemtype):
+        for value in self.item_values(itemtype, item):
+            del data[bisect.bisect_left(data, (value, key))]
+
+    def shift(self, data, start, delta):
+        data[:] = [
+            (value, key + delta if key >= start else key)
+            for value, key in data
+        ]
+
+    def get(self, data, value, default=()):
+        i = bisect.bisect_left(data, (value,))
+        keys = list()
+        while i < len(data) and data[i][0] == value:
+            keys.append(data[i][1])
+            i += 1
+        return keys or default
+
+    def range(self, data, low=None, high=None):
+        """Returns the keys of the items with values from ``low`` up to
+        (but not including) ``high``, in order of value"""
+        start = 0 if low is None else bisect.bisect_left(data, (low,))
+        end = len(data) if high is None else \
+            bisect.bisect_left(data, (high,))
+        return [key for _, key in data[start:end]]
+
+
+def _path_records(value, selectors, records):
+    """Appends the records which :py:meth:`FieldSelector.get` would look in
+    to follow ``selectors`` from ``value`` to ``records``, and those which
+    the primary key of a record found at the end depends on.  Returns false
+    if changes to them can't be tracked; eg, a value was read from an
+    unsafe property."""
+    for i, selector in enumerate(selectors):
+        if isinstance(value, Record):
+            records.append(value)
+            prop = type(value).properties.get(selector, None)
+            if prop is not None and not hasattr(prop, "__set__"):
+                return False
+        if selector is None:
+            return all(
+                _path_records(member, selectors[i + 1:], records)
+                for member in value
+            )
+        try:
+            value = (
+                value[selector] if isinstance(selector, (int, long)) else
+                getattr(value, selector)
+            )
+        except (AttributeError, IndexError, KeyError, TypeError):
+            return True
+    depends = _pk_records(type(value), value)
+    if depends is None:
+        return False
+    records.extend(depends)
+    return True
+
+
+def _unique(values):
+    """Returns ``values`` without repeats, in order; so that an item is only
+    filed under each value once.  Values need not be hashable."""
+    seen = set()
+    unique = list()
+    for value in values:
+        try:
+            if value in seen:
+                continue
+            seen.add(value)
+        except TypeError:
+            if value in unique:
+                continue
+        unique.append(value)
+    return unique
+
+
+def _flatten(value):
+    """Returns the values found by a selector with ``None`` in it, which
+    are nested in lists for each ``None``"""
+    if isinstance(value, list):
+        for x in value:
+            for y in _flatten(x):
+                yield y
+    else:
+        yield value
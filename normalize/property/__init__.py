@@ -26,11 +26,13 @@ documentation.
 
 from __future__ import absolute_import
 
+import functools
 import inspect
 import warnings
 import weakref
 
 import normalize.exc as exc
+from normalize.property.cache import CoerceCache
 from normalize.property.meta import MetaProperty
 
 
@@ -42,6 +44,23 @@ class _Default(object):
 _none = _Default()
 
 
+def changed(obj):
+    """Notes that the record (or collection) ``obj`` has been modified.  Its
+    cached primary key is thrown away, as are the cached primary keys and
+    indexes of the records and collections which were worked out from it;
+    see :py:attr:`normalize.record.Record.__pk__`.  Called by the property
+    setters and the collection mutation methods.
+    """
+    try:
+        if obj._Record__caches is None:
+            return
+    except AttributeError:
+        # made without a constructor, and nothing cached since
+        object.__setattr__(obj, "_Record__caches", None)
+        return
+    obj._invalidate()
+
+
 class Property(object):
     """This is the base class for all property types.  It is a data descriptor,
     so care should be taken before adding any ``SPECIALMETHODS`` which might
@@ -52,7 +71,7 @@ class Property(object):
 
     def __init__(self, isa=None,  coerce=None, check=None,
                  required=False, default=_none, traits=None,
-                 extraneous=False, doc=None):
+                 extraneous=False, doc=None, coerce_cache=None):
         """Declares a new standard Property.  Note: if you pass arguments which
         are not understood by this constructor, or pass extra property traits
         to ``traits``, then the call will be redirected to a sub-class; see
@@ -102,6 +121,12 @@ class Property(object):
 
             ``doc=``\ *STR*
                 Specify a docstring for the property.
+
+            ``coerce_cache=``\ *INT|CoerceCache*
+                Remember the results of the ``coerce`` function for this
+                many recent inputs, or share the passed
+                :py:class:`normalize.property.cache.CoerceCache`.  Only for
+                coerce functions which return immutable values.
         """
         self.name = None
         self.class_ = None
@@ -142,7 +167,14 @@ class Property(object):
         self.coerce = coerce or isa
         if self.coerce and not self.valuetype:
             raise exc.CoerceWithoutType()
+        if coerce_cache is not None and \
+                not isinstance(coerce_cache, CoerceCache):
+            coerce_cache = CoerceCache(coerce_cache)
+        if coerce_cache is not None and not self.coerce:
+            raise exc.CoerceWithoutType()
+        self.coerce_cache = coerce_cache
         self.extraneous = extraneous
+        self.validate = self.make_validator()
 
     def func_info(self, func):
         args = inspect.getargspec(func)
@@ -165,6 +197,17 @@ class Property(object):
     def bind(self, class_, name):
         self.name = name
         self.class_ = weakref.ref(class_)
+        self.validate = self.make_validator()
+
+    def __reduce_ex__(self, protocol):
+        """Bound properties are pickled as a reference to the ``Record``
+        class they are bound to (which must be importable), rather than by
+        value; so that, for instance, exceptions which mention them can be
+        passed back from ``multiprocessing`` workers."""
+        class_ = self.class_() if self.bound else None
+        if class_ is None:
+            return super(Property, self).__reduce_ex__(protocol)
+        return (_bound_property, (class_, self.name))
 
     @property
     def fullname(self):
@@ -183,22 +226,18 @@ class Property(object):
             raise ValueError("%s is required" % self.fullname)
         if self.valuetype and not isinstance(value, self.valuetype):
             try:
-                new_value = self.coerce(value)
+                new_value = (
+                    self.coerce_cache(self.coerce, value) if
+                    self.coerce_cache is not None else
+                    self.coerce(value)
+                )
             except Exception as e:
                 raise exc.CoerceError(
-                    prop=self.fullname,
-                    value=repr(value),
+                    prop=self,
+                    value=value,
                     exc=e,
-                    func=(
-                        "%s constructor" % self.coerce.__name__ if
-                        isinstance(self.coerce, type) else self.coerce
-                    ),
-                    valuetype=(
-                        "(" + ", ".join(
-                            x.__name__ for x in self.valuetype
-                        ) + ")" if isinstance(self.valuetype, tuple) else
-                        self.valuetype.__name__
-                    ),
+                    func=self.coerce,
+                    valuetype=self.valuetype,
                 )
             if not isinstance(new_value, self.valuetype):
                 if _none_ok and new_value is None and not self.required:
@@ -207,18 +246,94 @@ class Property(object):
                     return _none
                 else:
                     raise exc.ValueCoercionError(
-                        prop=self.fullname,
-                        value=repr(value),
-                        coerced=repr(new_value),
+                        prop=self,
+                        value=value,
+                        coerced=new_value,
                     )
             else:
                 value = new_value
         if self.check and not self.check(value):
-            raise ValueError(
-                "%s value '%r' failed type check" % (self.fullname, value)
-            )
+            raise exc.CheckFailed(prop=self, value=value)
         return value
 
+    def make_validator(self):
+        """Returns a function which does the same thing as
+        :py:meth:`type_safe_value`, but with the tests which can never apply
+        to this property (because it has no ``isa``, ``check``, etc) left
+        out.  This is called when the property is bound, and the result saved
+        as ``self.validate``, which is what the setters call.  Sub-classes
+        which override ``type_safe_value`` get that method instead.
+        """
+        if type(self).type_safe_value.im_func is not \
+                Property.type_safe_value.im_func:
+            return self.type_safe_value
+
+        valuetype = self.valuetype
+        coerce = coerce_func = self.coerce
+        check = self.check
+        coerce_cache = self.coerce_cache
+        if coerce_cache is not None:
+            coerce = functools.partial(coerce_cache, coerce)
+        required = self.required
+
+        if valuetype:
+            def coerce_value(value, _none_ok):
+                try:
+                    new_value = coerce(value)
+                except Exception as e:
+                    raise exc.CoerceError(
+                        prop=self,
+                        value=value,
+                        exc=e,
+                        func=coerce_func,
+                        valuetype=valuetype,
+                    )
+                if isinstance(new_value, valuetype):
+                    return new_value
+                elif _none_ok and new_value is None and not required:
+                    return _none
+                else:
+                    raise exc.ValueCoercionError(
+                        prop=self,
+                        value=value,
+                        coerced=new_value,
+                    )
+
+            if check:
+                def validate(value, _none_ok=False):
+                    if not isinstance(value, valuetype):
+                        value = coerce_value(value, _none_ok)
+                        if value is _none:
+                            return value
+                    if not check(value):
+                        raise exc.CheckFailed(prop=self, value=value)
+                    return value
+            else:
+                def validate(value, _none_ok=False):
+                    if isinstance(value, valuetype):
+                        return value
+                    return coerce_value(value, _none_ok)
+
+        elif required:
+            def validate(value, _none_ok=False):
+                if value is None:
+                    raise ValueError("%s is required" % self.fullname)
+                if check and not check(value):
+                    raise exc.CheckFailed(prop=self, value=value)
+                return value
+
+        elif check:
+            def validate(value, _none_ok=False):
+                if not check(value):
+                    raise exc.CheckFailed(prop=self, value=value)
+                return value
+
+        else:
+            def validate(value, _none_ok=False):
+                return value
+
+        return validate
+
     def get_default(self, obj):
         if callable(self.default):
             if self.default_is_method:
@@ -236,7 +351,7 @@ class Property(object):
 
         new_value = (
             _none if value is _none else
-            self.type_safe_value(value, _none_ok=True)
+            self.validate(value, True)
         )
 
         if new_value is _none:
@@ -262,6 +377,11 @@ class Property(object):
         return "<%s %s>" % (metaclass, self.fullname)
 
 
+def _bound_property(class_, name):
+    """Unpickles a bound property; see :py:meth:`Property.__reduce_ex__`"""
+    return class_.properties[name]
+
+
 class LazyProperty(Property):
     """This declares a property which has late evaluation using its 'default'
     method.  This type uses the support built-in to python for lazy attribute
@@ -302,9 +422,14 @@ class LazyProperty(Property):
         """
         if obj is None:
             return self
+        if self.name in obj.__dict__:
+            # only reached for compact records, which have no real instance
+            # dictionary to shadow this descriptor
+            return obj.__dict__[self.name]
         value = self.get_default(obj)
 
-        obj.__dict__[self.name] = self.type_safe_value(value)
+        obj.__dict__[self.name] = self.validate(value)
+        changed(obj)
         return super(LazyProperty, self).__get__(obj, type_)
 
 
@@ -346,7 +471,8 @@ class SafeProperty(Property):
     def __set__(self, obj, value):
         """This setter checks the type of the value before allowing it to be
         set."""
-        obj.__dict__[self.name] = self.type_safe_value(value)
+        obj.__dict__[self.name] = self.validate(value)
+        changed(obj)
 
     def __delete__(self, obj):
         """Checks the property's ``required`` setting, and allows the delete if
@@ -354,6 +480,7 @@ class SafeProperty(Property):
         if self.required:
             raise ValueError("%s is required" % self.fullname)
         del obj.__dict__[self.name]
+        changed(obj)
 
 
 class LazySafeProperty(SafeProperty, LazyProperty):
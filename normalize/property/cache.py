@@ -0,0 +1,123 @@
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Memoization of property ``coerce`` functions.  Passing ``coerce_cache=``
+to ``Property()`` (or to :py:func:`normalize.property.make_property_type`)
+means that coercing an input equal to one seen recently returns the
+previous result, instead of calling the coerce function again.
+
+This is only correct for coerce functions which always return the same
+result for the same input, and which return immutable values (such as
+``datetime`` instances or strings); records or lists returned would be
+shared between all the places the input was seen.
+"""
+
+from __future__ import absolute_import
+
+import threading
+import weakref
+
+
+_caches = weakref.WeakSet()
+
+
+def clear_coerce_caches():
+    """Empties every :py:class:`CoerceCache`, and resets their counters"""
+    for cache in list(_caches):
+        cache.clear()
+
+
+class CoerceCache(object):
+    """A bounded, least-recently-used cache of coerce function results.
+
+    Each property passed ``coerce_cache=``\ *INT* gets its own cache of that
+    size; to share a cache between properties, make one of these and pass
+    it as ``coerce_cache=`` instead.  Results are keyed on the coerce
+    function as well as the input, so sharing is safe even between
+    properties with different coerce functions.  Inputs which are not
+    hashable are always passed to the coerce function, and exceptions are
+    not cached.
+
+    The ``hits`` and ``misses`` attributes count lookups since the cache
+    was made or last cleared.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        # values are [prev, next, key, result] links in a circular list
+        # ordered from least to most recently used, as in python 3's
+        # functools.lru_cache
+        self.entries = {}
+        self.root = []
+        self.root[:] = [self.root, self.root, None, None]
+        _caches.add(self)
+
+    def __call__(self, coerce, value):
+        """Returns ``coerce(value)``, from the cache if possible"""
+        key = (coerce, type(value), value)
+        try:
+            with self.lock:
+                link = self.entries.get(key, None)
+                if link is not None:
+                    prev_link, next_link = link[0], link[1]
+                    prev_link[1] = next_link
+                    next_link[0] = prev_link
+                    last = self.root[0]
+                    last[1] = self.root[0] = link
+                    link[0] = last
+                    link[1] = self.root
+                    self.hits += 1
+                    return link[3]
+        except TypeError:
+            # unhashable input
+            return coerce(value)
+        result = coerce(value)
+        with self.lock:
+            self.misses += 1
+            if key in self.entries or not self.maxsize:
+                # another thread got here first, or caching is disabled
+                pass
+            elif len(self.entries) >= self.maxsize:
+                # recycle the oldest link for the new entry
+                oldroot = self.root
+                oldroot[2] = key
+                oldroot[3] = result
+                self.root = oldroot[1]
+                del self.entries[self.root[2]]
+                self.root[2] = self.root[3] = None
+                self.entries[key] = oldroot
+            else:
+                last = self.root[0]
+                link = [last, self.root, key, result]
+                last[1] = self.root[0] = self.entries[key] = link
+        return result
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """Empties the cache and resets the counters"""
+        with self.lock:
+            self.entries.clear()
+            self.root[:] = [self.root, self.root, None, None]
+            self.hits = self.misses = 0
+
+    def __repr__(self):
+        return "<CoerceCache: %d/%d entries, %d hit(s), %d miss(es)>" % (
+            len(self), self.maxsize, self.hits, self.misses,
+        )
@@ -16,6 +16,7 @@
 
 
 from normalize.coll import ListCollection
+from normalize.coll import SetCollection
 from normalize.coll import _make_generic
 import normalize.exc as exc
 from normalize.property import Property
@@ -83,3 +84,23 @@ class ListProperty(CollectionProperty):
         super(ListProperty, self).__init__(
             of=list_of, coll=colltype, **kwargs
         )
+
+
+class SetProperty(CollectionProperty):
+    """A property holding a :py:class:`normalize.coll.SetCollection`"""
+    __trait__ = "set"
+
+    def __init__(self, set_of=None, **kwargs):
+        if set_of is None:
+            set_of = kwargs.pop("of", None)
+        if not set_of:
+            raise exc.SetOfWhat()
+        colltype = kwargs.pop('coll', SetCollection)
+        if not issubclass(colltype, SetCollection):
+            raise exc.SetPropertyMustDeriveSetCollection(
+                got=colltype.__name__,
+            )
+
+        super(SetProperty, self).__init__(
+            of=set_of, coll=colltype, **kwargs
+        )
@@ -16,6 +16,10 @@
 
 from __future__ import absolute_import
 
+import itertools
+import os
+import weakref
+
 import normalize.exc as exc
 from normalize.identity import record_id
 from normalize.record.meta import RecordMeta
@@ -25,10 +29,18 @@ class _Unset(object):
     pass
 
 
+# debug switch: set this (or the NORMALIZE_VALIDATE_TRUSTED environment
+# variable) to make the 'trusted' construction paths check everything anyway
+validate_trusted = bool(os.environ.get("NORMALIZE_VALIDATE_TRUSTED"))
+
+
 class Record(object):
     """Base class for normalize instances and collections.
     """
     __metaclass__ = RecordMeta
+    # None, or [primary key, hash, weak references to dependents], any of
+    # which may be None; see __pk__
+    __slots__ = ("__caches",)
 
     def __init__(self, init_dict=None, **kwargs):
         """Instantiates a new ``Record`` type.
@@ -46,6 +58,7 @@ class Record(object):
         is an ``OhPickle`` instance, you should probably just return (see
         :py:class:`OhPickle`)
         """
+        _init_caches(self, None)
         if isinstance(init_dict, OhPickle):
             return
         if init_dict and kwargs:
@@ -66,11 +79,144 @@ class Record(object):
             meta_prop = type(self).properties[propname]
             meta_prop.init_prop(self)
 
+    @classmethod
+    def trusted(cls, init_dict=None, **kwargs):
+        """Alternate constructor for values which are already known to be
+        valid, such as those loaded from your own database.  Values are
+        installed directly, without any of the type checks, coercion or
+        ``check`` functions of the properties.  Missing properties still
+        receive their defaults, and missing required properties still raise
+        an exception.
+
+        Arguments are as for :py:meth:`__init__`, except that the keys are
+        always property names and values always of the correct type.  If
+        ``normalize.record.validate_trusted`` is set, then this is the same
+        as calling the constructor.
+        """
+        if init_dict and kwargs:
+            raise exc.AmbiguousConstruction()
+        if not init_dict:
+            init_dict = kwargs
+        if validate_trusted:
+            return cls(**init_dict)
+        properties = cls.properties
+        self = cls.__new__(cls)
+        _init_caches(self, None)
+        instance_dict = self.__dict__
+        for propname, val in init_dict.iteritems():
+            if propname not in properties:
+                raise exc.PropertyNotKnown(
+                    propname=propname,
+                    typename=cls.__name__,
+                )
+            instance_dict[propname] = val
+        for propname in cls.eager_properties:
+            if propname not in init_dict:
+                properties[propname].init_prop(self)
+        return self
+
+    @classmethod
+    def from_rows(cls, fields, rows, trusted=False):
+        """Bulk constructor, for making many records from tabular data such
+        as the rows returned by a database cursor.  Returns a ``RecordList``
+        of this type, the same type that ``ListProperty(of=...)`` uses.
+
+        args:
+
+            ``fields=``\ *SEQUENCE*
+                The property names which correspond to each position in the
+                rows.
+
+            ``rows=``\ *ITERABLE*
+                Tuples (or other sequences) of values, each in the order of
+                ``fields``.
+
+            ``trusted=``\ *BOOL*
+                Make the records as :py:meth:`trusted` would, without
+                checking the values.
+
+        The properties are looked up once, rather than once for every value.
+        Types which define their own constructor have it called for every
+        row, unless ``trusted`` is passed.
+        """
+        from normalize.coll import _make_generic
+        from normalize.coll import ListCollection
+
+        properties = cls.properties
+        fields = tuple(fields)
+        for propname in fields:
+            if propname not in properties:
+                raise exc.PropertyNotKnown(
+                    propname=propname,
+                    typename=cls.__name__,
+                )
+        width = len(fields)
+        defaults = tuple(
+            properties[propname] for propname in
+            sorted(cls.eager_properties.difference(fields))
+        )
+        trusted = trusted and not validate_trusted
+        init = cls.__init__.im_func
+        custom_init = not (
+            init is Record.__init__.im_func or
+            getattr(init, "_generated", False)
+        )
+        init_funcs = tuple(properties[propname].init_prop for
+                           propname in fields)
+
+        records = []
+        for rownum, row in enumerate(rows):
+            if len(row) != width:
+                raise exc.RowLengthMismatch(
+                    rownum=rownum,
+                    typename=cls.__name__,
+                    length=len(row),
+                    expected=width,
+                )
+            if trusted:
+                record = cls.__new__(cls)
+                _init_caches(record, None)
+                record.__dict__.update(zip(fields, row))
+            elif custom_init:
+                records.append(cls(**dict(zip(fields, row))))
+                continue
+            else:
+                record = cls.__new__(cls)
+                _init_caches(record, None)
+                for init_prop, val in zip(init_funcs, row):
+                    init_prop(record, val)
+            for meta_prop in defaults:
+                meta_prop.init_prop(record)
+            records.append(record)
+
+        return _make_generic(cls, ListCollection).trusted(records)
+
+    @classmethod
+    def from_columns(cls, columns, trusted=False):
+        """Bulk constructor which takes a dictionary of property names to
+        sequences of values, one for each record.  The sequences must all be
+        the same length.  Otherwise, this is the same as
+        :py:meth:`from_rows`.
+        """
+        fields = columns.keys()
+        lengths = set(len(columns[propname]) for propname in fields)
+        if len(lengths) > 1:
+            raise exc.ColumnLengthMismatch(
+                typename=cls.__name__,
+                lengths=", ".join(
+                    "%s=%d" % (propname, len(columns[propname]))
+                    for propname in sorted(fields)
+                ),
+            )
+        rows = itertools.izip(*(columns[propname] for propname in fields))
+        return cls.from_rows(fields, rows, trusted=trusted)
+
     def __getnewargs__(self):
         """Stub method which arranges for an ``OhPickle`` instance to be passed
-        to the constructor above when pickling out.
+        to the constructor above when pickling out.  The same instance is
+        used for every record, so pickle stores it only once.
         """
-        return (OhPickle(),)
+        return (oh_pickle,)
 
     def __getstate__(self):
         """Implement saving, for the pickle out API.  Returns the instance
@@ -141,13 +287,106 @@ class Record(object):
         similar to what is used when comparing Collections via
         :py:mod:`normalize.diff`, and is used for stringification and for the
         ``id()`` built-in.
+
+        The value is cached until the record is modified via its properties,
+        or a record or collection it was worked out from is modified (see
+        :py:func:`normalize.property.changed`).  Those records note this
+        record as a dependent, through a weak reference.  Compact records
+        can't be referred to that way, so they only cache keys which depend
+        on nothing else.  Modifying other mutable values held in properties
+        (eg, appending to a plain ``list``) does not invalidate the cache.
+
+        Assignments to unsafe and lazy properties are not tracked, so keys
+        which read them (``_volatile_pk`` types, and those of records with
+        such a key inside) are worked out every time.
         """
-        return record_id(self, type(self))
+        try:
+            caches = self.__caches
+        except AttributeError:
+            caches = None
+        if caches is not None and caches[0] is not None:
+            return caches[0]
+        record_type = type(self)
+        if record_type._volatile_pk:
+            return record_id(self, record_type)
+        depends = []
+        pk = record_id(self, record_type, depends=depends)
+        others = [x for x in depends if x is not self]
+        if others:
+            for record in others:
+                if type(record)._volatile_pk:
+                    return pk
+            try:
+                ref = weakref.ref(self)
+            except TypeError:
+                return pk
+            for record in others:
+                record._add_dependent(ref)
+        if caches is None:
+            _init_caches(self, [pk, None, None])
+        else:
+            caches[0] = pk
+        return pk
 
     def __hash__(self):
-        """Implements ``id()`` for Record types.
+        """Implements ``id()`` for Record types.  Cached along with
+        ``__pk__``.
         """
-        return self.__pk__.__hash__()
+        try:
+            caches = self.__caches
+        except AttributeError:
+            caches = None
+        if caches is not None and caches[1] is not None:
+            return caches[1]
+        pk = self.__pk__
+        hash_ = pk.__hash__()
+        if caches is None:
+            caches = getattr(self, "_Record__caches", None)
+        if caches is not None and caches[0] is pk:
+            caches[1] = hash_
+        return hash_
+
+    def _pk_cached(self):
+        """Returns true if the primary key is cached, and so is tracked
+        along with what it depends on"""
+        caches = getattr(self, "_Record__caches", None)
+        return caches is not None and caches[0] is not None
+
+    def _add_dependent(self, ref):
+        """Notes that data cached by the record or collection which ``ref``
+        (a weak reference) refers to was worked out from this record, and
+        must be thrown away when this record changes."""
+        caches = getattr(self, "_Record__caches", None)
+        if caches is None:
+            _init_caches(self, [None, None, [ref]])
+        elif caches[2] is None:
+            caches[2] = [ref]
+        elif not any(x is ref for x in caches[2]):
+            caches[2].append(ref)
+
+    def _drop_caches(self):
+        """Throws away data cached from the contents of the record, and
+        forgets its dependents; returns the weak references to them."""
+        caches = getattr(self, "_Record__caches", None)
+        if caches is None:
+            return ()
+        _init_caches(self, None)
+        return caches[2] or ()
+
+    def _invalidate(self):
+        """Throws away the cached primary key of the record, and the cached
+        data of its dependents, and of their dependents, and so on.  Each
+        record forgets its dependents as they are dropped; they note
+        themselves again when they next work something out.  Collections
+        keep their own indexes, which their mutation methods update."""
+        refs = Record._drop_caches(self)
+        if not refs:
+            return
+        pending = list(refs)
+        while pending:
+            dependent = pending.pop()()
+            if dependent is not None:
+                pending.extend(dependent._drop_caches())
 
     def diff_iter(self, other, **kwargs):
         """Generator method which returns the differences from the invocant to
@@ -175,6 +414,10 @@ class Record(object):
         return diff(self, other, **kwargs)
 
 
+# sets the cache slot, without going through the class' __setattr__
+_init_caches = Record.__dict__["_Record__caches"].__set__
+
+
 class OhPickle(object):
     """Sentinel type for Un-Pickling.  ``pickle`` does not allow a
     ``__getinitargs__``/``__getnewargs__`` to return keyword constructor
@@ -184,3 +427,85 @@ class OhPickle(object):
     """
     def __str__(self):
         return "<OhPickle>"
+
+
+oh_pickle = OhPickle()
+
+
+class FrozenRecord(Record):
+    """Base class for immutable records.  Like a record where every property
+    is an :py:class:`normalize.property.ROProperty`, assigning to or deleting
+    any attribute raises :py:class:`normalize.exc.ReadOnlyAttributeError`.
+    Lazy properties are still filled in on first access.
+
+    The primary key and hash are calculated once, on first use, and never
+    invalidated; so values inside a ``FrozenRecord`` (other records and
+    collections) should not be modified either.  Ideally, they are
+    ``FrozenRecord`` instances themselves.
+
+    To make a modified version, use :py:meth:`evolve`.
+    """
+    __slots__ = ("__frozen_pk", "__frozen_hash")
+
+    def __setattr__(self, name, value):
+        """Raises ``ReadOnlyAttributeError``"""
+        raise exc.ReadOnlyAttributeError(attrname=self._attrname(name))
+
+    def __delattr__(self, name):
+        """Raises ``ReadOnlyAttributeError``"""
+        raise exc.ReadOnlyAttributeError(attrname=self._attrname(name))
+
+    def _attrname(self, name):
+        prop = type(self).properties.get(name, None)
+        return prop.fullname if prop else "%s.%s" % (
+            type(self).__name__, name,
+        )
+
+    @property
+    def __pk__(self):
+        """The primary key of a ``FrozenRecord`` is calculated once."""
+        try:
+            return self.__frozen_pk
+        except AttributeError:
+            pk = record_id(self, type(self))
+            object.__setattr__(self, "_FrozenRecord__frozen_pk", pk)
+            return pk
+
+    def __hash__(self):
+        """The hash of a ``FrozenRecord`` is calculated once."""
+        try:
+            return self.__frozen_hash
+        except AttributeError:
+            hash_ = self.__pk__.__hash__()
+            object.__setattr__(self, "_FrozenRecord__frozen_hash", hash_)
+            return hash_
+
+    def _pk_cached(self):
+        return True
+
+    def evolve(self, **kwargs):
+        """Returns a copy of this record, with the properties passed as
+        keyword arguments replaced.  Values are checked and coerced as they
+        would be by the constructor.  Other values, including records and
+        collections, are shared with the original rather than copied.  Lazy
+        properties are not copied if anything is replaced, as they may depend
+        on the replaced values.
+        """
+        record_type = type(self)
+        properties = record_type.properties
+        evolved = record_type.__new__(record_type)
+        for propname, val in self.__dict__.iteritems():
+            if propname in kwargs or (
+                kwargs and "lazy" in properties[propname].traits
+            ):
+                continue
+            evolved.__dict__[propname] = val
+        for propname, val in kwargs.iteritems():
+            meta_prop = properties.get(propname, None)
+            if meta_prop is None:
+                raise exc.PropertyNotKnown(
+                    propname=propname,
+                    typename=record_type.__name__,
+                )
+            meta_prop.init_prop(evolved, val)
+        return evolved
@@ -0,0 +1,197 @@
+#
+# This file is a part of the normalize python library
+#
+# normalize is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License.
+#
+# normalize is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+#
+# You should have received a copy of the MIT license along with
+# normalize.  If not, refer to the upstream repository at
+# http://github.com/hearsaycorp/normalize
+#
+
+"""Copy-on-write views of loaded JSON data, used for the values of
+``unknown_json_keys`` when a ``JsonRecord`` type sets
+``unknown_json_keys_mode = "cow"``.
+
+Wrapping a dictionary or list with :py:func:`cow` copies only its top
+level.  The containers inside it are copied (one level at a time) as they
+are read from the view, so writes made through the view never reach the
+original structure, but parts which are never looked at are never copied.
+
+The views are ``dict`` and ``list`` sub-classes, and can be passed to
+``json.dumps`` and compared with plain data as usual.  They only protect
+the original from changes made through them: the original should not
+itself be changed afterwards, and shallow copies made with ``dict()`` or
+``list()`` may contain parts of it.  ``copy.deepcopy`` and ``pickle``
+return plain dictionaries and lists.
+"""
+
+from __future__ import absolute_import
+
+
+def cow(value):
+    """Returns a copy-on-write view of ``value`` if it is a ``dict`` or a
+    ``list``, otherwise ``value`` itself"""
+    if isinstance(value, dict):
+        return CowDict(value)
+    elif isinstance(value, list):
+        return CowList(value)
+    return value
+
+
+class CowDict(dict):
+    """Copy-on-write view of a dictionary; see :py:mod:`normalize.record.cow`
+    """
+    __slots__ = ("_source",)
+
+    def __init__(self, source):
+        super(CowDict, self).__init__(source)
+        self._source = source
+
+    def _own(self, key, value):
+        """Replaces a container still shared with the source with a view of
+        it"""
+        if isinstance(value, (dict, list)) and \
+                dict.get(self._source, key, self) is value:
+            value = cow(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _own_all(self):
+        for key, value in dict.iteritems(self):
+            self._own(key, value)
+
+    def __getitem__(self, key):
+        return self._own(key, dict.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, self._own(key, value)
+
+    def _owning(method):
+        def owning(self, *args):
+            self._own_all()
+            return method(self, *args)
+        owning.__name__ = method.__name__
+        return owning
+
+    values = _owning(dict.values)
+    itervalues = _owning(dict.itervalues)
+    viewvalues = _owning(dict.viewvalues)
+    items = _owning(dict.items)
+    iteritems = _owning(dict.iteritems)
+    viewitems = _owning(dict.viewitems)
+    copy = _owning(dict.copy)
+    del _owning
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (self.items(),))
+
+    def __reduce__(self):
+        return self.__reduce_ex__(0)
+
+    def __repr__(self):
+        return "cow(%s)" % dict.__repr__(self)
+
+
+class CowList(list):
+    """Copy-on-write view of a list; see :py:mod:`normalize.record.cow`"""
+    __slots__ = ("_source", "_views", "_unowned")
+
+    def __init__(self, source):
+        super(CowList, self).__init__(list.__iter__(source))
+        # the view of each container in the source, by id, once made;
+        # holding the source keeps them alive, so the ids are not reused.
+        # A container which appears more than once gets one view, which
+        # replaces it in each position, so they stay aliases.
+        self._source = source
+        self._views = dict(
+            (id(x), None) for x in list.__iter__(self)
+            if isinstance(x, (dict, list))
+        )
+        self._unowned = bool(self._views)
+
+    def _own(self, index, value):
+        views = self._views
+        if id(value) in views:
+            view = views[id(value)]
+            if view is None:
+                view = views[id(value)] = cow(value)
+            list.__setitem__(self, index, view)
+            return view
+        return value
+
+    def _own_all(self):
+        if self._unowned:
+            for i, value in enumerate(list.__iter__(self)):
+                self._own(i, value)
+            self._unowned = False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._own_all()
+            return list.__getitem__(self, index)
+        return self._own(index, list.__getitem__(self, index))
+
+    def __getslice__(self, i, j):
+        self._own_all()
+        return list.__getslice__(self, i, j)
+
+    def __iter__(self):
+        self._own_all()
+        return list.__iter__(self)
+
+    def __reversed__(self):
+        self._own_all()
+        return list.__reversed__(self)
+
+    def pop(self, index=-1):
+        value = self._own(index, list.__getitem__(self, index))
+        list.__delitem__(self, index)
+        return value
+
+    def __add__(self, other):
+        self._own_all()
+        return list.__add__(self, other)
+
+    def __mul__(self, count):
+        self._own_all()
+        return list.__mul__(self, count)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, count):
+        self._own_all()
+        return list.__imul__(self, count)
+
+    def __reduce_ex__(self, protocol):
+        return (list, (list(self),))
+
+    def __reduce__(self):
+        return self.__reduce_ex__(0)
+
+    def __repr__(self):
+        return "cow(%s)" % list.__repr__(self)
@@ -20,28 +20,520 @@ from __future__ import absolute_import
 from copy import deepcopy
 import inspect
 import json
+import re
+import threading
 import types
 
+from normalize.coll import _make_generic
 from normalize.coll import Collection
 from normalize.coll import ListCollection as RecordList
 from normalize.diff import Diff
 from normalize.diff import DiffInfo
 import normalize.exc as exc
+from normalize.property import _none
+from normalize.property import changed
+from normalize.property import Property
 from normalize.property.json import JsonProperty
+import normalize.record
 from normalize.record import OhPickle
 from normalize.record import Record
+from normalize.record.cow import cow
 
 
-def _json_to_value_initializer(json_val, proptype):
-    if proptype:
-        if isinstance(proptype, JsonRecord):
-            return json_val
-        elif hasattr(proptype, "from_json"):
-            return proptype.from_json(json_val)
-        elif isinstance(proptype, Record) and isinstance(json_val, dict):
-            return from_json(proptype, json_val)
+def _effective_init(mro):
+    """Returns the first ``__init__`` in the passed classes which was not
+    made by :py:func:`normalize.record.meta._make_init` (those just pass
+    sub-class instances on to the next one)"""
+    for klass in mro:
+        init = klass.__dict__.get("__init__", None)
+        if init is not None and not getattr(init, "_generated", False):
+            return init
 
-    return json_val
+
+def _json_value_converter(proptype):
+    """Returns a function which converts a JSON value for a property of the
+    passed type, by calling the type's ``from_json`` method if it has one,
+    or ``None`` if there is nothing to do.  ``JsonRecord`` types which do
+    not customize their loading are filled in directly, without the round
+    trip through ``from_json`` and the constructor."""
+    if not proptype or not hasattr(proptype, "from_json"):
+        return None
+    from_json_method = proptype.from_json
+    direct = (
+        isinstance(proptype, type) and issubclass(proptype, JsonRecord) and
+        not _overridden(proptype, "from_json", JsonRecord)
+    )
+
+    def convert(json_val):
+        if direct and isinstance(json_val, dict):
+            # looked up when needed, so that types are only examined if used
+            fill = _json_decoder(proptype, direct=True)
+            if fill:
+                record = proptype.__new__(proptype)
+                fill(record, json_val)
+                return record
+        return from_json_method(json_val)
+    return convert
+
+
+# set by _with_unknown_keys_mode; overrides unknown_json_keys_mode
+unknown_keys_override = threading.local()
+
+
+def _unknown_json_values(record_type, json_struct, keys):
+    """Returns the ``unknown_json_keys`` dictionary for the passed keys of
+    ``json_struct``, with the values copied, shared or wrapped in
+    copy-on-write views according to the mode set by
+    :py:func:`_with_unknown_keys_mode`, or failing that the
+    ``unknown_json_keys_mode`` of ``record_type``."""
+    mode = getattr(unknown_keys_override, "mode", None) or \
+        getattr(record_type, "unknown_json_keys_mode", "copy")
+    if mode == "share":
+        return dict((k, json_struct[k]) for k in keys)
+    elif mode == "cow":
+        return dict((k, cow(json_struct[k])) for k in keys)
+    elif mode != "copy":
+        raise exc.UnknownJsonKeysModeInvalid(mode=mode)
+    return dict((k, deepcopy(json_struct[k])) for k in keys)
+
+
+def _with_unknown_keys_mode(mode, func, *args, **kwargs):
+    """Calls ``func``, with ``unknown_json_keys`` kept according to
+    ``mode`` for all the records it makes from JSON in this thread"""
+    if mode not in ("copy", "share", "cow"):
+        raise exc.UnknownJsonKeysModeInvalid(mode=mode)
+    previous = getattr(unknown_keys_override, "mode", None)
+    unknown_keys_override.mode = mode
+    try:
+        return func(*args, **kwargs)
+    finally:
+        unknown_keys_override.mode = previous
+
+
+def _make_json_table(record_type):
+    fields = list()
+    for propname, prop in record_type.properties.iteritems():
+        # think "does" here rather than "is"; the slot does JSON
+        if isinstance(prop, JsonProperty):
+            json_name = prop.json_name
+            if json_name is None:
+                continue
+            json_in = (
+                prop.from_json if prop.json_in or
+                type(prop).from_json.im_func is not
+                JsonProperty.from_json.im_func else None
+            )
+        else:
+            json_name = propname
+            json_in = None
+        fields.append((
+            propname, json_name, json_in,
+            _json_value_converter(prop.valuetype), prop,
+        ))
+    return tuple(fields), frozenset(field[1] for field in fields)
+
+
+# cache for _json_table
+json_tables = dict()
+
+
+def _json_table(record_type):
+    """Returns a list of ``(propname, json_name, json_in, convert, prop)``
+    for the properties of ``record_type`` which are marshalled in from JSON,
+    and the set of JSON keys they use.  ``json_in`` is the property's
+    ``from_json`` method, and ``convert`` the function from
+    :py:func:`_json_value_converter`; either may be ``None``.  Worked out
+    once per type."""
+    table = json_tables.get(record_type, None)
+    if table is None:
+        table = json_tables[record_type] = _make_json_table(record_type)
+    return table
+
+
+class _LazyJsonDict(dict):
+    """Instance dictionary of records of ``__lazy_json__`` types made from
+    JSON.  ``pending`` holds the JSON values of the properties which have
+    not been read yet, by property name."""
+    __slots__ = ("pending",)
+
+
+def _make_json_decoder(record_type, direct):
+    is_json = issubclass(record_type, JsonRecord)
+    if is_json:
+        if _overridden(record_type, "json_to_initkwargs", JsonRecord):
+            return None
+        mro = record_type.__mro__
+        if _effective_init(mro[mro.index(JsonRecord) + 1:]) is not \
+                Record.__dict__['__init__']:
+            return None
+        if direct and _effective_init(mro) is not \
+                JsonRecord.__dict__['__init__']:
+            return None
+    elif _effective_init(record_type.__mro__) is not \
+            Record.__dict__['__init__']:
+        return None
+
+    fields, json_names = _json_table(record_type)
+    properties = record_type.properties
+    fill_fields = tuple(
+        (json_name, json_in, convert, prop.init_prop, prop.eager_init())
+        for propname, json_name, json_in, convert, prop in fields
+    )
+    lazy = is_json and record_type.__lazy_json__
+    mapped = set(field[0] for field in fields)
+    unknown_prop = properties.get("unknown_json_keys", None)
+    unknown_eager = unknown_prop and "unknown_json_keys" not in mapped and \
+        unknown_prop.eager_init()
+    defaults = tuple(
+        properties[propname].init_prop for propname in sorted(
+            record_type.eager_properties - mapped -
+            set(("unknown_json_keys",))
+        )
+    )
+
+    def fill_rest(record, json_struct):
+        unknown_keys = json_struct.viewkeys() - json_names
+        if unknown_keys:
+            if unknown_prop is None:
+                raise exc.PropertyNotKnown(
+                    propname="unknown_json_keys",
+                    typename=record_type.__name__,
+                )
+            unknown_prop.init_prop(record, _unknown_json_values(
+                record_type, json_struct, unknown_keys,
+            ))
+        elif unknown_eager:
+            unknown_prop.init_prop(record)
+        for init_prop in defaults:
+            init_prop(record)
+
+    if lazy:
+        # lazy properties would compute their default rather than look
+        # for a pending value, so they are converted straight away
+        lazy_fields = tuple(
+            (json_name, propname, json_in, convert, prop.init_prop,
+             prop.eager_init(), "lazy" not in prop.traits)
+            for propname, json_name, json_in, convert, prop in fields
+        )
+
+        def fill(record, json_struct):
+            if json_struct is None:
+                json_struct = {}
+            if not isinstance(json_struct, dict):
+                raise TypeError(
+                    "dict expected, found %s" % type(json_struct).__name__
+                )
+            instance_dict = record.__dict__ = _LazyJsonDict()
+            pending = instance_dict.pending = {}
+            missing = []
+            for json_name, propname, json_in, convert, init_prop, eager, \
+                    defer in lazy_fields:
+                if json_name in json_struct:
+                    val = json_struct[json_name]
+                    if defer:
+                        pending[propname] = val
+                        continue
+                    if json_in:
+                        val = json_in(val)
+                    if convert:
+                        val = convert(val)
+                    init_prop(record, val)
+                elif eager:
+                    missing.append(init_prop)
+            fill_rest(record, json_struct)
+            # defaults may read other properties, including pending ones
+            for init_prop in missing:
+                init_prop(record)
+
+    else:
+        def fill(record, json_struct):
+            if json_struct is None:
+                json_struct = {}
+            if not isinstance(json_struct, dict):
+                raise TypeError(
+                    "dict expected, found %s" % type(json_struct).__name__
+                )
+            missing = []
+            for json_name, json_in, convert, init_prop, eager in fill_fields:
+                if json_name in json_struct:
+                    val = json_struct[json_name]
+                    if json_in:
+                        val = json_in(val)
+                    if convert:
+                        val = convert(val)
+                    init_prop(record, val)
+                elif eager:
+                    missing.append(init_prop)
+            fill_rest(record, json_struct)
+            # defaults may read other properties, so they go in last
+            for init_prop in missing:
+                init_prop(record)
+
+    return fill
+
+
+# cache for _json_decoder
+json_decoders = dict()
+
+
+def _json_decoder(record_type, direct=False):
+    """Returns (and caches) a function which fills in a new, empty instance
+    of ``record_type`` from a JSON dictionary, exactly as the constructor
+    would with the keyword arguments from :py:func:`json_to_initkwargs`, but
+    without going through them; or ``None`` if the type customizes this by
+    overriding ``json_to_initkwargs`` or the constructor.  With ``direct``,
+    ``JsonRecord`` types must also not define their own constructor, as the
+    caller will not be calling it.
+    """
+    key = (record_type, direct)
+    if key not in json_decoders:
+        json_decoders[key] = _make_json_decoder(record_type, direct)
+    return json_decoders[key]
+
+
+# cache for _json_fields_by_name
+json_field_indexes = dict()
+
+
+def _json_fields_by_name(record_type):
+    """Returns the :py:func:`_json_table` entries of ``record_type``, in a
+    dictionary by property name"""
+    index = json_field_indexes.get(record_type, None)
+    if index is None:
+        index = json_field_indexes[record_type] = dict(
+            (field[0], field) for field in _json_table(record_type)[0]
+        )
+    return index
+
+
+def _select_all(select):
+    """Returns true if ``select`` (a ``MultiFieldSelector`` or the ``all``
+    marker from one) selects everything below it"""
+    return select is all or (
+        select.has_none and select.heads[None] is all
+    )
+
+
+def _selectable(record_type):
+    """Returns the fill function from :py:func:`_json_decoder` which
+    projected decoding uses for ``record_type``, or ``None`` if the type
+    customizes loading and so must be loaded in full"""
+    return _json_decoder(
+        record_type, direct=issubclass(record_type, JsonRecord),
+    )
+
+
+def _fill_selected(record, json_struct, select):
+    """Fills in a new record from a JSON dictionary, like the functions
+    from :py:func:`_json_decoder`, but only the properties selected by the
+    ``MultiFieldSelector`` ``select``; other keys are not looked at.
+    Unknown keys are only kept if ``unknown_json_keys`` is selected."""
+    record_type = type(record)
+    if json_struct is None:
+        json_struct = {}
+    if not isinstance(json_struct, dict):
+        raise TypeError("dict expected, found %s" % type(json_struct).__name__)
+    index = _json_fields_by_name(record_type)
+    properties = record_type.properties
+    for propname, tail in select.heads.iteritems():
+        field = index.get(propname, None)
+        if field is None:
+            continue
+        _, json_name, json_in, convert, prop = field
+        if json_name in json_struct:
+            val = json_struct[json_name]
+            if json_in:
+                val = json_in(val)
+            if not _select_all(tail) and prop.valuetype and \
+                    isinstance(prop.valuetype, type):
+                val = _json_to_selected(prop.valuetype, val, tail, convert)
+            elif convert:
+                val = convert(val)
+            prop.init_prop(record, val)
+    if "unknown_json_keys" in select.heads and \
+            "unknown_json_keys" in properties:
+        unknown_keys = json_struct.viewkeys() - _json_table(record_type)[1]
+        if unknown_keys:
+            properties["unknown_json_keys"].init_prop(
+                record, _unknown_json_values(
+                    record_type, json_struct, unknown_keys,
+                ),
+            )
+    instance_dict = record.__dict__
+    for propname in record_type.eager_properties:
+        if propname not in instance_dict:
+            prop = properties[propname]
+            # unselected required properties are allowed to be missing
+            if propname in select.heads or not prop.required or \
+                    prop.default is not _none:
+                prop.init_prop(record)
+
+
+def _json_list_selected(item_type, json_list, select):
+    """Converts the members of a JSON list selected by ``select`` (all of
+    them, or those at the selected indexes) to ``item_type``"""
+    if json_list is None:
+        json_list = ()
+    if select.has_none:
+        tail = select.heads[None]
+        return list(
+            _json_to_selected(item_type, x, tail) for x in json_list
+        )
+    return list(
+        _json_to_selected(item_type, json_list[i], select.heads[i])
+        for i in sorted(select.heads) if -len(json_list) <= i < len(json_list)
+    )
+
+
+def _json_to_selected(value_type, json_val, select, convert=None):
+    """Converts a JSON value to ``value_type`` as ``from_json`` would, but
+    only materializing what ``select`` selects.  Types which customize their
+    loading are converted in full, then filtered with ``select.get()``; as
+    are other values (such as plain ``Record`` types being built by their
+    property's ``coerce`` function)."""
+    if _select_all(select):
+        if convert is None:
+            convert = _json_value_converter(value_type)
+        return convert(json_val) if convert else json_val
+    elif issubclass(value_type, Collection):
+        item_type = value_type.itemtype
+        customized = issubclass(value_type, JsonRecordList) and (
+            _overridden(value_type, "json_to_initkwargs", JsonRecordList) or
+            _overridden(value_type, "from_json", JsonRecord)
+        )
+        if isinstance(item_type, type) and issubclass(item_type, Record) \
+                and isinstance(json_val, list) and not customized:
+            return value_type(
+                values=_json_list_selected(item_type, json_val, select),
+            )
+    elif issubclass(value_type, Record) and isinstance(json_val, dict):
+        fill = _selectable(value_type)
+        if fill:
+            record = value_type.__new__(value_type)
+            _fill_selected(record, json_val, select)
+            return record
+    if convert is None:
+        convert = _json_value_converter(value_type)
+    return select.get(convert(json_val) if convert else json_val)
+
+
+def _overridden(record_type, method, *bases):
+    """Returns true if the class method has been overridden from the version
+    in one of the listed ``JsonRecord`` classes"""
+    func = getattr(record_type, method).im_func
+    return not any(func is getattr(base, method).im_func for base in bases)
+
+
+def _trusted_converter(valuetype, coerce):
+    """Returns a function which converts a JSON value to the passed type
+    without validating it, or ``None`` if no conversion is needed."""
+    if not valuetype:
+        return None
+    elif isinstance(valuetype, type) and issubclass(valuetype, Record):
+        # looked up when needed, so that types are only examined if used
+        def convert(json_val):
+            if isinstance(json_val, valuetype):
+                return json_val
+            return _trusted_decoder(valuetype)(json_val)
+    elif coerce:
+        def convert(json_val):
+            if isinstance(json_val, valuetype):
+                return json_val
+            return coerce(json_val)
+    else:
+        return None
+    return convert
+
+
+def _make_trusted_decoder(record_type):
+    make = record_type.trusted
+    is_json = issubclass(record_type, JsonRecord)
+    if is_json and _overridden(record_type, "from_json", JsonRecord):
+        return record_type.from_json
+
+    if is_json and _overridden(
+        record_type, "json_to_initkwargs", JsonRecord, JsonRecordList,
+    ):
+        def decode(json_struct):
+            if isinstance(json_struct, basestring):
+                json_struct = json.loads(json_struct)
+            return make(**record_type.json_to_initkwargs(json_struct, {}))
+
+    elif issubclass(record_type, Collection):
+        itemtype = record_type.itemtype
+        convert = _trusted_converter(
+            itemtype, getattr(itemtype, "from_json", None),
+        )
+
+        def decode(json_struct):
+            if is_json and isinstance(json_struct, basestring):
+                return _with_unknown_keys_mode(
+                    "share", decode, json.loads(json_struct),
+                )
+            if convert:
+                return make(values=list(convert(x) for x in json_struct or ()))
+            return make(values=json_struct)
+
+    elif issubclass(record_type, Record):
+        table, json_names = _json_table(record_type)
+        fields = tuple(
+            (propname, json_name, json_in,
+             _trusted_converter(prop.valuetype, prop.coerce))
+            for propname, json_name, json_in, _, prop in table
+        )
+
+        def decode(json_struct):
+            if is_json and isinstance(json_struct, basestring):
+                return _with_unknown_keys_mode(
+                    "share", decode, json.loads(json_struct),
+                )
+            if json_struct is None:
+                json_struct = {}
+            if not isinstance(json_struct, dict):
+                raise TypeError(
+                    "dict expected, found %s" % type(json_struct).__name__
+                )
+            kwargs = {}
+            for propname, json_name, from_json_val, convert in fields:
+                if json_name in json_struct:
+                    val = json_struct[json_name]
+                    if from_json_val:
+                        val = from_json_val(val)
+                    kwargs[propname] = convert(val) if convert else val
+            unknown_keys = json_struct.viewkeys() - json_names
+            if unknown_keys:
+                kwargs["unknown_json_keys"] = _unknown_json_values(
+                    record_type, json_struct, unknown_keys,
+                )
+            return make(**kwargs)
+
+    else:
+        def decode(json_struct):
+            raise exc.JsonRecordCoerceError(
+                given=json_struct,
+                typename=record_type.__name__,
+            )
+    return decode
+
+
+# cache for _from_json_trusted
+trusted_decoders = dict()
+
+
+def _trusted_decoder(record_type):
+    decoder = trusted_decoders.get(record_type)
+    if decoder is None:
+        decoder = _make_trusted_decoder(record_type)
+        trusted_decoders[record_type] = decoder
+    return decoder
+
+
+def _from_json_trusted(record_type, json_struct):
+    """Implements ``from_json(..., trusted=True)``; nested records and
+    collections are also made using their ``trusted`` constructors, unless
+    the type overrides the ``from_json`` or ``json_to_initkwargs`` hooks.
+    The work of looking at the properties is done once per type."""
+    return _trusted_decoder(record_type)(json_struct)
 
 
 def json_to_initkwargs(record_type, json_struct, kwargs=None):
@@ -64,37 +556,23 @@ def json_to_initkwargs(record_type, json_struct, kwargs=None):
         raise TypeError(
             "dict expected, found %s" % type(json_struct).__name__
         )
-    unknown_keys = set(json_struct.keys())
-    for propname, prop in record_type.properties.iteritems():
-        # think "does" here rather than "is"; the slot does JSON
-        if isinstance(prop, JsonProperty):
-            json_name = prop.json_name
-            if json_name is not None:
-                if json_name in json_struct:
-                    if propname not in kwargs:
-                        kwargs[propname] = _json_to_value_initializer(
-                            prop.from_json(
-                                json_struct[json_name]
-                            ),
-                            prop.valuetype,
-                        )
-                    unknown_keys.remove(json_name)
-        elif prop.name in json_struct:
-            json_val = json_struct[prop.name]
-            unknown_keys.remove(prop.name)
-            if prop.name not in kwargs:
-                proptype = prop.valuetype
-                kwargs[propname] = _json_to_value_initializer(
-                    json_val, proptype,
-                )
+    fields, json_names = _json_table(record_type)
+    for propname, json_name, json_in, convert, prop in fields:
+        if json_name in json_struct and propname not in kwargs:
+            val = json_struct[json_name]
+            if json_in:
+                val = json_in(val)
+            kwargs[propname] = convert(val) if convert else val
+    unknown_keys = json_struct.viewkeys() - json_names
     if unknown_keys:
-        kwargs["unknown_json_keys"] = dict(
-            (k, deepcopy(json_struct[k])) for k in unknown_keys
+        kwargs["unknown_json_keys"] = _unknown_json_values(
+            record_type, json_struct, unknown_keys,
         )
     return kwargs
 
 
-def from_json(record_type, json_struct):
+def from_json(record_type, json_struct, trusted=False, select=None,
+              unknown_json_keys_mode=None):
     """JSON marshall in function: a 'visitor' function which looks for JSON
     types/hints on types being converted to, but does not require them.
 
@@ -105,28 +583,365 @@ def from_json(record_type, json_struct):
         ``json_struct=``\ *DICT|LIST*
             a loaded (via ``json.loads``) data structure, normally a
             dict or a list.
+
+        ``trusted=``\ *BOOL*
+            The data is known to be valid; for instance, it was written by
+            ``to_json`` from records which were checked when they were made.
+            Records are made with :py:meth:`Record.trusted`; values which
+            are not already of a property's type are converted using its
+            ``coerce`` function, but ``check`` functions and other validation
+            are skipped.  See also ``normalize.record.validate_trusted``.
+
+        ``select=``\ *MultiFieldSelector*
+            Only convert the fields selected: other keys in the JSON data
+            are not decoded, checked, or made into records.  Unknown keys
+            are only kept if ``unknown_json_keys`` is selected, and
+            required properties which are not selected may be missing.
+            Types which customize their loading are loaded in full and then
+            filtered with :py:meth:`MultiFieldSelector.get`.  Selected
+            values are checked even if ``trusted`` is passed.
+
+        ``unknown_json_keys_mode=``\ *"copy"|"share"|"cow"*
+            Overrides the ``unknown_json_keys_mode`` of the record types
+            made (see :py:class:`JsonRecord`).
     """
+    if unknown_json_keys_mode is not None:
+        return _with_unknown_keys_mode(
+            unknown_json_keys_mode, from_json, record_type, json_struct,
+            trusted, select,
+        )
+    if select is not None:
+        return _json_to_selected(
+            record_type, json_struct, select,
+            lambda x: from_json(record_type, x, trusted),
+        )
+    if trusted and not normalize.record.validate_trusted:
+        return _from_json_trusted(record_type, json_struct)
     if issubclass(record_type, JsonRecord):
+        if isinstance(json_struct, dict):
+            fill = _json_decoder(record_type, direct=True)
+            if fill:
+                record = record_type.__new__(record_type)
+                fill(record, json_struct)
+                return record
         return record_type(json_struct)
 
     elif issubclass(record_type, Record):
+        fill = _json_decoder(record_type)
+        if fill:
+            record = record_type.__new__(record_type)
+            fill(record, json_struct)
+            return record
         # do what the default JsonRecord __init__ does
         init_kwargs = json_to_initkwargs(record_type, json_struct)
         instance = record_type(**init_kwargs)
         return instance
     else:
         raise exc.JsonRecordCoerceError(
-            given=repr(json_struct),
-            type=record_type.__name__,
+            given=json_struct,
+            typename=record_type.__name__,
         )
 
 
+_json_whitespace = re.compile(r"[ \t\n\r]*")
+_json_number = re.compile(r"[0-9.eE+\-]*")
+_json_token = re.compile(
+    r'"[^"\\]*(?:\\.[^"\\]*)*"|[^"\[\]{}]+|.', re.DOTALL,
+)
+_json_delimiter = re.compile(r"[ \t\n\r,\]]")
+# the position at the end of json.decoder.errmsg() messages
+_json_error_pos = re.compile(r": line \d+ column \d+ \(char (\d+)\)$")
+
+
+def _json_value_ends(buf, pos):
+    """Returns true if the JSON value starting at ``pos`` ends within
+    ``buf``, judging only by its brackets and strings; that is, if decoding
+    it failed, reading more would not help."""
+    closers = []
+    end = len(buf)
+    while pos < end:
+        match = _json_token.match(buf, pos)
+        token = match.group()
+        if token == '"':
+            # unterminated string
+            return False
+        pos = match.end()
+        if token == "[":
+            closers.append("]")
+        elif token == "{":
+            closers.append("}")
+        elif token in ("]", "}"):
+            # a mismatched bracket ends it too, badly
+            if not closers or closers.pop() != token:
+                return True
+        elif not closers:
+            # a top-level scalar ends at a delimiter
+            return pos < end or token[0] == '"' or \
+                _json_delimiter.search(token) is not None
+        if not closers:
+            return True
+    return False
+
+
+def _iter_json_array(fp, chunk_size):
+    """Generator which reads a JSON array from the file-like object ``fp``
+    and returns its elements one at a time, decoding each with
+    ``json.JSONDecoder.raw_decode`` from a buffer which only holds the
+    element being read and the rest of the last chunk read."""
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    offset = 0  # of buf in the input
+    eof = False
+    started = False
+    # None just after the "[", when either a value or "]" may follow
+    expect_value = None
+    while True:
+        pos = _json_whitespace.match(buf, pos).end()
+        if pos < len(buf):
+            char = buf[pos]
+            if not started:
+                if char != "[":
+                    raise ValueError(
+                        "Expecting '[': char %d" % (offset + pos)
+                    )
+                started = True
+                pos += 1
+                continue
+            elif char == "]" and expect_value is not True:
+                break
+            elif expect_value is False:
+                if char != ",":
+                    raise ValueError(
+                        "Expecting ',' or ']': char %d" % (offset + pos)
+                    )
+                expect_value = True
+                pos += 1
+                continue
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except ValueError as e:
+                if eof or _json_value_ends(buf, pos):
+                    raise _json_stream_error(e, offset, pos)
+            else:
+                # a number at the end of the buffer may have been cut short
+                if eof or not isinstance(value, (int, long, float)) or \
+                        _json_number.match(buf, end).end() < len(buf):
+                    yield value
+                    pos = end
+                    expect_value = False
+                    continue
+        elif eof:
+            raise ValueError(
+                "Unterminated JSON array: char %d" % (offset + pos)
+            )
+        # read more; large elements are read in larger chunks, so that
+        # decoding them from the start each time is not quadratic
+        chunk = fp.read(max(chunk_size, len(buf) - pos))
+        eof = not chunk
+        offset += pos
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    # only whitespace may follow the array
+    pos += 1
+    while True:
+        pos = _json_whitespace.match(buf, pos).end()
+        if pos < len(buf):
+            raise ValueError("Extra data: char %d" % (offset + pos))
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            return
+        offset += len(buf)
+        buf = chunk
+        pos = 0
+
+
+def _json_stream_error(error, offset, pos):
+    """Returns a ``ValueError`` like ``error``, raised decoding a value at
+    ``pos`` in a buffer starting at ``offset`` in the input, with the
+    position in the input rather than the buffer"""
+    message = str(error)
+    match = _json_error_pos.search(message)
+    if match:
+        return ValueError("%s: char %d" % (
+            message[:match.start()], offset + int(match.group(1)),
+        ))
+    return ValueError("%s: char %d" % (message, offset + pos))
+
+
+def iterload(record_type, fp, batch_size=None, trusted=False,
+             chunk_size=65536):
+    """Reads a (possibly very large) JSON array of records from a file,
+    without loading all of it first.  Generator which returns records as
+    they are read, or lists of up to ``batch_size`` of them.  The array
+    elements are converted in the same way as ``JsonRecordList`` would
+    convert them, so only one element's JSON data is held at a time.
+
+    args:
+        ``record_type=``\ *TYPE*
+            Record type of the array elements
+
+        ``fp=``\ *FILE*
+            A file-like object, open for reading
+
+        ``batch_size=``\ *INT*
+            If passed, return ``JsonRecordList`` collections of this
+            many records (the last may be shorter) instead of records
+
+        ``trusted=``\ *BOOL*
+            Make records as ``from_json(..., trusted=True)`` does
+
+        ``chunk_size=``\ *INT*
+            How much to read from ``fp`` at once
+    """
+    convert = _json_element_converter(record_type, trusted)
+    records = (convert(x) for x in _iter_json_array(fp, chunk_size))
+    return _batched(record_type, records, batch_size) if batch_size else \
+        records
+
+
+def _json_element_converter(record_type, trusted):
+    """Returns a function which converts the JSON data for one element of a
+    list of ``record_type`` the way ``JsonRecordList`` would, or as
+    ``from_json(..., trusted=True)`` does.  The data is assumed to have been
+    parsed just for this, so ``unknown_json_keys`` values are not copied."""
+    if trusted:
+        def element(json_struct):
+            return from_json(record_type, json_struct, trusted=True)
+    else:
+        element = _json_value_converter(record_type)
+        if element is None:
+            def element(json_struct):
+                return from_json(record_type, json_struct)
+
+    def convert(json_struct):
+        return _with_unknown_keys_mode("share", element, json_struct)
+    return convert
+
+
+def _batched(record_type, records, batch_size):
+    """Generator which groups records into ``JsonRecordList`` collections
+    of up to ``batch_size``"""
+    list_type = _make_generic(record_type, JsonRecordList)
+    batch = list()
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield list_type.trusted(batch)
+            batch = list()
+    if batch:
+        yield list_type.trusted(batch)
+
+
+def load_jsonl(record_type, fp, batch_size=None, trusted=False):
+    """Reads records from a file of `JSON lines <http://jsonlines.org/>`_;
+    that is, one JSON value per line.  Generator which returns records as
+    they are read, or ``JsonRecordList`` collections of up to
+    ``batch_size`` of them.  Blank lines are skipped.  Arguments are as for
+    :py:func:`iterload`.
+    """
+    convert = _json_element_converter(record_type, trusted)
+    loads = json.JSONDecoder().decode
+
+    def records():
+        for lineno, line in enumerate(fp, 1):
+            if not line.strip():
+                continue
+            try:
+                json_struct = loads(line)
+            except ValueError as e:
+                raise ValueError("line %d: %s" % (lineno, e))
+            yield convert(json_struct)
+
+    return _batched(record_type, records(), batch_size) if batch_size \
+        else records()
+
+
+class _JsonDocConverter(object):
+    """Function object for :py:func:`parallel_from_json` workers, which
+    converts a JSON document (a string, or data already loaded) to a record.
+    A class, not a closure, so it can be passed to the workers."""
+    def __init__(self, record_type, trusted):
+        self.record_type = record_type
+        self.trusted = trusted
+        self.convert = None
+
+    def __getstate__(self):
+        return dict(record_type=self.record_type, trusted=self.trusted)
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __call__(self, json_doc):
+        if self.convert is None:
+            self.convert = _json_element_converter(
+                self.record_type, self.trusted,
+            )
+        if isinstance(json_doc, basestring):
+            json_doc = json.loads(json_doc)
+        return self.convert(json_doc)
+
+
+def parallel_from_json(record_type, json_docs, processes=None, chunksize=100,
+                       trusted=False, pool=None):
+    """Converts many JSON documents to records using a ``multiprocessing``
+    pool, so that decoding and checking them is not limited to one CPU.
+    Generator which returns the records in the same order as
+    ``json_docs``; if converting any document raises an exception, it is
+    raised here.
+
+    The records (and the ``record_type``) are passed between processes by
+    pickling them, so ``record_type`` must be defined at the top level of
+    a module.  This process still has to unpickle every record, which for
+    simple records costs about a third as much as making them from JSON;
+    that limits how many workers can be kept busy.  Passing JSON strings
+    rather than loaded data leaves more of the work to the workers.
+
+    args:
+        ``record_type=``\ *TYPE*
+            Record type to convert the documents to
+
+        ``json_docs=``\ *ITERABLE*
+            JSON documents: strings, or data already loaded with
+            ``json.loads``.  These are converted the way ``JsonRecordList``
+            would convert its members.
+
+        ``processes=``\ *INT*
+            Number of worker processes; defaults to the number of CPUs
+
+        ``chunksize=``\ *INT*
+            How many documents are sent to a worker at a time
+
+        ``trusted=``\ *BOOL*
+            Make records as ``from_json(..., trusted=True)`` does
+
+        ``pool=``\ *multiprocessing.Pool*
+            Use this pool (which is left running) instead of starting a
+            new one
+    """
+    own_pool = pool is None
+    if own_pool:
+        import multiprocessing
+        pool = multiprocessing.Pool(processes)
+    try:
+        for record in pool.imap(_JsonDocConverter(record_type, trusted),
+                                json_docs, chunksize):
+            yield record
+        if own_pool:
+            pool.close()
+    finally:
+        if own_pool:
+            pool.terminate()
+            pool.join()
+
+
 # caches for _json_data
 has_json_data = dict()
 json_data_takes_extraneous = dict()
 
 
-def _json_data(x, extraneous):
+def _call_json_data(x, extraneous):
     """This function calls a json_json method, if the type has one, otherwise
     calls back into to_json().  It also check whether the method takes an
     'extraneous' argument and passes that through if possible."""
@@ -151,6 +966,184 @@ def _json_data(x, extraneous):
             return to_json(x, extraneous)
 
 
+# values which to_json passes through as they are
+_json_scalars = frozenset((str, unicode, int, float, bool, types.NoneType))
+
+
+def _json_data(x, extraneous):
+    """Returns the JSON form of any value, as found in a record being
+    marshalled out: that is, via its ``json_data()`` method if it has one,
+    otherwise via :py:func:`to_json`.  Uses the encoders from
+    :py:func:`_json_encoder`."""
+    if type(x) in _json_scalars:
+        return x
+    encoder = json_encoders[extraneous].get(type(x), None)
+    if encoder is None:
+        encoder = _json_encoder(type(x), extraneous)
+    return encoder(x)
+
+
+def _stock_getter(prop):
+    """Returns true if the property's ``__get__`` just reads the instance
+    dictionary, so encoders can do that themselves"""
+    return type(prop).__get__.im_func is Property.__get__.im_func
+
+
+def _json_out_fields(record_type, extraneous, merge_unknown):
+    """Works out which properties of ``record_type`` are marshalled out,
+    returning a tuple of ``(propname, json_name, to_json)`` for those which
+    can be read from the instance dictionary, one of ``(getter, json_name,
+    to_json)`` for the rest, whether ``unknown_json_keys`` should be
+    merged in (which requires ``merge_unknown``), and for ``__lazy_json__``
+    types, ``(propname, json_name)`` for the properties which may still be
+    held as JSON.  ``to_json`` is the property's ``to_json`` method, or
+    ``None`` if that does nothing."""
+    read = list()
+    get = list()
+    for propname, prop in record_type.properties.iteritems():
+        if not extraneous and prop.extraneous:
+            continue
+        if hasattr(prop, "json_name"):
+            if prop.json_name is None:
+                continue
+            json_name = prop.json_name
+        else:
+            json_name = prop.name
+        to_json_val = getattr(prop, "to_json", None)
+        if isinstance(prop, JsonProperty) and not prop.json_out and \
+                type(prop).to_json.im_func is JsonProperty.to_json.im_func:
+            to_json_val = None
+        if _stock_getter(prop):
+            read.append((prop.name, json_name, to_json_val))
+        else:
+            get.append((prop.__get__, json_name, to_json_val))
+    unknown_prop = record_type.properties.get("unknown_json_keys", None)
+    merge_unknown = merge_unknown and unknown_prop is not None and (
+        extraneous or not unknown_prop.extraneous
+    )
+    pending = ()
+    if getattr(record_type, "__lazy_json__", False):
+        out_names = set(field[1] for field in read + get)
+        pending = tuple(
+            (propname, json_name)
+            for propname, json_name, _, _, _ in _json_table(record_type)[0]
+            if json_name in out_names
+        )
+    return tuple(read), tuple(get), merge_unknown, pending
+
+
+def _make_to_json_encoder(value_type, extraneous, merge_unknown):
+    if issubclass(value_type, Collection):
+        def encode_collection(coll):
+            return list(_json_data(x, extraneous) for x in coll)
+        return encode_collection
+
+    elif issubclass(value_type, Record):
+        read, get, merge_unknown, pending = _json_out_fields(
+            value_type, extraneous, merge_unknown,
+        )
+        scalars = _json_scalars
+
+        def encode_record(record):
+            rv_dict = {}
+            instance_dict = record.__dict__
+            for propname, json_name, to_json_val in read:
+                if propname in instance_dict:
+                    val = instance_dict[propname]
+                    if to_json_val:
+                        val = to_json_val(val)
+                    rv_dict[json_name] = val if type(val) in scalars else \
+                        _json_data(val, extraneous)
+            if pending and type(instance_dict) is _LazyJsonDict:
+                # values which were never read are written out verbatim
+                json_values = instance_dict.pending
+                for propname, json_name in pending:
+                    if propname in json_values and \
+                            propname not in instance_dict:
+                        rv_dict[json_name] = json_values[propname]
+            for getter, json_name, to_json_val in get:
+                try:
+                    val = getter(record)
+                except AttributeError:
+                    pass
+                else:
+                    if to_json_val:
+                        val = to_json_val(val)
+                    rv_dict[json_name] = val if type(val) in scalars else \
+                        _json_data(val, extraneous)
+            if merge_unknown:
+                unknown = getattr(record, "unknown_json_keys", None)
+                if unknown:
+                    for k, v in unknown.iteritems():
+                        if k not in rv_dict:
+                            rv_dict[k] = v
+            return rv_dict
+        return encode_record
+
+    elif issubclass(value_type, long):
+        return lambda x: str(x) if abs(x) > 2**50 else x
+
+    elif issubclass(value_type, dict):
+        return lambda x: dict(
+            (k, _json_data(v, extraneous)) for k, v in x.iteritems()
+        )
+
+    elif issubclass(value_type, (list, tuple, set, frozenset)):
+        return lambda x: list(_json_data(v, extraneous) for v in x)
+
+    elif issubclass(value_type, (basestring, int, float, types.NoneType)):
+        return lambda x: x
+
+    else:
+        raise TypeError(
+            "I don't know how to marshall a %s to JSON" %
+            value_type.__name__
+        )
+
+
+# caches for _to_json_encoder and _json_encoder, by 'extraneous' then type
+to_json_encoders = {False: dict(), True: dict()}
+json_encoders = {False: dict(), True: dict()}
+
+
+def _to_json_encoder(value_type, extraneous):
+    """Returns (and caches) a function which does what :py:func:`to_json`
+    does for values of exactly ``value_type``, with the property table of
+    record types worked out in advance."""
+    encoders = to_json_encoders[extraneous]
+    encoder = encoders.get(value_type, None)
+    if encoder is None:
+        encoder = encoders[value_type] = _make_to_json_encoder(
+            value_type, extraneous, merge_unknown=False,
+        )
+    return encoder
+
+
+def _json_encoder(value_type, extraneous):
+    """Returns (and caches) a function which does what
+    :py:func:`_call_json_data` does for values of exactly ``value_type``.
+    Stock ``JsonRecord.json_data`` and ``JsonRecordList.json_data``
+    methods are not called, but have their work done by a compiled
+    encoder; other ``json_data`` methods are called as before."""
+    encoders = json_encoders[extraneous]
+    encoder = encoders.get(value_type, None)
+    if encoder is None:
+        json_data = getattr(getattr(value_type, "json_data", None),
+                            "im_func", None)
+        if json_data is JsonRecord.json_data.im_func:
+            encoder = _make_to_json_encoder(
+                value_type, extraneous, merge_unknown=True,
+            )
+        elif json_data is JsonRecordList.json_data.im_func or \
+                not hasattr(value_type, "json_data"):
+            encoder = _to_json_encoder(value_type, extraneous)
+        else:
+            def encoder(x):
+                return _call_json_data(x, extraneous)
+        encoders[value_type] = encoder
+    return encoder
+
+
 def to_json(record, extraneous=True):
     """JSON marshall out function: a 'visitor' function which implements
     marshall out, honoring JSON property types/hints but does not require
@@ -167,46 +1160,274 @@ def to_json(record, extraneous=True):
             This parameter is passed through to any ``json_data()`` methods
             which support it.
     """
-    if isinstance(record, Collection):
-        return list(_json_data(x, extraneous) for x in record)
-
-    elif isinstance(record, Record):
-        rv_dict = {}
-        for propname, prop in type(record).properties.iteritems():
-            if not extraneous and prop.extraneous:
-                pass
-            elif not hasattr(prop, "json_name") or prop.json_name is not None:
-                json_name = getattr(prop, "json_name", prop.name)
+    extraneous = bool(extraneous)
+    if type(record) in _json_scalars:
+        return record
+    encoder = to_json_encoders[extraneous].get(type(record), None)
+    if encoder is None:
+        encoder = _to_json_encoder(type(record), extraneous)
+    return encoder(record)
+
+
+def _json_small_record(record_type, hooks, seen=frozenset()):
+    """Returns true if nothing large can be in the JSON of a record of
+    ``record_type``: no property which is written out may hold a
+    collection, list or dictionary, or a record which might.  Types which
+    can contain themselves might nest without limit, so are not small."""
+    if record_type in seen:
+        return False
+    seen = seen | frozenset((record_type,))
+    for prop in record_type.properties.itervalues():
+        if getattr(prop, "json_name", True) is None:
+            continue
+        if not prop.valuetype:
+            return False
+        valuetypes = prop.valuetype if isinstance(prop.valuetype, tuple) \
+            else (prop.valuetype,)
+        for value_type in valuetypes:
+            if issubclass(value_type, (Collection, list, dict)):
+                return False
+            if not issubclass(value_type, Record):
+                continue
+            json_data = getattr(value_type, "json_data", None)
+            if hooks and json_data is not None and \
+                    json_data.im_func is not JsonRecord.json_data.im_func:
+                return False
+            if not _json_small_record(value_type, hooks, seen):
+                return False
+    return True
+
+
+def _json_stream_kind(value_type, hooks):
+    """Returns how :py:func:`iterencode` should write values of exactly
+    ``value_type``; this follows :py:func:`_json_encoder` if ``hooks`` is
+    set, otherwise :py:func:`_to_json_encoder`."""
+    kind = None
+    if hooks:
+        json_data = getattr(getattr(value_type, "json_data", None),
+                            "im_func", None)
+        if json_data is JsonRecord.json_data.im_func:
+            kind = "merged record"
+        elif json_data is not JsonRecordList.json_data.im_func and \
+                hasattr(value_type, "json_data"):
+            return "json_data"
+    if issubclass(value_type, Collection):
+        return "list"
+    elif issubclass(value_type, Record):
+        if _json_small_record(value_type, hooks):
+            # nothing large can be inside, so write it in one go
+            return "small"
+        return "merged record" if kind == "merged record" else "record"
+    elif issubclass(value_type, long):
+        return "long"
+    elif issubclass(value_type, dict):
+        return "dict"
+    elif issubclass(value_type, (list, tuple, set, frozenset)):
+        return "list"
+    elif issubclass(value_type, (basestring, int, float, types.NoneType)):
+        return "scalar"
+    else:
+        raise TypeError(
+            "I don't know how to marshall a %s to JSON" %
+            value_type.__name__
+        )
+
+
+def iterencode(record, extraneous=True, sort_keys=False,
+               separators=(", ", ": ")):
+    """Generator which returns the JSON text for ``record`` in pieces, for
+    :py:func:`dump` or for writing to a socket.  The text is the same as
+    ``json.dumps(to_json(record, extraneous), ...)`` would return, but
+    without either the intermediate JSON data or the complete string ever
+    being built for the whole structure.  Collections, lists and
+    dictionaries are written out an item at a time, as are records with
+    properties which could hold them; other records, and the JSON data
+    returned by any custom ``json_data()`` methods, are written out in one
+    go.
+
+    args:
+        ``record=``\ *anything*
+            The value to write out, as for :py:func:`to_json`
+
+        ``extraneous=``\ *BOOL*
+            Passed through to ``json_data()`` methods, as for
+            :py:func:`to_json`
+
+        ``sort_keys=``\ *BOOL*
+        ``separators=``\ *(STR, STR)*
+            As for ``json.dumps``
+    """
+    extraneous = bool(extraneous)
+    item_sep, key_sep = separators
+    encoder = json.JSONEncoder(sort_keys=sort_keys, separators=separators)
+    encode = encoder.encode
+    kinds = dict()
+    record_fields = dict()
+
+    def json_key(key):
+        if isinstance(key, basestring):
+            return key
+        elif isinstance(key, (int, long, float, types.NoneType)):
+            return encode(key)
+        raise TypeError("key %r is not a string" % (key,))
+
+    def stream_items(items):
+        """items are (key, value, raw) tuples; raw values are JSON data
+        which does not need converting first."""
+        if sort_keys:
+            items = sorted(items, key=lambda item: item[0])
+        yield "{"
+        first = True
+        for key, value, raw in items:
+            if first:
+                first = False
+            else:
+                yield item_sep
+            yield encode(json_key(key))
+            yield key_sep
+            for chunk in (encoder.iterencode(value) if raw else
+                          stream(value, True)):
+                yield chunk
+        yield "}"
+
+    def stream(value, hooks):
+        if type(value) in _json_scalars:
+            yield encode(value)
+            return
+        kind = kinds.get((type(value), hooks), None)
+        if kind is None:
+            kind = kinds[type(value), hooks] = _json_stream_kind(
+                type(value), hooks,
+            )
+
+        if kind == "list":
+            yield "["
+            first = True
+            for item in value:
+                if first:
+                    first = False
+                else:
+                    yield item_sep
+                for chunk in stream(item, True):
+                    yield chunk
+            yield "]"
+
+        elif kind in ("record", "merged record"):
+            fields = record_fields.get((type(value), kind), None)
+            if fields is None:
+                fields = record_fields[type(value), kind] = _json_out_fields(
+                    type(value), extraneous, kind == "merged record",
+                )
+            read, get, merge_unknown, pending = fields
+            items = list()
+            instance_dict = value.__dict__
+            for propname, json_name, to_json_val in read:
+                if propname in instance_dict:
+                    val = instance_dict[propname]
+                    items.append((
+                        json_name, to_json_val(val) if to_json_val else val,
+                        False,
+                    ))
+            if pending and type(instance_dict) is _LazyJsonDict:
+                json_values = instance_dict.pending
+                items.extend(
+                    (json_name, json_values[propname], True)
+                    for propname, json_name in pending
+                    if propname in json_values and
+                    propname not in instance_dict
+                )
+            for getter, json_name, to_json_val in get:
                 try:
-                    val = prop.__get__(record)
+                    val = getter(value)
                 except AttributeError:
                     pass
                 else:
-                    if hasattr(prop, "to_json"):
-                        val = prop.to_json(val)
-                    rv_dict[json_name] = _json_data(val, extraneous)
+                    items.append((
+                        json_name, to_json_val(val) if to_json_val else val,
+                        False,
+                    ))
+            if merge_unknown:
+                unknown = getattr(value, "unknown_json_keys", None)
+                if unknown:
+                    seen = set(item[0] for item in items)
+                    items.extend(
+                        (k, v, True) for k, v in unknown.iteritems()
+                        if k not in seen
+                    )
+            for chunk in stream_items(items):
+                yield chunk
 
-        return rv_dict
+        elif kind == "dict":
+            for chunk in stream_items(
+                (k, v, False) for k, v in value.iteritems()
+            ):
+                yield chunk
 
-    elif isinstance(record, long):
-        return str(record) if abs(record) > 2**50 else record
+        elif kind == "small":
+            yield encode(_json_data(value, extraneous) if hooks else
+                         to_json(value, extraneous))
 
-    elif isinstance(record, dict):
-        return dict(
-            (k, _json_data(v, extraneous)) for k, v in record.iteritems()
-        )
+        elif kind == "json_data":
+            for chunk in encoder.iterencode(
+                _call_json_data(value, extraneous)
+            ):
+                yield chunk
 
-    elif isinstance(record, (list, tuple, set, frozenset)):
-        return list(_json_data(x, extraneous) for x in record)
+        elif kind == "long":
+            yield encode(str(value) if abs(value) > 2**50 else value)
 
-    elif isinstance(record, (basestring, int, float, types.NoneType)):
-        return record
+        else:
+            yield encode(value)
 
-    else:
-        raise TypeError(
-            "I don't know how to marshall a %s to JSON" %
-            type(record).__name__
-        )
+    return stream(record, False)
+
+
+def dump(record, fp, extraneous=True, sort_keys=False,
+         separators=(", ", ": "), buffer_size=65536):
+    """Writes the JSON form of ``record`` to the file-like object ``fp``,
+    using :py:func:`iterencode`; the text is written in pieces of about
+    ``buffer_size`` characters.  Other arguments are as for
+    :py:func:`iterencode`."""
+    buf = list()
+    size = 0
+    for chunk in iterencode(record, extraneous, sort_keys, separators):
+        buf.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            fp.write("".join(buf))
+            buf = list()
+            size = 0
+    if buf:
+        fp.write("".join(buf))
+
+
+def dump_jsonl(records, fp, extraneous=True, sort_keys=False,
+               separators=(", ", ": "), buffer_size=65536):
+    """Writes records to a file as `JSON lines <http://jsonlines.org/>`_,
+    one line per record, in the form they would take as members of a
+    ``JsonRecordList`` (ie, via their ``json_data()`` method where they
+    have one).  ``records`` may be any iterable, such as a collection or
+    the result of :py:func:`load_jsonl`; it is read one record at a time,
+    and the output written in pieces of about ``buffer_size`` characters.
+    Other arguments are as for :py:func:`iterencode`.
+    """
+    extraneous = bool(extraneous)
+    encode = json.JSONEncoder(
+        sort_keys=sort_keys, separators=separators,
+    ).encode
+    buf = list()
+    size = 0
+    for record in records:
+        line = encode(_json_data(record, extraneous))
+        buf.append(line)
+        buf.append("\n")
+        size += len(line) + 1
+        if size >= buffer_size:
+            fp.write("".join(buf))
+            buf = list()
+            size = 0
+    if buf:
+        fp.write("".join(buf))
 
 
 class JsonRecord(Record):
@@ -221,8 +1442,37 @@ class JsonRecord(Record):
     2. Unknown keys are permitted, and saved in the "unknown_json_keys"
        property, which is merged back on output (ie, calling ``.json_data()``
        or ``to_json()``)
+
+    The ``unknown_json_keys_mode`` class attribute says what is saved there
+    when the JSON data was passed in already loaded (JSON which is parsed
+    from a string is never copied, as nothing else refers to it):
+
+    ``"copy"``
+        a deep copy of the values, so the record never shares anything
+        with the data it was made from (the default)
+
+    ``"share"``
+        the values themselves; cheapest, but changing them changes the
+        original data, and vice-versa
+
+    ``"cow"``
+        copy-on-write views of the values (see
+        :py:mod:`normalize.record.cow`), which are only copied as far as
+        they are read
+
+    If the class sets ``__lazy_json__ = True``, records made from JSON keep
+    the JSON values of their properties, and only convert (and check) each
+    one the first time it is read.  Properties which are never read are
+    written back out by ``json_data()`` and ``to_json()`` exactly as they
+    came in.  Lazy properties, defaults and ``unknown_json_keys`` are dealt
+    with straight away, and records made with keyword arguments,
+    ``trusted=True`` or a ``select=`` projection are not lazy.  Errors in
+    the JSON values of deferred properties are only raised when they are
+    read.
     """
     unknown_json_keys = JsonProperty(json_name=None, extraneous=True)
+    unknown_json_keys_mode = "copy"
+    __lazy_json__ = False
 
     def __init__(self, json_data=None, **kwargs):
         """Build a new JsonRecord sub-class.
@@ -235,6 +1485,11 @@ class JsonRecord(Record):
                 ``json_to_initkwargs`` should be overridden to handle
                 the unpacking differently
 
+            ``select=``\ *MultiFieldSelector*
+                Keyword only.  Only convert the selected parts of
+                ``json_data``; see :py:func:`from_json`.  (If the class has
+                a property called ``select``, this sets that instead)
+
             ``**kwargs``
                 ``JsonRecord`` instances may also be constructed by
                 passing in attribute initializers in keyword form.  The
@@ -244,11 +1499,85 @@ class JsonRecord(Record):
         if isinstance(json_data, OhPickle):
             return
         if isinstance(json_data, basestring):
-            json_data = json.loads(json_data)
+            # nothing else refers to the parsed data, so it can be shared
+            return _with_unknown_keys_mode(
+                "share", JsonRecord.__init__, self, json.loads(json_data),
+                **kwargs
+            )
+        select = None
+        if "select" not in type(self).properties:
+            select = kwargs.pop("select", None)
         if json_data is not None:
+            if not kwargs:
+                fill = _json_decoder(type(self))
+                if fill and select is not None:
+                    return _fill_selected(self, json_data, select)
+                elif fill:
+                    return fill(self, json_data)
             kwargs = type(self).json_to_initkwargs(json_data, kwargs)
+            if select is not None:
+                kwargs = dict(
+                    (k, v) for k, v in kwargs.iteritems() if k in select
+                )
         super(JsonRecord, self).__init__(**kwargs)
 
+    def __getattr__(self, name):
+        """Converts the JSON value of a property of a ``__lazy_json__``
+        record the first time it is read"""
+        instance_dict = self.__dict__
+        if type(instance_dict) is _LazyJsonDict and \
+                name in instance_dict.pending:
+            _, _, json_in, convert, prop = _json_fields_by_name(
+                type(self)
+            )[name]
+            val = instance_dict.pending[name]
+            if json_in:
+                val = json_in(val)
+            if convert:
+                val = convert(val)
+            prop.init_prop(self, val)
+            del instance_dict.pending[name]
+            return getattr(self, name)
+        prop = type(self).properties.get(name, None)
+        if prop is not None:
+            raise AttributeError(prop.fullname)
+        raise AttributeError(
+            "'%s' object has no attribute '%s'" % (type(self).__name__, name)
+        )
+
+    def __delattr__(self, name):
+        """Drops the JSON value of a property of a ``__lazy_json__`` record
+        which has not been read yet, without converting it"""
+        instance_dict = self.__dict__
+        if type(instance_dict) is _LazyJsonDict and \
+                name in instance_dict.pending and name not in instance_dict:
+            prop = type(self).properties[name]
+            if prop.required:
+                raise ValueError("%s is required" % prop.fullname)
+            del instance_dict.pending[name]
+            changed(self)
+            return
+        super(JsonRecord, self).__delattr__(name)
+
+    def json_materialize(self):
+        """Converts all of the JSON values a ``__lazy_json__`` record is
+        still holding.  This is done before the record is pickled or printed
+        with ``repr()``."""
+        instance_dict = self.__dict__
+        if type(instance_dict) is _LazyJsonDict:
+            for name in list(instance_dict.pending):
+                getattr(self, name, None)
+
+    def __getstate__(self):
+        if type(self.__dict__) is _LazyJsonDict:
+            self.json_materialize()
+            return dict(self.__dict__)
+        return super(JsonRecord, self).__getstate__()
+
+    def __repr__(self):
+        self.json_materialize()
+        return super(JsonRecord, self).__repr__()
+
     @classmethod
     def json_to_initkwargs(self, json_data, kwargs):
         """Subclassing hook to specialize how JSON data is converted
@@ -272,6 +1601,8 @@ class JsonRecord(Record):
 
         2. the ``unknown_json_keys`` property on this class is replaced by one
            not marked as ``extraneous``
+
+        The values of the unknown keys are returned as they are, not copied.
         """
         jd = to_json(self, extraneous)
         if hasattr(self, "unknown_json_keys"):
@@ -312,6 +1643,10 @@ class JsonRecordList(RecordList, JsonRecord):
             ``json_data=``\ *LIST|other*
                 JSON data (string or already ``json.loads``'d)
 
+            ``select=``\ *MultiFieldSelector*
+                Keyword only.  Only convert the selected members, and parts
+                of them; see :py:func:`from_json`
+
             ``**kwargs``
                 Other initializer attributes, for lists with extra
                 attributes (eg, paging information)
@@ -319,9 +1654,22 @@ class JsonRecordList(RecordList, JsonRecord):
         if isinstance(json_data, OhPickle):
             return
         if isinstance(json_data, basestring):
-            json_data = json.loads(json_data)
+            return _with_unknown_keys_mode(
+                "share", JsonRecordList.__init__, self,
+                json.loads(json_data), **kwargs
+            )
+        select = None
+        if "select" not in type(self).properties:
+            select = kwargs.pop("select", None)
         if json_data is not None:
-            kwargs = type(self).json_to_initkwargs(json_data, kwargs)
+            if select is not None and kwargs.get('values', None) is None \
+                    and not _overridden(type(self), "json_to_initkwargs",
+                                        JsonRecordList):
+                kwargs['values'] = _json_list_selected(
+                    type(self).itemtype, json_data, select,
+                )
+            else:
+                kwargs = type(self).json_to_initkwargs(json_data, kwargs)
         super(JsonRecordList, self).__init__(**kwargs)
 
     @classmethod
@@ -17,10 +17,221 @@
 
 from __future__ import absolute_import
 
+import collections
+
 import normalize.exc as exc
+from normalize.property import changed
 from normalize.property import Property
 
 
+class _SlotDict(collections.MutableMapping):
+    """A view of the slots of a compact ``Record`` which looks like the
+    instance ``__dict__`` of a regular one, so that
+    :py:class:`normalize.property.Property` descriptors work unchanged.
+    """
+    __slots__ = ("obj", "slots")
+
+    def __init__(self, obj, slots):
+        self.obj = obj
+        self.slots = slots
+
+    def __getitem__(self, key):
+        try:
+            return self.slots[key].__get__(self.obj)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self.slots[key].__set__(self.obj, value)
+
+    def __delitem__(self, key):
+        try:
+            self.slots[key].__delete__(self.obj)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        slot = self.slots.get(key, None)
+        if slot is None:
+            return False
+        try:
+            slot.__get__(self.obj)
+        except AttributeError:
+            return False
+        return True
+
+    def __iter__(self):
+        for key in self.slots:
+            if key in self:
+                yield key
+
+    def __len__(self):
+        return sum(1 for x in self)
+
+    def __reduce__(self):
+        """Pickles (and copies) as a plain ``dict``"""
+        return (dict, (dict(self.iteritems()),))
+
+
+class _SlotDictDescriptor(object):
+    """Installed as ``__dict__`` on compact ``Record`` classes"""
+    def __init__(self):
+        self.slots = {}
+
+    def __get__(self, obj, type_=None):
+        if obj is None:
+            return self
+        return _SlotDict(obj, self.slots)
+
+
+class _FastReadDescriptor(object):
+    """Installed on ``__fast_read__`` classes in place of properties which
+    are data descriptors.  This is not a data descriptor, so once the
+    property is set, reads find the value in the instance ``__dict__``
+    without calling any python code.  Writes are passed on to the property
+    by the class' ``__setattr__``; see :py:func:`_make_setattr`.
+    """
+    __slots__ = ("prop",)
+
+    def __init__(self, prop):
+        self.prop = prop
+
+    def __get__(self, obj, type_=None):
+        if obj is None:
+            return self.prop
+        raise AttributeError(self.prop.fullname)
+
+
+def _fast_read_ok(prop):
+    """Returns true if the property may be read directly from the instance
+    dictionary; ie, it is a data descriptor with the stock getter (which
+    excludes lazy properties)"""
+    return hasattr(prop, "__set__") and (
+        type(prop).__get__.im_func is Property.__get__.im_func
+    )
+
+
+def _make_setattr(record_type, plain_props, fast_props):
+    """Returns ``__setattr__`` and ``__delattr__`` methods for a compact
+    ``Record`` class with properties which are not data descriptors (eg,
+    unsafe and lazy properties), or a ``__fast_read__`` class.  Assignments
+    to plain properties normally go straight into the instance ``__dict__``;
+    for compact classes, these methods store the value in the property's
+    slot instead.  They are not tracked (see
+    :py:attr:`normalize.record.Record.__pk__`), so other classes get no
+    ``__setattr__``.
+
+    ``fast_props`` are the properties which were replaced by
+    :py:class:`_FastReadDescriptor` on ``__fast_read__`` classes; writes and
+    deletes are passed to the property's ``__set__`` and ``__delete__``
+    methods, so they are checked as usual.
+
+    These are not installed if the class defines (or inherits) its own
+    ``__setattr__``; eg, :py:class:`normalize.record.FrozenRecord`.  A
+    ``__delattr__`` defined by the class itself is also kept (eg,
+    :py:class:`normalize.record.json.JsonRecord`); sub-classes still get a
+    generated one, which ends up calling it.
+    """
+    slot_dict = record_type.__dict__.get('__dict__', None)
+    slots = (
+        slot_dict.slots if isinstance(slot_dict, _SlotDictDescriptor) else
+        None
+    )
+    plain = frozenset(plain_props)
+    fast = dict(fast_props)
+
+    def __setattr__(self, name, value):
+        prop = fast.get(name, None)
+        if prop is not None:
+            return prop.__set__(self, value)
+        if name in plain and slots is not None:
+            return slots[name].__set__(self, value)
+        super(record_type, self).__setattr__(name, value)
+
+    def __delattr__(self, name):
+        prop = fast.get(name, None)
+        if prop is not None:
+            if hasattr(prop, "__delete__"):
+                return prop.__delete__(self)
+            changed(self)
+        elif name in plain and slots is not None:
+            return slots[name].__delete__(self)
+        super(record_type, self).__delattr__(name)
+
+    __setattr__._generated = __delattr__._generated = True
+    return __setattr__, __delattr__
+
+
+SLOT_PREFIX = "_slot_"
+
+
+def _inherits_generic_init(record_type):
+    """Returns the root ``Record`` class if every ``__init__`` which
+    ``record_type`` inherits is either the generic ``Record.__init__`` or one
+    made by :py:func:`_make_init`, otherwise ``None``.  Classes which define
+    their own constructor (eg, ``JsonRecord`` or collections) are left
+    alone."""
+    for klass in record_type.__mro__[1:]:
+        init = klass.__dict__.get("__init__", None)
+        if init is None:
+            continue
+        if not isinstance(klass, RecordMeta):
+            return None
+        if not any(isinstance(base, RecordMeta) for base in klass.__bases__):
+            return klass
+        if not getattr(init, "_generated", False):
+            return None
+
+
+def _make_init(record_type, root):
+    """Returns a constructor specialized for ``record_type``.  The property
+    lookups and set of eager properties are resolved once, here, instead of
+    on every construction.  It behaves exactly the same as the generic
+    :py:meth:`normalize.record.Record.__init__`; instances of sub-classes
+    are passed along to the next constructor in their MRO, eventually arriving
+    at the generic version.
+    """
+    from normalize.record import _init_caches
+    from normalize.record import OhPickle
+    properties = record_type.properties
+    typename = record_type.__name__
+    init_funcs = dict(
+        (propname, prop.init_prop) for propname, prop in
+        properties.iteritems()
+    )
+    eager_funcs = tuple(
+        (propname, properties[propname].init_prop) for propname in
+        sorted(record_type.eager_properties)
+    )
+
+    def __init__(self, init_dict=None, **kwargs):
+        if self.__class__ is not record_type:
+            return super(record_type, self).__init__(init_dict, **kwargs)
+        _init_caches(self, None)
+        if init_dict:
+            if isinstance(init_dict, OhPickle):
+                return
+            if kwargs:
+                raise exc.AmbiguousConstruction()
+        else:
+            init_dict = kwargs
+        for propname, val in init_dict.iteritems():
+            init_prop = init_funcs.get(propname, None)
+            if init_prop is None:
+                raise exc.PropertyNotKnown(
+                    propname=propname,
+                    typename=typename,
+                )
+            init_prop(self, val)
+        for propname, init_prop in eager_funcs:
+            if propname not in init_dict:
+                init_prop(self)
+
+    __init__.__doc__ = root.__dict__['__init__'].__doc__
+    __init__._generated = True
+    return __init__
+
+
 class RecordMeta(type):
     """Metaclass for ``Record`` types.
     """
@@ -31,6 +242,27 @@ class RecordMeta(type):
         :py:meth:`normalize.property.Property.bind` to link
         :py:class:`normalize.property.Property` instances to their containing
         :py:class:`normalize.record.Record` classes.
+
+        If the class sets ``__compact__ = True`` (or derives a compact
+        class), property values are stored in ``__slots__`` rather than an
+        instance ``__dict__``.  This uses less memory per instance, but
+        attribute access is slower, and the class may not be given attributes
+        which are not properties.  All base classes must define
+        ``__slots__``.
+
+        Unless the class (or one of its bases) defines its own ``__init__``,
+        a constructor specialized for the class' properties is also
+        installed; see :py:func:`_make_init`.
+
+        If the class sets ``__fast_read__ = True`` (or derives such a class),
+        then properties which are data descriptors (eg, safe and read-only
+        properties) are replaced in the class by non-data descriptors, so that
+        reading a set attribute is a plain instance dictionary lookup.
+        Assignments are still checked, by a ``__setattr__`` which calls the
+        property setter.  Lazy properties, and properties with their own
+        getter, are left alone.  Classes which define their own
+        ``__setattr__`` must do this themselves; writing to the instance
+        ``__dict__`` skips all checks.  Compact classes can't use this mode.
         """
         properties = dict()
 
@@ -86,9 +318,93 @@ class RecordMeta(type):
             k for k, v in properties.iteritems() if v.eager_init()
         )
 
+        compact_bases = list(
+            base for base in bases if getattr(base, "__compact__", False)
+        )
+        compact = attrs.get('__compact__', bool(compact_bases))
+        if compact_bases and not compact:
+            raise exc.CompactRecordSubclass(
+                typename=name,
+                basename=compact_bases[0].__name__,
+            )
+        if compact:
+            for base in bases:
+                for klass in base.__mro__:
+                    if klass is not object and \
+                            '__slots__' not in klass.__dict__:
+                        raise exc.CompactRecordBaseHasDict(
+                            typename=name,
+                            basename=klass.__name__,
+                        )
+            attrs['__compact__'] = True
+            attrs['__slots__'] = tuple(attrs.get('__slots__', ())) + tuple(
+                SLOT_PREFIX + propname for propname in sorted(properties)
+                if not any(
+                    hasattr(base, SLOT_PREFIX + propname) for base in bases
+                )
+            )
+            attrs['__dict__'] = _SlotDictDescriptor()
+
+        fast_read = attrs.get('__fast_read__', any(
+            getattr(base, "__fast_read__", False) for base in bases
+        ))
+        if fast_read and compact:
+            raise exc.FastReadCompactRecord(typename=name)
+
         self = super(RecordMeta, mcs).__new__(mcs, name, bases, attrs)
 
         for propname, prop in local_props.iteritems():
             prop.bind(self, propname)
 
+        if compact:
+            slot_dict = attrs['__dict__']
+            for klass in reversed(self.__mro__):
+                slot_dict.slots.update(
+                    (slotname[len(SLOT_PREFIX):], klass.__dict__[slotname])
+                    for slotname in klass.__dict__.get('__slots__', ())
+                    if slotname.startswith(SLOT_PREFIX)
+                )
+
+        fast_props = list()
+        for propname, prop in properties.iteritems():
+            fast = fast_read and _fast_read_ok(prop)
+            found = None
+            for klass in self.__mro__:
+                if propname in klass.__dict__:
+                    found = klass.__dict__[propname]
+                    break
+            if fast and found is prop:
+                setattr(self, propname, _FastReadDescriptor(prop))
+            elif not fast and isinstance(found, _FastReadDescriptor):
+                setattr(self, propname, prop)
+            if fast:
+                fast_props.append((propname, prop))
+
+        plain_props = list(
+            k for k, v in properties.iteritems() if not hasattr(v, "__set__")
+        )
+        own_setattr = any(
+            not getattr(klass.__dict__['__setattr__'], "_generated", False)
+            for klass in self.__mro__ if
+            klass is not object and '__setattr__' in klass.__dict__
+        )
+        # assignments to plain properties are not tracked, so primary keys
+        # which read them are not cached
+        self._volatile_pk = not own_setattr and any(
+            not hasattr(prop, "__set__") for prop in
+            (self.primary_key or self._sorted_properties)
+        )
+        if ((plain_props and compact) or fast_props) and not own_setattr:
+            setattr_, delattr_ = _make_setattr(
+                self, plain_props, fast_props,
+            )
+            self.__setattr__ = setattr_
+            if '__delattr__' not in attrs:
+                self.__delattr__ = delattr_
+
+        if '__init__' not in attrs:
+            root = _inherits_generic_init(self)
+            if root:
+                self.__init__ = _make_init(self, root)
+
         return self
@@ -20,6 +20,7 @@ import collections
 import types
 
 from normalize.coll import Collection
+from normalize.coll import SetCollection
 import normalize.exc as exc
 from normalize.record import Record
 from normalize.selector import FieldSelector
@@ -230,14 +231,14 @@ class VisitorPattern(object):
                     generator = value_type.coll_to_tuples(value)
                 else:
                     raise exc.VisitorUnpackError(
-                        value=repr(value),
+                        value=value,
                         colltype=value_type.colltype.__name__,
                         fs=visitor.field_selector,
                     )
         else:
             generator = None
 
-        return (lambda prop: prop.__get__(value)), generator
+        return (lambda prop: getattr(value, prop.name)), generator
 
     @classmethod
     def apply(cls, value, prop, visitor):
@@ -295,7 +296,12 @@ class VisitorPattern(object):
 
             ``visitor=``\ *Visitor*
                 Context/options object
+
+        Set collections are keyed by the identity of their items, which the
+        mapped values no longer have; these are returned as a list.
         """
+        if issubclass(coll_type, SetCollection):
+            return list(v for k, v in mapped_coll_generator)
         return coll_type.tuples_to_coll(mapped_coll_generator, coerce=False)
 
     @classmethod
@@ -402,7 +408,7 @@ class VisitorPattern(object):
 
         if is_record and not isinstance(value, cls.grok_mapping_types):
             raise exc.VisitorGrokRecordError(
-                val=repr(value),
+                val=value,
                 record_type=value_type,
                 record_type_name=value_type.__name__,
                 field_selector=visitor.field_selector,
@@ -420,7 +426,7 @@ class VisitorPattern(object):
         if is_coll:
             if not isinstance(values, cls.grok_coll_types):
                 raise exc.VisitorGrokCollectionError(
-                    val=repr(values),
+                    val=values,
                     record_type=value_type,
                     record_type_name=value_type.__name__,
                     field_selector=visitor.field_selector,
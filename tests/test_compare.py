@@ -21,12 +21,14 @@ from datetime import datetime
 import unittest
 
 from normalize.coll import Collection
+from normalize.coll import DictCollection
 from normalize.diff import *
 from normalize.record import Record
 from normalize.record.json import JsonRecord
 from normalize.property import Property
 from normalize.property import SafeProperty
 from normalize.property.coll import ListProperty
+from normalize.property.coll import SetProperty
 from testclasses import *
 
 
@@ -40,6 +42,7 @@ class TestRecordComparison(unittest.TestCase):
         self.bill = Person(id=123, name="Bill", age=34)
         self.bob2 = Person(id=124, name="Bob", age=36)
         self.bob1a = Person(id=123, name="Bob", age=32, kids=1)
+        self.minimal_person = Person(id=7, name="Min")
 
     def assertDifferences(self, iterator, expected):
         differences = set(str(x) for x in iterator)
@@ -262,6 +265,25 @@ class TestRecordComparison(unittest.TestCase):
             expected_a_to_b
         )
 
+        # the primary key indexes are kept between diffs, and do not
+        # replace the collection's own
+        pk_index = circle_a.members.pk_index()
+        diff_index = circle_a.members.pk_index(
+            DiffOptions().record_id, DiffOptions().record_id_key(),
+        )
+        self.assertDifferences(
+            compare_collection_iter(circle_a.members, circle_b.members),
+            expected_a_to_b
+        )
+        self.assertIs(circle_a.members.pk_index(), pk_index)
+        self.assertIs(circle_a.members.pk_index(
+            DiffOptions().record_id, DiffOptions().record_id_key(),
+        ), diff_index)
+        self.assertIsNot(circle_a.members.pk_index(
+            DiffOptions(ignore_case=True).record_id,
+            DiffOptions(ignore_case=True).record_id_key(),
+        ), diff_index)
+
         sparta = list()
         for member in circle_b.members:
             sparta.append(Spartan(member.__getstate__()))
@@ -290,6 +312,112 @@ class TestRecordComparison(unittest.TestCase):
             ), {},
         )
 
+    def test_diff_dict_collection(self):
+        """Test diff'ing of DictCollections, which compares items by key"""
+        class PersonMap(DictCollection):
+            itemtype = Person
+
+        class Club(Record):
+            members = Property(isa=PersonMap)
+
+        club_a = Club(members={"b": self.bob1, "x": self.bob2,
+                               "y": self.bill})
+        club_b = Club(members={"b": self.bill, "x": self.bob2,
+                               "z": self.bob1})
+        self.assertIsInstance(club_a.members["b"], Person)
+        self.assertIn("y", club_a.members)
+        self.assertNotIn(self.bill, club_a.members)
+        self.assertEqual(sorted(club_b.members.keys()), ["b", "x", "z"])
+        self.assertEqual(club_b.members.get("z"), self.bob1)
+
+        expected = {
+            "MODIFIED .members.b.name",
+            "MODIFIED .members.b.age",
+            "REMOVED .members.y",
+            "ADDED .members.z",
+        }
+        self.assertDifferences(club_a.diff_iter(club_b), expected)
+        self.assertDifferences(
+            compare_collection_iter(
+                club_a.members, club_b.members,
+                options=DiffOptions(unchanged=True),
+            ),
+            {"MODIFIED .b.name", "MODIFIED .b.age", "REMOVED .y",
+             "ADDED .z", "UNCHANGED .b.id", "UNCHANGED .x.id",
+             "UNCHANGED .x.name",
+             "UNCHANGED .x.age", "UNCHANGED .x"},
+        )
+        self.assertDifferences(
+            compare_collection_iter(
+                club_a.members, club_b.members,
+                options=DiffOptions(compare_filter=[["b", "age"], ["z"]]),
+            ),
+            {"MODIFIED .b.age", "ADDED .z"},
+        )
+
+        club_b.members["y"] = dict(id=123, name="Bill", age=34)
+        del club_b.members["z"]
+        self.assertIsInstance(club_b.members["y"], Person)
+        self.assertDifferences(
+            club_a.diff_iter(club_b),
+            {"MODIFIED .members.b.name", "MODIFIED .members.b.age"},
+        )
+        self.assertEqual(
+            repr(club_b.members),
+            "PersonMap({'b': %r, 'x': %r, 'y': %r})" % (
+                self.bill, self.bob2, self.bill,
+            ),
+        )
+
+        class MovingPersonMap(PersonMap):
+            diff_by_key = False
+
+        # matched by primary key, so moving items is not a difference
+        moved = dict((k.upper(), v) for k, v in club_a.members.items())
+        self.assertDifferences(
+            compare_collection_iter(
+                MovingPersonMap(club_a.members), MovingPersonMap(moved),
+            ), {},
+        )
+        self.assertDifferences(
+            compare_collection_iter(club_a.members, PersonMap(moved)),
+            {"REMOVED .b", "REMOVED .x", "REMOVED .y",
+             "ADDED ['B']", "ADDED ['X']", "ADDED ['Y']"},
+        )
+
+    def test_diff_set_collection(self):
+        """Test diff'ing of SetCollections, which matches items by key"""
+        class Team(Record):
+            players = SetProperty(of=Person)
+
+        team_a = Team(players=[self.bob1, self.bob2, self.minimal_person])
+        team_b = Team(players=[self.bill, Person(id=125, name="Bert"),
+                               self.minimal_person])
+        # positions in the primary keys of both sets: 7, 123, 124, 125
+        self.assertDifferences(
+            team_a.diff_iter(team_b),
+            {"MODIFIED .players[1].name", "MODIFIED .players[1].age",
+             "REMOVED .players[2]", "ADDED .players[3]"},
+        )
+        self.assertDifferences(
+            compare_collection_iter(
+                team_a.players, team_b.players,
+                options=DiffOptions(unchanged=True),
+            ),
+            {"MODIFIED [1].name", "MODIFIED [1].age", "REMOVED [2]",
+             "ADDED [3]", "UNCHANGED [0].id", "UNCHANGED [0].name",
+             "UNCHANGED [1].id", "UNCHANGED [0]"},
+        )
+        keys = sorted(set(team_a.players.values) | set(team_b.players.values))
+        self.assertIs(team_a.players.get_by_pk(keys[2]), self.bob2)
+        self.assertEqual(team_b.players.get_by_pk(keys[3]).name, "Bert")
+        self.assertDifferences(
+            compare_set_iter(team_a.players, team_a.players), (),
+        )
+        self.assertDifferences(
+            team_a.diff_iter(Team()), {"REMOVED .players"},
+        )
+
     def test_empty_slots_empty_records(self):
 
         class Nullable(Record):
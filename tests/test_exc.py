@@ -14,7 +14,12 @@
 # http://github.com/hearsaycorp/normalize
 #
 
+import ast
+import os
+import re
+import string
 import unittest2
+
 import normalize.exc as exc
 
 
@@ -40,10 +45,81 @@ class TestExceptionSystem(unittest2.TestCase):
         with self.assertRaises(IndexError):
             te[1]
 
+        # formatting is not done until needed
+        missing_kw = TestException("foo")
+        self.assertRaises(exc.KeywordExceptionFormatError, missing_kw.format)
         self.assertRaises(
-            exc.KeywordExceptionFormatError, TestException, "foo",
+            exc.PositionalExceptionFormatError,
+            TestException(keywords="ok").format,
         )
-        self.assertRaises(
-            exc.PositionalExceptionFormatError, TestException,
-            keywords="ok",
+        self.assertEqual(
+            str(missing_kw),
+            "{keywords} and positionals: {0} (TestException raised "
+            "without passing keywords; saw only: [])",
         )
+
+    def test_lazy_formatting(self):
+        class Unprintable(object):
+            def __repr__(self):
+                raise AssertionError("formatted too soon")
+
+        class Thing(object):
+            fullname = "Thing.prop"
+
+        error = exc.CoerceError(
+            prop=Thing(), value=Unprintable(), exc=ValueError("no"),
+            func=int, valuetype=(int, long),
+        )
+        self.assertIsInstance(error.value, Unprintable)
+        error.kwargs['value'] = "x"
+        self.assertEqual(
+            str(error),
+            "coerce to (int, long) for Thing.prop failed with value 'x': "
+            "int constructor raised: no",
+        )
+        self.assertIs(error.formatted, error.formatted)
+
+    def test_library_exceptions(self):
+        """Check that every exception raised by the library is passed the
+        arguments its message needs.  This used to be checked every time
+        an exception was raised."""
+        formatter = string.Formatter()
+        fields = {}
+        for name, cls in vars(exc).items():
+            if isinstance(cls, type) and \
+                    issubclass(cls, exc.StringFormatException):
+                parsed = list(
+                    x[1] for x in formatter.parse(cls.message) if x[1]
+                )
+                names = set(re.match(r"\w*", x).group(0) for x in parsed)
+                self.assertNotIn("", names, "%s takes positional "
+                                 "arguments" % name)
+                fields[name] = names
+
+        calls = 0
+        package = os.path.dirname(exc.__file__)
+        for dirpath, dirnames, filenames in os.walk(package):
+            for filename in filenames:
+                if not filename.endswith(".py"):
+                    continue
+                path = os.path.join(dirpath, filename)
+                with open(path) as fh:
+                    tree = ast.parse(fh.read(), path)
+                for node in ast.walk(tree):
+                    if not (isinstance(node, ast.Call) and
+                            isinstance(node.func, ast.Attribute) and
+                            isinstance(node.func.value, ast.Name) and
+                            node.func.value.id == "exc" and
+                            node.func.attr in fields):
+                        continue
+                    calls += 1
+                    where = "%s:%d" % (path, node.lineno)
+                    self.assertFalse(node.args or node.kwargs, where)
+                    passed = set(kw.arg for kw in node.keywords)
+                    self.assertEqual(
+                        fields[node.func.attr] - passed, set(),
+                        "%s: %s is missing arguments" % (
+                            where, node.func.attr,
+                        ),
+                    )
+        self.assertGreater(calls, 50)
@@ -16,23 +16,39 @@
 
 from __future__ import absolute_import
 
+import copy
+import itertools
 import json
 from os import environ
 import pickle
 import re
+from StringIO import StringIO
 import unittest2
 
 from normalize.diff import compare_record_iter
 from normalize.diff import DiffOptions
+import normalize.exc as exc
 from normalize.record import Record
+from normalize.record.cow import CowList
+from normalize.record.json import dump
+from normalize.record.json import dump_jsonl
 from normalize.record.json import from_json
+from normalize.record.json import iterencode
+from normalize.record.json import iterload
 from normalize.record.json import JsonRecord
 from normalize.record.json import JsonRecordList
+from normalize.record.json import load_jsonl
+from normalize.record.json import parallel_from_json
 from normalize.record.json import to_json
+from normalize.property import LazyProperty
 from normalize.property import Property
 from normalize.property import ROProperty
 from normalize.property import SafeProperty
 from normalize.property.coll import ListProperty
+from normalize.property.json import JsonListProperty
+from normalize.property.json import JsonProperty
+from normalize.selector import MultiFieldSelector
+from normalize.visitor import VisitorPattern
 
 
 class CheeseRecord(Record):
@@ -47,6 +63,13 @@ class CheeseCupboardRecord(Record):
     cheeses = ListProperty(of=CheeseRecord)
 
 
+class CompactCheeseRecord(Record):
+    __compact__ = True
+    variety = SafeProperty(isa=str)
+    smelliness = SafeProperty(isa=float, check=lambda x: 0 < x < 100)
+    rind = Property(json_name="crust")
+
+
 json_data_number_types = (basestring, int, long, float)
 
 
@@ -180,6 +203,17 @@ class TestRecordMarshaling(unittest2.TestCase):
             ccr_copy = pickle.loads(pickled)
             self.assertDataOK(ccr_copy)
 
+    def test_compact_marshall(self):
+        """Test marshalling compact records"""
+        json_in = {"variety": "Brie", "smelliness": 20.0, "crust": "white"}
+        cheese = from_json(CompactCheeseRecord, json_in)
+        self.assertEqual(cheese.rind, "white")
+        self.assertEqual(to_json(cheese), json_in)
+        for protocol in range(0, pickle.HIGHEST_PROTOCOL + 1):
+            cheese_copy = pickle.loads(pickle.dumps(cheese, protocol))
+            self.assertEqual(cheese_copy, cheese)
+            self.assertEqual(to_json(cheese_copy), json_in)
+
     def test_json_marshall(self):
         """Test coerce from JSON & marshall out"""
         json_struct = json.dumps(self.primitive)
@@ -197,6 +231,488 @@ class TestRecordMarshaling(unittest2.TestCase):
 
         self.assertJsonDataEqual(json_data, self.primitive)
 
+    def test_trusted_marshall(self):
+        """Test marshalling in with validation skipped"""
+        ccr = from_json(CheeseCupboardRecord, self.primitive, trusted=True)
+        self.assertDataOK(ccr)
+        self.assertEqual(ccr, from_json(CheeseCupboardRecord, self.primitive))
+        self.assertIsInstance(ccr.cheeses[0], CheeseRecord)
+
+        self.primitive['best_cheese']['smelliness'] = "120"
+        ccr = from_json(CheeseCupboardRecord, self.primitive, trusted=True)
+        self.assertEqual(ccr.best_cheese.smelliness, 120.0)
+        with self.assertRaises(ValueError):
+            from_json(CheeseCupboardRecord, self.primitive)
+
+        class TrustedCCR(JsonRecord, CheeseCupboardRecord):
+            pass
+
+        self.primitive['shelf'] = "top"
+        ccr = from_json(TrustedCCR, json.dumps(self.primitive), trusted=True)
+        self.assertEqual(ccr.unknown_json_keys, {"shelf": "top"})
+        self.assertEqual(ccr.name, "Fridge")
+        self.assertEqual(ccr.best_cheese.smelliness, 120.0)
+
+    def test_compiled_decoder(self):
+        """Test that the per-class JSON decoders match the constructor"""
+        class JsonCheese(JsonRecord):
+            variety = Property(isa=str)
+            age = Property(isa=int, json_name="age_days", default=0)
+            label = Property(isa=str, json_in=lambda x: x.upper())
+
+        class JsonCupboard(JsonRecord):
+            name = Property(isa=str)
+            best = Property(isa=JsonCheese)
+            cheeses = ListProperty(of=JsonCheese)
+
+        json_in = {
+            "name": "Fridge",
+            "best": {"variety": "Stilton", "label": "blue", "ripe": True},
+            "cheeses": [{"variety": "Gouda", "age_days": 30}],
+            "shelf": {"top": ["jam"]},
+        }
+        cupboard = JsonCupboard(json_in)
+        self.assertEqual(cupboard, from_json(JsonCupboard, json_in))
+        self.assertEqual(cupboard, JsonCupboard(
+            **JsonCupboard.json_to_initkwargs(json_in, {})
+        ))
+        self.assertEqual(cupboard.best.label, "BLUE")
+        self.assertEqual(cupboard.best.age, 0)
+        self.assertEqual(cupboard.best.unknown_json_keys, {"ripe": True})
+        self.assertEqual(cupboard.cheeses[0].age, 30)
+        self.assertEqual(cupboard.unknown_json_keys, {"shelf": {"top": ["jam"]}})
+        self.assertIsNot(cupboard.unknown_json_keys["shelf"], json_in["shelf"])
+        self.assertJsonDataEqual(cupboard.json_data(extraneous=True), {
+            "name": "Fridge",
+            "best": {"variety": "Stilton", "label": "BLUE", "age_days": 0,
+                     "ripe": True},
+            "cheeses": [{"variety": "Gouda", "age_days": 30}],
+            "shelf": {"top": ["jam"]},
+        })
+
+        with self.assertRaises(ValueError):
+            JsonCupboard({"best": {"age_days": "old"}})
+        with self.assertRaises(TypeError):
+            from_json(CheeseRecord, ["Gouda"])
+
+        # types which customize loading still get their hooks called
+        class FussyCheese(JsonCheese):
+            def __init__(self, json_data=None, **kwargs):
+                self.fussed = True
+                super(FussyCheese, self).__init__(json_data, **kwargs)
+
+        class RenamingCheese(JsonCheese):
+            @classmethod
+            def json_to_initkwargs(cls, json_data, kwargs):
+                json_data = dict(json_data, variety=json_data.pop("kind"))
+                return super(RenamingCheese, cls).json_to_initkwargs(
+                    json_data, kwargs,
+                )
+
+        class FussyCupboard(JsonCupboard):
+            best = Property(isa=FussyCheese)
+            cheeses = ListProperty(of=RenamingCheese)
+
+        cupboard = FussyCupboard({
+            "best": {"variety": "Brie"},
+            "cheeses": [{"kind": "Edam"}],
+        })
+        self.assertTrue(cupboard.best.fussed)
+        self.assertEqual(cupboard.cheeses[0].variety, "Edam")
+        self.assertTrue(from_json(FussyCheese, {"variety": "Brie"}).fussed)
+
+        # defaults which read other properties see all of the JSON fields
+        class Shout(Record):
+            a = Property()
+            b = Property(default=lambda self: self.z + "!")
+            z = Property()
+
+        class JsonShout(JsonRecord):
+            a = Property()
+            b = Property(default=lambda self: self.z + "!")
+            z = Property()
+
+        self.assertEqual(from_json(Shout, {"z": "hi", "a": 1}).b, "hi!")
+        self.assertEqual(JsonShout({"z": "hi"}).b, "hi!")
+
+    def test_compiled_encoder(self):
+        """Test that the per-class JSON encoders match the json_data rules"""
+        class Wrapped(object):
+            def __init__(self, value):
+                self.value = value
+
+            def json_data(self):
+                return {"wrapped": self.value}
+
+        class Tagged(Wrapped):
+            def json_data(self, extraneous=False):
+                return {"tagged": self.value, "all": extraneous}
+
+        class JsonPart(JsonRecord):
+            name = Property(isa=str)
+            secret = Property(isa=str, extraneous=True)
+
+        class JsonMachine(JsonRecord):
+            name = Property(isa=str, json_name="title",
+                            json_out=lambda x: x.title())
+            serial = Property(isa=long)
+            parts = ListProperty(of=JsonPart)
+            hidden = Property(json_name=None, default="x")
+            label = LazyProperty(default=lambda self: self.name + "!")
+            wrapped = Property(isa=Wrapped)
+            tagged = Property(isa=Tagged)
+            extra = Property()
+
+        machine = JsonMachine(
+            name="loom", serial=2**60, unknown_json_keys={"color": "red"},
+            parts=[JsonPart(name="shuttle", secret="s",
+                            unknown_json_keys={"age": 3})],
+            wrapped=Wrapped(1), tagged=Tagged(2),
+        )
+        self.assertEqual(to_json(machine), {
+            "title": "Loom", "serial": str(2**60), "label": "loom!",
+            "parts": [{"name": "shuttle", "secret": "s", "age": 3}],
+            "wrapped": {"wrapped": 1}, "tagged": {"tagged": 2, "all": True},
+        })
+        self.assertEqual(machine.json_data(), {
+            "title": "Loom", "serial": str(2**60), "label": "loom!",
+            "parts": [{"name": "shuttle"}],
+            "wrapped": {"wrapped": 1}, "tagged": {"tagged": 2, "all": False},
+        })
+        self.assertEqual(
+            machine.json_data(extraneous=True)["color"], "red",
+        )
+        self.assertEqual(to_json(machine.parts, extraneous=False),
+                         [{"name": "shuttle"}])
+        self.assertEqual(to_json({"a": (1, long(2**51))}),
+                         {"a": [1, str(2**51)]})
+
+        class Opaque(object):
+            pass
+
+        with self.assertRaisesRegexp(TypeError, "marshall a Opaque"):
+            to_json(JsonMachine(extra=Opaque()))
+
+    def test_streaming_encoder(self):
+        """Test writing JSON out in pieces"""
+        pulled = []
+
+        class Counted(object):
+            def __init__(self, value):
+                self.value = value
+
+            def json_data(self):
+                pulled.append(self.value)
+                return {"counted": self.value}
+
+        class JsonPart(JsonRecord):
+            name = Property(isa=str, json_name="part_name")
+            secret = Property(isa=str, extraneous=True)
+            size = Property(isa=long, json_out=lambda x: x * 2)
+            extra = Property()
+
+        class JsonPartList(JsonRecordList):
+            itemtype = JsonPart
+
+        parts = JsonPartList(
+            {"part_name": "cog %d" % i, "secret": "s", "size": i,
+             "note": [i, {"x": None}]} for i in range(20)
+        )
+        parts[3].extra = {1: (Counted(1), 2.5), "k": [True, u"\u2603"]}
+        cheese = CheeseRecord(variety="Brie", smelliness=12.5)
+        for value in (parts, parts[3], [parts[0], {"a": parts}], 2**60,
+                      u"snow \u2603", None, cheese, [cheese, parts[1]]):
+            for extraneous in (True, False):
+                self.assertEqual(
+                    "".join(iterencode(value, extraneous, sort_keys=True)),
+                    json.dumps(to_json(value, extraneous), sort_keys=True),
+                )
+        self.assertEqual(
+            json.loads("".join(iterencode(parts[3], separators=(",", ":")))),
+            json.loads(json.dumps(to_json(parts[3]))),
+        )
+
+        buf = StringIO()
+        dump(parts, buf, buffer_size=100)
+        self.assertEqual(json.loads(buf.getvalue()),
+                         json.loads(json.dumps(to_json(parts))))
+
+        # values are only converted as they are written out
+        counted = [Counted(i) for i in range(1000)]
+        del pulled[:]
+        chunks = iterencode(counted)
+        self.assertEqual("".join(itertools.islice(chunks, 8)),
+                         '[{"counted": 0}, {')
+        self.assertEqual(pulled, [0, 1])
+
+        # including when they are in a list in a nested record
+        class Inner(Record):
+            items = Property(isa=list)
+
+        class Outer(Record):
+            inner = Property(isa=Inner)
+            name = Property(isa=str)
+
+        outer = Outer(inner=Inner(items=counted), name="o")
+        del pulled[:]
+        chunks = iterencode(outer, sort_keys=True)
+        self.assertTrue("".join(itertools.islice(chunks, 14)).startswith(
+            '{"inner": {"items": [{"counted": 0}, {',
+        ))
+        self.assertLess(len(pulled), 10)
+        self.assertEqual("".join(iterencode(outer, sort_keys=True)),
+                         json.dumps(to_json(outer), sort_keys=True))
+
+        with self.assertRaisesRegexp(TypeError, "marshall a object"):
+            list(iterencode({"foo": object()}))
+
+    def test_incremental_decoder(self):
+        """Test reading a JSON array a record at a time"""
+        class JsonCheese(JsonRecord):
+            variety = Property(isa=str)
+            smelliness = Property(isa=float, check=lambda x: 0 < x < 100)
+            ages = ListProperty(of=int)
+
+        cheeses = list(
+            {"variety": "cheese %d" % i, "smelliness": i + 0.25,
+             "ages": range(i % 4), "rind": {"i": [i] * i}}
+            for i in range(1, 50)
+        )
+        text = json.dumps(cheeses, indent=2)
+        wanted = list(JsonCheese(x) for x in cheeses)
+        for chunk_size in (1, 7, 10000):
+            self.assertEqual(
+                list(iterload(JsonCheese, StringIO(text),
+                              chunk_size=chunk_size)),
+                wanted,
+            )
+
+        batches = list(iterload(JsonCheese, StringIO(text), batch_size=20))
+        self.assertEqual(list(len(x) for x in batches), [20, 20, 9])
+        self.assertIsInstance(batches[0], JsonRecordList)
+        self.assertEqual(batches[2][0], wanted[40])
+
+        records = iterload(CheeseRecord, StringIO(
+            '[{"variety": "Gouda", "smelliness": 12}, {"smelliness": 120}]'
+        ))
+        self.assertEqual(next(records).smelliness, 12.0)
+        with self.assertRaises(ValueError):
+            next(records)
+        records = iterload(CheeseRecord, StringIO(
+            ' [ {"smelliness": 120} ] '
+        ), trusted=True)
+        self.assertEqual(list(records),
+                         [CheeseRecord.trusted(smelliness=120.0)])
+
+        self.assertEqual(list(iterload(CheeseRecord, StringIO("[ ]"))), [])
+        for bad in ("", "{}", "[{}", "[{}, ]", "[{} {}]", "[1e5]"):
+            with self.assertRaises(Exception):
+                list(iterload(CheeseRecord, StringIO(bad), chunk_size=1))
+
+        # a malformed element is reported without reading to the end
+        for bad in ('{"smelliness": 1 "variety": "Brie"}', '{"a": [1}',
+                    '{"variety": "Stil\ton"}', 'Gouda', '{"a": 1, }'):
+            fp = StringIO("[%s, %s]" % (bad, text[1:-1]))
+            records = iterload(CheeseRecord, fp, chunk_size=16)
+            with self.assertRaises(ValueError):
+                next(records)
+            self.assertLess(fp.tell(), 100)
+
+        # errors give the position in the input, not the buffer
+        bad = "[%s%s]" % (
+            '{"variety": "Gouda"},\n' * 40,
+            '{"smelliness": 1 "variety": "Brie"}',
+        )
+        where = bad.index('"variety": "Brie"')
+        for chunk_size in (1, 7, 10000):
+            with self.assertRaisesRegexp(
+                ValueError, r"^Expecting , delimiter: char %d$" % where,
+            ):
+                list(iterload(CheeseRecord, StringIO(bad),
+                              chunk_size=chunk_size))
+
+        # only whitespace may follow the array
+        self.assertEqual(len(list(iterload(
+            CheeseRecord, StringIO('[{}]' + ' \n' * 20), chunk_size=3,
+        ))), 1)
+        for extra in ("garbage", "[]", "\n" * 20 + ","):
+            where = len(extra) - len(extra.lstrip()) + 4
+            with self.assertRaisesRegexp(
+                ValueError, r"^Extra data: char %d$" % where,
+            ):
+                list(iterload(CheeseRecord, StringIO('[{}]' + extra),
+                              chunk_size=3))
+
+    def test_parallel_from_json(self):
+        """Test converting JSON documents in worker processes"""
+        docs = list(
+            dict(self.primitive, id=i, name="Fridge %d" % i)
+            for i in range(25)
+        )
+        docs[3] = json.dumps(docs[3])
+        records = list(parallel_from_json(
+            CheeseCupboardRecord, docs, processes=2, chunksize=4,
+        ))
+        self.assertEqual(list(x.id for x in records), range(25))
+        self.assertEqual(records[3].name, "Fridge 3")
+        self.assertEqual(records[20], from_json(CheeseCupboardRecord, docs[20]))
+        self.assertEqual(type(records[1].cheeses),
+                         type(CheeseCupboardRecord(docs[1]).cheeses))
+
+        docs[7]["best_cheese"]["smelliness"] = 120
+        with self.assertRaisesRegexp(ValueError, "smelliness value '120"):
+            list(parallel_from_json(CheeseCupboardRecord, docs, processes=2))
+        records = list(parallel_from_json(
+            CheeseCupboardRecord, docs, processes=2, trusted=True,
+        ))
+        self.assertEqual(records[7].best_cheese.smelliness, 120)
+
+    def test_generic_pickle(self):
+        """Test unpickling collections where the generic type is not made"""
+        from normalize.coll import GENERIC_TYPES
+        cheeses = CheeseCupboardRecord(self.primitive).cheeses
+        generic_type = type(cheeses)
+        pickled = pickle.dumps(cheeses, pickle.HIGHEST_PROTOCOL)
+        del GENERIC_TYPES[generic_type.generic_key]
+        try:
+            copy = pickle.loads(pickled)
+            self.assertIsNot(type(copy), generic_type)
+            self.assertEqual(type(copy).__name__, generic_type.__name__)
+            self.assertEqual(copy.values, cheeses.values)
+        finally:
+            GENERIC_TYPES[generic_type.generic_key] = generic_type
+
+    def test_projection(self):
+        """Test decoding only the fields selected by a MultiFieldSelector"""
+        class JsonAuthor(JsonRecord):
+            id = Property(isa=int, required=True)
+            name = Property(isa=str)
+            email = Property(isa=str, check=lambda x: "@" in x)
+
+        class JsonComment(JsonRecord):
+            text = Property(isa=str)
+            author = Property(isa=JsonAuthor)
+
+        class RenamedAuthor(JsonAuthor):
+            @classmethod
+            def json_to_initkwargs(cls, json_data, kwargs):
+                json_data = dict(
+                    ("name" if k == "handle" else k, v)
+                    for k, v in json_data.iteritems()
+                )
+                return super(RenamedAuthor, cls).json_to_initkwargs(
+                    json_data, kwargs,
+                )
+
+        class JsonArticle(JsonRecord):
+            id = Property(isa=int, required=True)
+            title = Property(isa=str, json_name="headline")
+            body = Property(isa=str)
+            author = Property(isa=JsonAuthor)
+            editor = Property(isa=RenamedAuthor)
+            comments = ListProperty(of=JsonComment)
+            status = Property(isa=str, default="draft")
+
+        article = {
+            "id": 1, "headline": "Cheese", "body": "It is good.",
+            "author": {"id": 7, "name": "Wallace", "email": "w@example"},
+            "editor": {"id": 8, "handle": "Gromit", "email": "g@example"},
+            "comments": [
+                {"text": "Yes", "author": {"id": 8, "name": "Gromit"}},
+                {"text": "No", "author": {"id": 9, "name": "Preston"}},
+            ],
+            "views": 123,
+        }
+        full = from_json(JsonArticle, article)
+
+        mfs = MultiFieldSelector(
+            ["id"], ["title"], ["author", "id"], ["author", "name"],
+            ["editor", "name"], ["editor", "id"],
+            ["comments", None, "text"],
+        )
+        article_view = from_json(JsonArticle, article, select=mfs)
+        self.assertEqual(article_view, mfs.get(full))
+        self.assertEqual(JsonArticle(article, select=mfs), article_view)
+        self.assertEqual(
+            JsonArticle(json.dumps(article), select=mfs), article_view,
+        )
+        with self.assertRaises(TypeError):
+            JsonArticle(article, mfs)
+        self.assertEqual(article_view.title, "Cheese")
+        self.assertEqual(article_view.editor.name, "Gromit")
+        self.assertEqual(article_view.status, "draft")
+        self.assertFalse(hasattr(article_view, "body"))
+        self.assertFalse(hasattr(article_view.author, "email"))
+        self.assertFalse(hasattr(article_view.comments[0], "author"))
+        self.assertFalse(hasattr(article_view, "unknown_json_keys"))
+        self.assertEqual(to_json(article_view), {
+            "id": 1, "headline": "Cheese", "status": "draft",
+            "author": {"id": 7, "name": "Wallace"},
+            "editor": {"id": 8, "name": "Gromit"},
+            "comments": [{"text": "Yes"}, {"text": "No"}],
+        })
+
+        # unselected branches are not checked, nor required fields filled
+        article["body"] = ["not", "a", "string"]
+        article["author"]["email"] = "nowhere"
+        comment = from_json(JsonArticle, article, select=MultiFieldSelector(
+            ["comments", 1, "author", "name"], ["unknown_json_keys"],
+        ))
+        self.assertEqual(comment.unknown_json_keys, {"views": 123})
+        self.assertEqual(len(comment.comments), 1)
+        self.assertEqual(comment.comments[0].author.name, "Preston")
+        self.assertFalse(hasattr(comment, "id"))
+        with self.assertRaises(ValueError):
+            from_json(JsonArticle, article)
+
+        class JsonCommentList(JsonRecordList):
+            itemtype = JsonComment
+
+        comments = JsonCommentList(
+            article["comments"],
+            select=MultiFieldSelector([None, "author", "id"]),
+        )
+        self.assertEqual(list(x.author.id for x in comments), [8, 9])
+        self.assertFalse(hasattr(comments[0], "text"))
+
+    def test_json_lines(self):
+        """Test reading and writing JSON lines"""
+        class JsonLineCheese(JsonRecord):
+            variety = Property(isa=str)
+            smelliness = Property(isa=float, check=lambda x: 0 < x < 100)
+            best_before = Property(isa=str, json_name="bb")
+
+        cheeses = list(
+            JsonLineCheese({
+                "variety": "cheese\n%d" % i, "smelliness": i + 0.5,
+                "bb": "2015-01-%.2d" % i, "rind": [i],
+            })
+            for i in range(1, 30)
+        )
+        buf = StringIO()
+        dump_jsonl(iter(cheeses), buf, buffer_size=50)
+        lines = buf.getvalue().splitlines()
+        self.assertEqual(len(lines), 29)
+        self.assertEqual(json.loads(lines[4]), cheeses[4].json_data(True))
+
+        self.assertEqual(list(load_jsonl(JsonLineCheese, StringIO(
+            buf.getvalue().replace("\n", "\n\n  \n")
+        ))), cheeses)
+        batches = list(load_jsonl(JsonLineCheese, StringIO(buf.getvalue()),
+                                  batch_size=10, trusted=True))
+        self.assertEqual(list(len(x) for x in batches), [10, 10, 9])
+        self.assertIsInstance(batches[0], JsonRecordList)
+        self.assertEqual(list(itertools.chain(*batches)), cheeses)
+
+        buf = StringIO()
+        dump_jsonl(cheeses[:2], buf, extraneous=False, sort_keys=True)
+        self.assertEqual(buf.getvalue().splitlines()[1], json.dumps(
+            cheeses[1].json_data(), sort_keys=True,
+        ))
+
+        with self.assertRaisesRegexp(ValueError, "line 2"):
+            list(load_jsonl(JsonLineCheese, StringIO('{}\n{"variety": }\n')))
+
     def test_custom_json_prop_marshall(self):
         """Test customizing JSON marshalling using functions"""
 
@@ -355,3 +871,166 @@ class TestRecordMarshaling(unittest2.TestCase):
             nested_record.json_data(extraneous=True),
             nested_input,
         )
+
+    def test_unknown_json_keys_mode(self):
+
+        class CopiedCheese(JsonRecord, CheeseRecord):
+            pass
+
+        class SharedCheese(JsonRecord, CheeseRecord):
+            unknown_json_keys_mode = "share"
+
+        class CowCheese(JsonRecord, CheeseRecord):
+            unknown_json_keys_mode = "cow"
+
+        def cheese_json():
+            return dict(
+                variety="Stilton", smelliness="60",
+                ageing={"caves": [{"name": "Colston"}], "weeks": 9},
+            )
+
+        data = cheese_json()
+        copied = CopiedCheese(data)
+        self.assertIsNot(copied.unknown_json_keys["ageing"], data["ageing"])
+        self.assertEqual(copied.unknown_json_keys["ageing"], data["ageing"])
+
+        shared = SharedCheese(data)
+        self.assertIs(shared.unknown_json_keys["ageing"], data["ageing"])
+        self.assertIs(shared.json_data(extraneous=True)["ageing"],
+                      data["ageing"])
+
+        cow = CowCheese(data)
+        ageing = cow.unknown_json_keys["ageing"]
+        self.assertEqual(ageing, data["ageing"])
+        ageing["caves"][0]["name"] = "Cropwell Bishop"
+        ageing["caves"].append({"name": "Hartington"})
+        ageing["weeks"] = 12
+        self.assertEqual(data, cheese_json())
+        self.assertEqual(
+            json.loads(json.dumps(cow.json_data(extraneous=True))),
+            dict(variety="Stilton", smelliness=60.0, ageing={
+                "caves": [{"name": "Cropwell Bishop"},
+                          {"name": "Hartington"}],
+                "weeks": 12,
+            }),
+        )
+        self.assertEqual(
+            pickle.loads(pickle.dumps(ageing)),
+            {"caves": [{"name": "Cropwell Bishop"}, {"name": "Hartington"}],
+             "weeks": 12},
+        )
+
+        # a container which appears twice is copied once, for both places
+        cave = {"name": "Colston"}
+        caves = [cave, cave, [cave]]
+        view = CowList(caves)
+        view[0]["name"] = "Cropwell Bishop"
+        self.assertIs(view[1], view[0])
+        view[1]["name"] = "Hartington"
+        self.assertEqual(cave, {"name": "Colston"})
+        self.assertEqual(view[0], {"name": "Hartington"})
+        doubled = CowList(caves) * 2
+        doubled[3]["name"] = "Hartington"
+        doubled[2][0]["name"] = "Hartington"
+        self.assertEqual(cave, {"name": "Colston"})
+        view = CowList(caves)
+        view *= 2
+        view[4]["name"] = "Hartington"
+        self.assertEqual(caves, [cave, cave, [cave]])
+        self.assertEqual(cave, {"name": "Colston"})
+
+        # per call, also for the trusted decoder
+        for trusted in (False, True):
+            shared = from_json(CopiedCheese, data, trusted=trusted,
+                               unknown_json_keys_mode="share")
+            self.assertIs(shared.unknown_json_keys["ageing"], data["ageing"])
+        copied = from_json(SharedCheese, data, unknown_json_keys_mode="copy")
+        self.assertIsNot(copied.unknown_json_keys["ageing"], data["ageing"])
+
+        with self.assertRaises(exc.UnknownJsonKeysModeInvalid):
+            from_json(CopiedCheese, data, unknown_json_keys_mode="alias")
+
+    def test_lazy_json(self):
+
+        class LazyComment(JsonRecord):
+            __lazy_json__ = True
+            id = JsonProperty(isa=int, required=True)
+            body = JsonProperty(isa=str, json_name="text")
+            score = JsonProperty(isa=float, check=lambda x: x >= 0)
+            tags = JsonListProperty(of=str)
+            flagged = JsonProperty(isa=bool, default=False)
+            words = LazyProperty(default=lambda self: len(self.body.split()))
+
+        class LazyThread(JsonRecord):
+            __lazy_json__ = True
+            title = JsonProperty(isa=str)
+            comments = JsonListProperty(of=LazyComment)
+
+        comment_json = {"id": "7", "text": "nice cheese", "score": "1.5",
+                        "tags": ["a", "b"], "via": "web"}
+        comment = from_json(LazyComment, comment_json)
+        # nothing converted yet, except defaults and unknown keys
+        self.assertEqual(sorted(comment.__dict__),
+                         ["flagged", "unknown_json_keys"])
+        self.assertEqual(comment.json_data(extraneous=True),
+                         dict(comment_json, flagged=False, words=2))
+        self.assertEqual(comment.id, 7)
+        self.assertEqual(comment.__dict__["id"], 7)
+
+        class LazyShout(JsonRecord):
+            __lazy_json__ = True
+            a = JsonProperty()
+            b = JsonProperty(default=lambda self: self.z + "!")
+            z = JsonProperty()
+
+        self.assertEqual(LazyShout({"z": "hi"}).b, "hi!")
+        self.assertEqual(comment.words, 2)
+        self.assertEqual(
+            comment.json_data(),
+            {"id": 7, "text": "nice cheese", "score": "1.5",
+             "tags": ["a", "b"], "flagged": False, "words": 2},
+        )
+        self.assertEqual(comment, LazyComment(comment_json))
+        self.assertEqual(
+            repr(comment),
+            "LazyComment(body='nice cheese', flagged=False, id=7, "
+            "score=1.5, tags=strList(['a', 'b']), unknown_json_keys="
+            "{'via': 'web'}, words=2)",
+        )
+        copied = copy.deepcopy(LazyComment(json.dumps(comment_json)))
+        self.assertIs(type(copied.__dict__), dict)
+        self.assertEqual(copied.score, 1.5)
+        self.assertEqual(list(copied.tags), ["a", "b"])
+
+        # values are checked when read
+        bad = LazyComment({"id": 1, "score": -1})
+        self.assertEqual(bad.id, 1)
+        with self.assertRaises(exc.CheckFailed):
+            bad.score
+        with self.assertRaises(AttributeError):
+            bad.body
+
+        # assigning or deleting replaces the JSON value
+        comment = LazyComment(comment_json)
+        comment.body = "smelly"
+        del comment.score
+        self.assertEqual(comment.json_data(), {
+            "id": "7", "text": "smelly", "tags": ["a", "b"],
+            "flagged": False, "words": 1,
+        })
+        self.assertFalse(hasattr(comment, "score"))
+
+        thread_json = {"title": "Cheese", "comments": [comment_json] * 3}
+        thread = LazyThread(thread_json)
+        self.assertEqual(thread.json_data(extraneous=True), thread_json)
+        self.assertEqual(thread.comments[1].id, 7)
+        streamed = json.loads("".join(iterencode(thread)))
+        self.assertEqual(streamed, to_json(thread))
+        self.assertEqual(
+            [(x["id"], x["score"], x["words"]) for x in streamed["comments"]],
+            [("7", "1.5", 2), (7, "1.5", 2), ("7", "1.5", 2)],
+        )
+        comment = LazyComment(dict(comment_json, tags=None))
+        visited = VisitorPattern.visit(comment)
+        self.assertEqual(visited["body"], "nice cheese")
+        self.assertEqual(visited["score"], 1.5)
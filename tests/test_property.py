@@ -18,15 +18,24 @@
 
 from __future__ import absolute_import
 
+import copy
 import re
 import types
 import unittest2
 
 from normalize import RecordList
+from normalize.coll import _classproperty
+from normalize.coll import _KeyIndex
+from normalize.coll import DictCollection
 from normalize.coll import ListCollection
+from normalize.coll import SetCollection
 import normalize.exc as exc
 from normalize.identity import record_id
+from normalize.index import HashIndex
+from normalize.index import SortedIndex
+from normalize.record import FrozenRecord
 from normalize.record import Record
+from normalize.record.json import JsonRecord
 from normalize.property import LazyProperty
 from normalize.property import LazySafeProperty
 from normalize.property import make_property_type
@@ -35,9 +44,12 @@ from normalize.property import ROLazyProperty
 from normalize.property import ROProperty
 from normalize.property import SafeProperty
 from normalize.property.coll import ListProperty
+from normalize.property.coll import SetProperty
+from normalize.property.json import JsonProperty
 from normalize.property.meta import create_property_type_from_traits
 from normalize.property.meta import _merge_camel_case_names
 from normalize.property.meta import MetaProperty
+from normalize.visitor import VisitorPattern
 
 
 class TestProperties(unittest2.TestCase):
@@ -472,3 +484,782 @@ class TestProperties(unittest2.TestCase):
         with self.assertRaisesRegexp(TypeError, r"'yo_momma' of Property"):
             Property(yo_momma="so fat, when she sits around the house, "
                               "she really SITS AROUND THE HOUSE")
+
+    def test_generated_init(self):
+        """Test that the constructor made by RecordMeta behaves like the
+        generic one"""
+        class Widget(Record):
+            id = Property(required=True, isa=int)
+            label = Property(isa=str, default="unlabelled")
+            size = Property(isa=int)
+
+        self.assertTrue(getattr(Widget.__init__, "_generated", False))
+
+        widget = Widget(id=1)
+        self.assertEqual(widget.label, "unlabelled")
+        self.assertNotIn("size", widget.__dict__)
+        self.assertEqual(Widget({"id": 2, "size": 3}).size, 3)
+
+        with self.assertRaises(ValueError):
+            Widget(label="no id")
+        with self.assertRaisesRegexp(exc.PropertyNotKnown, r"colour"):
+            Widget(id=1, colour="red")
+        with self.assertRaises(exc.AmbiguousConstruction):
+            Widget({"id": 1}, size=2)
+        with self.assertRaises(exc.CoerceError):
+            Widget(id="one")
+
+        generic = Widget.__new__(Widget)
+        Record.__init__(generic, id=1)
+        self.assertEqual(generic.__dict__, widget.__dict__)
+
+        class Gadget(Widget):
+            def __init__(self, **kwargs):
+                kwargs.setdefault("size", 10)
+                super(Gadget, self).__init__(**kwargs)
+
+            colour = Property(default="grey")
+
+        self.assertFalse(getattr(Gadget.__init__, "_generated", False))
+        gadget = Gadget(id=4)
+        self.assertEqual(gadget.size, 10)
+        self.assertEqual(gadget.colour, "grey")
+        self.assertEqual(gadget.label, "unlabelled")
+
+        class Sprocket(Gadget):
+            pass
+
+        self.assertFalse(getattr(Sprocket.__init__, "_generated", False))
+        self.assertEqual(Sprocket(id=5).size, 10)
+
+    def test_compact(self):
+        """Test Records which keep their values in __slots__"""
+        class Compact(Record):
+            __compact__ = True
+            id = Property(required=True, isa=int)
+            name = Property()
+            double = LazyProperty(default=lambda self: self.id * 2)
+            primary_key = [id]
+
+        compact = Compact(id=3, name="Trois")
+        self.assertFalse(hasattr(compact, "__weakref__"))
+        self.assertEqual(sorted(compact.__dict__), ["id", "name"])
+        self.assertEqual(compact.double, 6)
+        self.assertEqual(compact.__dict__["double"], 6)
+        compact.name = "Drei"
+        compact.double = 7
+        self.assertEqual(compact.double, 7)
+        del compact.double
+        self.assertEqual(compact.double, 6)
+        with self.assertRaises(AttributeError):
+            compact.nickname = "Tri"
+        self.assertEqual(repr(compact), "Compact(double=6, id=3, name='Drei')")
+        self.assertEqual(compact, eval(repr(compact)))
+        self.assertEqual(hash(compact), hash(Compact(id=3)))
+
+        thawed = copy.deepcopy(compact)
+        self.assertEqual(dict(thawed.__dict__), dict(compact.__dict__))
+
+        class MoreCompact(Compact):
+            colour = Property(isa=str)
+
+        self.assertEqual(MoreCompact.__slots__, ("_slot_colour",))
+        more = MoreCompact(id=1, colour="red")
+        self.assertEqual(
+            list(str(x) for x in more.diff(MoreCompact(id=1, colour="blue"))),
+            ["<DiffInfo: MODIFIED .colour>"],
+        )
+
+        with self.assertRaises(exc.CompactRecordSubclass):
+            class NotCompact(Compact):
+                __compact__ = False
+
+        class Roomy(Record):
+            name = Property()
+
+        with self.assertRaises(exc.CompactRecordBaseHasDict):
+            class Squashed(Roomy):
+                __compact__ = True
+
+    def test_pk_cache(self):
+        """Test that primary keys are cached, and invalidated by changes to
+        the record or records within it"""
+        seq = [0]
+
+        def _next_age():
+            seq[0] += 1
+            return seq[0]
+
+        class Leaf(Record):
+            name = SafeProperty()
+            colour = SafeProperty(isa=str)
+            age = LazySafeProperty(default=_next_age)
+
+        class Branch(Record):
+            leaf = SafeProperty(isa=Leaf)
+            leaves = ListProperty(of=Leaf)
+
+        leaf = Leaf(name="oak", colour="green")
+        branch = Branch(leaf=leaf, leaves=[Leaf(name="elm")])
+        pk = branch.__pk__
+        self.assertEqual(record_id(branch), pk)
+        self.assertIs(branch.__pk__, pk)
+        self.assertEqual(hash(branch), hash(pk))
+
+        # changes to other records do not affect it
+        other = Leaf(name="ivy", colour="green")
+        other.colour = "red"
+        Branch(leaf=other).leaf = Leaf(name="box")
+        self.assertIs(branch.__pk__, pk)
+
+        for change in (
+            lambda: setattr(leaf, "colour", "brown"),
+            lambda: delattr(leaf, "colour"),
+            lambda: setattr(leaf, "name", "ash"),
+            lambda: delattr(leaf, "age"),
+            lambda: branch.leaves.append(Leaf(name="yew")),
+            lambda: setattr(branch.leaves[0], "name", "fir"),
+        ):
+            before = branch.__pk__
+            change()
+            self.assertEqual(branch.__pk__, record_id(branch))
+            self.assertNotEqual(branch.__pk__, before)
+
+        # assignments to unsafe and lazy properties are not tracked, so
+        # keys which read them are worked out each time
+        class Bud(Record):
+            name = Property()
+            age = LazyProperty(default=_next_age)
+
+        class Twig(Record):
+            primary_key = ["leaf"]
+            leaf = SafeProperty(isa=Leaf)
+            bud = SafeProperty(isa=Bud)
+            note = Property()
+
+        self.assertTrue(Bud._volatile_pk)
+        self.assertFalse(Twig._volatile_pk)
+        self.assertNotIn("__setattr__", Bud.__dict__)
+        self.assertNotIn("__setattr__", Twig.__dict__)
+        bud = Bud(name="oak")
+        twig = Twig(leaf=leaf, bud=bud, note="x")
+        pk = twig.__pk__
+        twig.note = "y"
+        self.assertIs(twig.__pk__, pk)
+        pk = bud.__pk__
+        self.assertIsNot(bud.__pk__, pk)
+        bud.name = "ash"
+        self.assertEqual(bud.__pk__, record_id(bud))
+        self.assertNotEqual(bud.__pk__, pk)
+        del bud.age
+        self.assertEqual(hash(bud), hash(record_id(bud)))
+
+        class BudTwig(Record):
+            bud = SafeProperty(isa=Bud)
+
+        bud_twig = BudTwig(bud=bud)
+        pk = bud_twig.__pk__
+        self.assertIsNot(bud_twig.__pk__, pk)
+        bud.name = "elm"
+        self.assertNotEqual(bud_twig.__pk__, pk)
+
+        # records in untyped properties, and in compact records, which
+        # only cache keys that depend on nothing else
+        class Vase(Record):
+            flower = Property()
+
+        class Pot(Record):
+            __compact__ = True
+            leaf = Property(isa=Leaf)
+            name = Property(isa=str)
+
+        vase = Vase(flower=leaf)
+        pot = Pot(leaf=leaf)
+        before = hash(vase), pot.__pk__, hash(pot)
+        leaf.colour = "gold"
+        self.assertNotEqual(hash(vase), before[0])
+        self.assertNotEqual(pot.__pk__, before[1])
+        self.assertNotEqual(hash(pot), before[2])
+        self.assertEqual(hash(vase), hash(record_id(vase)))
+        pot = Pot(name="terracotta")
+        self.assertIs(pot.__pk__, pot.__pk__)
+
+    def test_frozen(self):
+        """Test immutable records, and evolving them"""
+        class Stem(FrozenRecord):
+            length = Property(isa=int)
+
+        class Flower(FrozenRecord):
+            name = Property(isa=str, required=True)
+            stem = Property(isa=Stem)
+            petals = Property(isa=int, default=5)
+            title = LazyProperty(default=lambda self: self.name.title())
+
+        rose = Flower(name="rose", stem=Stem(length=30))
+        self.assertEqual(rose.title, "Rose")
+        with self.assertRaisesRegexp(
+            exc.ReadOnlyAttributeError, r"Flower.name is read-only",
+        ):
+            rose.name = "thorny"
+        with self.assertRaises(exc.ReadOnlyAttributeError):
+            del rose.petals
+        with self.assertRaises(exc.ReadOnlyAttributeError):
+            rose.scent = "sweet"
+        with self.assertRaises(exc.ReadOnlyAttributeError):
+            rose.stem.length = 10
+
+        self.assertIs(rose.__pk__, rose.__pk__)
+        self.assertEqual(hash(rose), hash(Flower(name="rose", stem=Stem(length=30))))
+        self.assertEqual(len(set([rose, copy.deepcopy(rose)])), 1)
+
+        tulip = rose.evolve(name="tulip", petals="6")
+        self.assertEqual(tulip.petals, 6)
+        self.assertIs(tulip.stem, rose.stem)
+        self.assertEqual(tulip.title, "Tulip")
+        self.assertEqual(rose.name, "rose")
+        self.assertNotEqual(hash(tulip), hash(rose))
+        self.assertEqual(rose.evolve(), rose)
+        with self.assertRaises(exc.PropertyNotKnown):
+            rose.evolve(colour="red")
+        with self.assertRaises(exc.CoerceError):
+            rose.evolve(petals="many")
+
+    def test_trusted(self):
+        """Test construction which skips validation"""
+        import normalize.record
+
+        class Tally(Record):
+            count = Property(isa=int, check=lambda x: x >= 0, required=True)
+            label = Property(isa=str, default="tally")
+            marks = ListProperty(of=int)
+
+        class IntList(RecordList):
+            itemtype = int
+
+        tally = Tally.trusted(count=-1, marks=IntList([1, 2]))
+        self.assertEqual(tally.count, -1)
+        self.assertEqual(tally.label, "tally")
+        self.assertEqual(list(tally.marks), [1, 2])
+        self.assertEqual(Tally.trusted({"count": 3}), Tally(count=3))
+
+        with self.assertRaisesRegexp(ValueError, r"Tally.count is required"):
+            Tally.trusted(label="empty")
+        with self.assertRaises(exc.PropertyNotKnown):
+            Tally.trusted(count=1, colour="red")
+        with self.assertRaises(exc.AmbiguousConstruction):
+            Tally.trusted({"count": 1}, count=1)
+
+        ints = IntList.trusted(["1", 2])
+        self.assertEqual(ints.values, ["1", 2])
+
+        normalize.record.validate_trusted = True
+        try:
+            with self.assertRaises(ValueError):
+                Tally.trusted(count=-1)
+            self.assertEqual(IntList.trusted(["1"]).values, [1])
+        finally:
+            normalize.record.validate_trusted = False
+
+    def test_from_rows(self):
+        """Test the bulk constructors"""
+        class Reading(Record):
+            sensor = Property(isa=str, required=True)
+            value = Property(isa=float, check=lambda x: x >= 0)
+            unit = Property(isa=str, default="C")
+
+        rows = [("a", 1), ("b", "2.5"), ("c", 0)]
+        readings = Reading.from_rows(("sensor", "value"), rows)
+        self.assertIsInstance(readings, ListCollection)
+        self.assertIs(readings.itemtype, Reading)
+        self.assertIs(type(readings), Reading.from_rows((), []).__class__)
+        self.assertEqual(
+            list(readings),
+            [Reading(sensor="a", value=1), Reading(sensor="b", value=2.5),
+             Reading(sensor="c", value=0)],
+        )
+        self.assertEqual(readings[1].unit, "C")
+
+        with self.assertRaises(exc.CoerceError):
+            Reading.from_rows(("sensor", "value"), [("d", "hot")])
+        with self.assertRaises(ValueError):
+            Reading.from_rows(("sensor", "value"), [("d", -1)])
+        with self.assertRaisesRegexp(ValueError, r"Reading.sensor is required"):
+            Reading.from_rows(("value",), [(1,)])
+        with self.assertRaises(exc.PropertyNotKnown):
+            Reading.from_rows(("sensor", "colour"), [])
+        with self.assertRaisesRegexp(
+            exc.RowLengthMismatch, r"row 1 .* has 1 value\(s\); expected 2",
+        ):
+            Reading.from_rows(("sensor", "value"), [("e", 1), ("f",)])
+
+        trusted = Reading.from_rows(
+            ("sensor", "value"), [("g", -1)], trusted=True,
+        )
+        self.assertEqual(trusted[0].value, -1)
+        self.assertEqual(trusted[0].unit, "C")
+
+        columns = Reading.from_columns(
+            {"sensor": ["a", "b", "c"], "value": [1, "2.5", 0]},
+        )
+        self.assertEqual(columns, readings)
+        with self.assertRaises(exc.ColumnLengthMismatch):
+            Reading.from_columns({"sensor": ["a", "b"], "value": [1]})
+
+        # types with their own constructor get the values as keywords
+        class JsonReading(JsonRecord):
+            sensor = JsonProperty(json_name="sensorId")
+            value = JsonProperty(isa=float)
+
+        readings = JsonReading.from_rows(("sensor", "value"), [("a", 1)])
+        self.assertEqual(readings[0], JsonReading(sensor="a", value=1.0))
+        self.assertFalse(hasattr(readings[0], "unknown_json_keys"))
+        columns = JsonReading.from_columns({"sensor": ["a"], "value": [1]})
+        self.assertEqual(columns, readings)
+
+    def test_validators(self):
+        """Test the validators made for each property"""
+        def odd(x):
+            return x % 2 == 1
+
+        def positive_int_or_none(x):
+            return int(x) if int(x) > 0 else None
+
+        class Knobs(Record):
+            anything = Property()
+            present = Property(required=True)
+            odd_any = Property(check=odd)
+            odd_int = Property(isa=int, check=odd)
+            number = Property(isa=(int, float), coerce=positive_int_or_none)
+
+        values = (None, 0, 1, 2, "1", "x", "-3", [])
+        for propname, prop in Knobs.properties.iteritems():
+            for value in values:
+                for none_ok in False, True:
+                    try:
+                        expected = prop.type_safe_value(value, none_ok)
+                    except Exception as e:
+                        with self.assertRaises(type(e)) as ar:
+                            prop.validate(value, none_ok)
+                        self.assertEqual(str(ar.exception), str(e))
+                    else:
+                        got = prop.validate(value, none_ok)
+                        self.assertEqual(got, expected)
+
+        with self.assertRaisesRegexp(
+            exc.CoerceError,
+            r"coerce to \(int, float\) for Knobs.number failed with value "
+            r"'x': <function positive_int_or_none",
+        ):
+            Knobs(present=1, number="x")
+
+        class LoggedProperty(SafeProperty):
+            __trait__ = "logged"
+            logged = []
+
+            def type_safe_value(self, value, _none_ok=False):
+                self.logged.append(value)
+                return super(LoggedProperty, self).type_safe_value(
+                    value, _none_ok,
+                )
+
+        class Logged(Record):
+            num = LoggedProperty(isa=int)
+
+        logged = Logged(num="1")
+        logged.num = 2
+        self.assertEqual(LoggedProperty.logged, ["1", 2])
+
+    def test_fast_read(self):
+        """Test records which read properties from the instance dict"""
+        class Dial(Record):
+            __fast_read__ = True
+            setting = Property(isa=int, check=lambda x: 0 <= x <= 11)
+            name = ROProperty(required=True)
+            note = Property(traits=["unsafe"])
+            label = LazySafeProperty(default=lambda self: self.name.upper())
+            marks = ListProperty(of=int)
+
+        self.assertIs(Dial.setting, Dial.properties['setting'])
+        self.assertEqual(type(Dial.__dict__['setting']).__name__,
+                         "_FastReadDescriptor")
+        self.assertIs(Dial.__dict__['label'], Dial.properties['label'])
+
+        dial = Dial(name="volume", setting="3", marks=[1, "2"])
+        self.assertEqual(dial.setting, 3)
+        self.assertEqual(dial.label, "VOLUME")
+        self.assertEqual(list(dial.marks), [1, 2])
+        dial.setting = "11"
+        self.assertEqual(dial.setting, 11)
+        with self.assertRaises(ValueError):
+            dial.setting = 12
+        with self.assertRaises(exc.CoerceError):
+            dial.setting = "loud"
+        self.assertEqual(dial.setting, 11)
+        with self.assertRaises(exc.ReadOnlyAttributeError):
+            dial.name = "treble"
+        with self.assertRaises(exc.ReadOnlyAttributeError):
+            del dial.name
+        dial.marks = ["3"]
+        self.assertEqual(list(dial.marks), [3])
+
+        del dial.setting
+        with self.assertRaisesRegexp(AttributeError, r"Dial.setting"):
+            dial.setting
+
+        class PlainDial(Dial):
+            __fast_read__ = False
+
+        self.assertIs(PlainDial.__dict__['setting'], Dial.properties['setting'])
+        plain = PlainDial(name="bass", setting=1)
+        with self.assertRaises(ValueError):
+            plain.setting = 12
+
+        class FineDial(Dial):
+            fine = Property(isa=float)
+
+        fine = FineDial(name="fine", fine="0.5")
+        self.assertEqual(type(FineDial.__dict__['fine']).__name__,
+                         "_FastReadDescriptor")
+        with self.assertRaises(exc.CoerceError):
+            fine.fine = "coarse"
+        self.assertEqual(fine.fine, 0.5)
+
+        with self.assertRaises(exc.FastReadCompactRecord):
+            class CompactDial(Record):
+                __fast_read__ = True
+                __compact__ = True
+                setting = Property(isa=int)
+
+    def test_pk_index(self):
+        class Twig(Record):
+            primary_key = ["name"]
+            name = Property(isa=str)
+            colour = Property()
+
+        class Bough(Record):
+            leaves = ListProperty(of=Twig)
+
+        leaves = Bough(leaves=[
+            Twig(name="oak", colour="green"), Twig(name="elm"),
+            Twig(name="oak", colour="brown"),
+        ]).leaves
+        self.assertEqual(leaves.pk_index(), {("oak",): [0, 2], ("elm",): [1]})
+        self.assertIs(leaves.get_by_pk("oak"), leaves[0])
+        self.assertIs(leaves.get_by_pk(("elm",)), leaves[1])
+        self.assertIsNone(leaves.get_by_pk("ash"))
+        self.assertIn(Twig(name="oak", colour="brown"), leaves)
+        self.assertNotIn(Twig(name="oak", colour="red"), leaves)
+        self.assertNotIn(Twig(name="ash"), leaves)
+
+        # the index is updated in place by the collection
+        index = leaves.pk_index()
+        leaves.append(Twig(name="ash"))
+        leaves.extend([Twig(name="elm"), Twig(name="yew")])
+        leaves[0] = Twig(name="fir")
+        del leaves[1]
+        del leaves[-1]
+        self.assertIs(leaves.pk_index(), index)
+        self.assertEqual(index, {
+            ("fir",): [0], ("oak",): [1], ("ash",): [2], ("elm",): [3],
+        })
+        self.assertEqual(index, type(leaves)(leaves).pk_index())
+
+        # and rebuilt if an item changes
+        leaves[1].name = "pine"
+        self.assertIs(leaves.get_by_pk("pine"), leaves[1])
+        self.assertIsNone(leaves.get_by_pk("oak"))
+        del leaves[1:3]
+        self.assertEqual(leaves.pk_index(), {("fir",): [0], ("elm",): [1]})
+        self.assertNotIn("_KeyedCollection__pk_index",
+                         copy.deepcopy(leaves).__dict__)
+
+        # indexes over keys which read unsafe properties aren't kept
+        class Bud(Record):
+            primary_key = ["name"]
+            name = Property()
+
+        class Stem(Record):
+            buds = ListProperty(of=Bud)
+
+        buds = Stem(buds=[Bud(name="oak"), Bud(name="elm")]).buds
+        self.assertIsNot(buds.pk_index(), buds.pk_index())
+        buds[0].name = "ash"
+        self.assertIs(buds.get_by_pk("ash"), buds[0])
+
+        # items which are not records are their own primary key
+        class Counts(Record):
+            counts = ListProperty(of=int)
+
+        counts = Counts(counts=[3, 5, 5]).counts
+        self.assertIn(5, counts)
+        self.assertEqual(counts.get_by_pk(5), 5)
+        self.assertEqual(counts.pk_index().get(5), [1, 2])
+        self.assertIsNone(counts.get_by_pk(4))
+
+    def test_secondary_indexes(self):
+        class Region(Record):
+            name = Property()
+
+        class Shop(Record):
+            primary_key = ["name"]
+            name = Property()
+            region = Property(isa=Region)
+            sales = Property(isa=int)
+
+        class ShopList(RecordList):
+            itemtype = Shop
+            indexes = dict(
+                region=HashIndex(["region", "name"]),
+                sales=SortedIndex("sales"),
+            )
+
+        shops = ShopList(
+            Shop(name=name, region=Region(name=region), sales=sales)
+            for name, region, sales in (
+                ("leeds", "north", 30), ("york", "north", 10),
+                ("bath", "south", 20), ("kent", "south", 40),
+            )
+        )
+        shops.append(Shop(name="nowhere"))
+
+        def names(items):
+            return [x.name for x in items]
+
+        self.assertEqual(names(shops.lookup("region", "north")),
+                         ["leeds", "york"])
+        self.assertEqual(names(shops.lookup("sales", 20)), ["bath"])
+        self.assertEqual(shops.lookup("region", "west"), [])
+        self.assertEqual(names(shops.range("sales", 20, 40)),
+                         ["bath", "leeds"])
+        self.assertEqual(names(shops.range("sales", high=30)),
+                         ["york", "bath"])
+        self.assertEqual(names(shops.range("sales", low=30)),
+                         ["leeds", "kent"])
+        with self.assertRaises(exc.CollectionIndexNotSorted):
+            shops.range("region", "north")
+        with self.assertRaises(exc.CollectionIndexNotFound):
+            shops.lookup("name", "york")
+
+        # changes to records which are not in the collection keep the index
+        sales = shops._index("sales")
+        stray = Shop(name="stray", region=Region(name="east"), sales=1)
+        stray.sales = 2
+        stray.region.name = "west"
+        self.assertIs(shops._index("sales"), sales)
+
+        # mutations update the indexes, and changes to items rebuild them
+        shops.extend([
+            Shop(name="hull", region=Region(name="north"), sales=20),
+        ])
+        del shops[0]
+        shops[0] = Shop(name="wells", region=Region(name="south"), sales=5)
+        self.assertEqual(names(shops.lookup("region", "north")), ["hull"])
+        self.assertEqual(names(shops.lookup("region", "south")),
+                         ["wells", "bath", "kent"])
+        self.assertEqual(names(shops.range("sales", 0, 25)),
+                         ["wells", "bath", "hull"])
+        shops[1].sales = 50
+        shops.lookup("region", "south")[0].region.name = "west"
+        self.assertEqual(names(shops.range("sales", 25)), ["kent", "bath"])
+        self.assertEqual(names(shops.lookup("region", "west")), ["wells"])
+
+        class ShopMap(DictCollection):
+            itemtype = Shop
+            indexes = dict(sales=SortedIndex("sales"))
+
+        shop_map = ShopMap(dict((x.name, x) for x in shops))
+        self.assertEqual(names(shop_map.range("sales", 20, 50)),
+                         ["hull", "kent"])
+        del shop_map["kent"]
+        shop_map["leeds"] = Shop(name="leeds", sales=30)
+        self.assertEqual(names(shop_map.range("sales", 20, 50)),
+                         ["hull", "leeds"])
+        self.assertEqual(names(shop_map.lookup("sales", 50)), ["bath"])
+
+        class Mall(Record):
+            name = Property()
+            shops = ListProperty(of=Shop)
+
+        class MallList(RecordList):
+            itemtype = Mall
+            indexes = dict(shop=HashIndex(["shops", None, "name"]))
+
+        malls = MallList([
+            Mall(name="arcade", shops=[shops[0], shops[1]]),
+            Mall(name="centre", shops=[shops[1]]),
+        ])
+        self.assertEqual(names(malls.lookup("shop", "bath")),
+                         ["arcade", "centre"])
+        self.assertEqual(names(malls.lookup("shop", "wells")), ["arcade"])
+
+        # repeated values only index an item once
+        class Tagged(Record):
+            name = Property()
+            tags = ListProperty(of=str)
+
+        class TaggedList(RecordList):
+            itemtype = Tagged
+            indexes = dict(
+                tag=HashIndex(["tags", None]),
+                sorted_tag=SortedIndex(["tags", None]),
+            )
+
+        tagged = TaggedList([Tagged(name="a", tags=["y"])])
+        self.assertEqual(names(tagged.lookup("tag", "y")), ["a"])
+        tagged.append(Tagged(name="b", tags=["z", "y", "z"]))
+        tagged[0] = Tagged(name="c", tags=["z", "z"])
+        self.assertEqual(names(tagged.lookup("tag", "z")), ["c", "b"])
+        self.assertEqual(names(tagged.lookup("sorted_tag", "z")), ["c", "b"])
+        self.assertEqual(names(tagged.range("sorted_tag", "y")),
+                         ["b", "c", "b"])
+        del tagged[1]
+        self.assertEqual(names(tagged.lookup("tag", "y")), [])
+        self.assertEqual(names(tagged.range("sorted_tag")), ["c"])
+
+        class TagIndex(_KeyIndex):
+            pass
+
+        with self.assertRaisesRegexp(
+            exc.CollectionDefinitionError,
+            r"item_values must be defined in a TagIndex subclass",
+        ):
+            TagIndex().item_values(Tagged, tagged[0])
+
+    def test_list_mutation(self):
+        coerced = []
+
+        class Pebble(Record):
+            primary_key = ["weight"]
+            weight = Property(isa=int)
+
+        class PebbleList(RecordList):
+            itemtype = Pebble
+
+            @_classproperty
+            def coerceitem(cls):
+                def coerce(value):
+                    coerced.append(value)
+                    return Pebble(value)
+                return coerce
+
+        pebbles = PebbleList([{"weight": 1}, Pebble(weight=2)])
+        self.assertEqual(coerced, [{"weight": 1}])
+        del coerced[:]
+
+        pebbles.append({"weight": 3})
+        pebbles.extend([Pebble(weight=4), {"weight": "5"}])
+        pebbles.insert(0, {"weight": 0})
+        pebbles.insert(-1, Pebble(weight=6))
+        pebbles.insert(99, {"weight": 7})
+        pebbles[1] = {"weight": 8}
+        pebbles[-1:] = [{"weight": 9}]
+        self.assertEqual(coerced, [
+            {"weight": 3}, {"weight": "5"}, {"weight": 0}, {"weight": 7},
+            {"weight": 8}, {"weight": 9},
+        ])
+        self.assertEqual([x.weight for x in pebbles], [0, 8, 2, 3, 4, 6, 5, 9])
+        self.assertTrue(all(type(x) is Pebble for x in pebbles))
+        with self.assertRaises(exc.CoerceError):
+            pebbles.extend([Pebble(weight=10), {"weight": "heavy"}])
+        self.assertEqual(len(pebbles), 8)
+
+        # insert keeps the primary key index up to date
+        index = pebbles.pk_index()
+        pebbles.insert(2, Pebble(weight=1))
+        self.assertIs(pebbles.pk_index(), index)
+        self.assertEqual(index, PebbleList(pebbles).pk_index())
+        self.assertIs(pebbles.get_by_pk(5), pebbles[7])
+
+    def test_set_collection(self):
+        class Badge(Record):
+            primary_key = ["code"]
+            code = Property(isa=str)
+            colour = Property()
+
+            def __eq__(self, other):
+                raise AssertionError("items compared with ==")
+
+        class Scout(Record):
+            badges = SetProperty(of=Badge)
+
+        scout = Scout(badges=[
+            Badge(code="knot", colour="red"), {"code": "fire"},
+            Badge(code="knot", colour="blue"),
+        ])
+        badges = scout.badges
+        self.assertIsInstance(badges, SetCollection)
+        self.assertEqual(len(badges), 2)
+        self.assertEqual(badges.get_by_pk("knot").colour, "red")
+        self.assertIn(Badge(code="fire"), badges)
+        self.assertIn({"code": "fire"}, badges)
+        self.assertNotIn(Badge(code="swim"), badges)
+        self.assertNotIn({"code": "fire", "unknown": 1}, badges)
+        self.assertEqual(sorted(x.code for x in badges), ["fire", "knot"])
+        self.assertEqual(str(badges), "<BadgeSet: 2 item(s)>")
+
+        badges.add({"code": "swim"})
+        badges.add(Badge(code="swim", colour="green"))
+        badges.update([Badge(code="map"), {"code": "knot"}])
+        badges.discard(Badge(code="cook"))
+        badges.remove(Badge(code="map"))
+        with self.assertRaises(KeyError):
+            badges.remove(Badge(code="map"))
+        self.assertEqual([x.code for x in badges.sorted_items()],
+                         ["fire", "knot", "swim"])
+        self.assertFalse(hasattr(badges.get_by_pk("swim"), "colour"))
+
+        other = type(badges)([{"code": "swim", "colour": "gold"},
+                              {"code": "row"}])
+
+        def codes(badge_set):
+            self.assertIs(type(badge_set), type(badges))
+            return [x.code for x in badge_set.sorted_items()]
+
+        self.assertEqual(codes(badges | other),
+                         ["fire", "knot", "row", "swim"])
+        self.assertFalse(
+            hasattr((badges | other).get_by_pk("swim"), "colour"),
+        )
+        self.assertEqual(codes(badges & other), ["swim"])
+        self.assertEqual(codes(badges - other), ["fire", "knot"])
+        self.assertEqual(codes(badges.union([{"code": "row"}])),
+                         ["fire", "knot", "row", "swim"])
+        self.assertEqual(codes(badges.difference([Badge(code="knot")])),
+                         ["fire", "swim"])
+
+        # order of items does not affect the primary key of the record
+        self.assertEqual(
+            Scout(badges=list(reversed(badges.sorted_items()))).__pk__,
+            scout.__pk__,
+        )
+
+        class Patch(Record):
+            primary_key = ["code"]
+            code = Property(isa=str)
+
+        class Guide(Record):
+            patches = SetProperty(of=Patch)
+
+        visited = VisitorPattern.visit(
+            Guide(patches=[{"code": "knot"}, {"code": "fire"}]),
+        )
+        self.assertEqual(
+            sorted(x['code'] for x in visited['patches']), ["fire", "knot"],
+        )
+        self.assertEqual(
+            sorted(VisitorPattern.cast(Guide, visited).patches.values),
+            [("fire",), ("knot",)],
+        )
+
+        class Tagged(Record):
+            tags = SetProperty(of=str)
+
+        tags = Tagged(tags=["a", "b", "a"]).tags
+        self.assertEqual(tags.get_by_pk("a"), "a")
+        self.assertIsNone(tags.get_by_pk("c"))
+        self.assertIn("b", tags)
+
+        with self.assertRaises(exc.SetOfWhat):
+            SetProperty()
+        with self.assertRaises(exc.SetPropertyMustDeriveSetCollection):
+            SetProperty(of=Badge, coll=ListCollection)
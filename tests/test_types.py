@@ -21,13 +21,17 @@ import re
 import sys
 import unittest2
 
+import normalize.exc as exc
 from normalize.record import Record
+from normalize.property import make_property_type
 from normalize.property import LazyProperty
 from normalize.property import LazySafeProperty
 from normalize.property import Property
 from normalize.property import ROLazyProperty
 from normalize.property import ROProperty
 from normalize.property import SafeProperty
+from normalize.property.cache import clear_coerce_caches
+from normalize.property.cache import CoerceCache
 from normalize.property.types import *
 
 
@@ -88,6 +92,36 @@ class TestTypeLibrary(unittest2.TestCase):
         p.integer = 1e20
         self.assertEqual(p.integer, 100000000000000000000L)
 
+    def test_iso8601(self):
+        from normalize.property.types import parse_datetime
+        from normalize.property.types import parse_iso8601
+
+        for stamp in (
+            "2014-04-02", "2014-04-02T12:34", "2014-04-02 12:34:56",
+            "2014-04-02T12:34:56.5", "2014-04-02T12:34:56,1234567",
+            "2014-04-02T12:34:56Z", "2014-04-02T12:34:56.000001+00:00",
+            "2014-04-02T12:34:56-05:30", "2014-04-02T12:34+0100",
+            "2014-04-02T12:34:56+05", u"2014-04-02T12:34:56-00:00",
+        ):
+            parsed = parse_iso8601(stamp)
+            expected = parse_datetime(stamp)
+            self.assertEqual(parsed, expected, stamp)
+            self.assertEqual(
+                parsed.utcoffset(), expected.utcoffset(), stamp,
+            )
+
+        for stamp in ("20121212", "2014-4-2", "April 2, 2014",
+                      "2014-04-02T12", "2014-04-02T12:34:56 +05:00"):
+            self.assertIsNone(parse_iso8601(stamp), stamp)
+
+        class Props(Record):
+            isadatetime = DatetimeProperty()
+
+        p = Props(isadatetime="April 2, 2014 12:34")
+        self.assertEqual(p.isadatetime, datetime(2014, 4, 2, 12, 34))
+        with self.assertRaises(ValueError):
+            p.isadatetime = "2014-13-02T12:34:56"
+
 
 class TestSubTypes(unittest2.TestCase):
     """Proof of concept test for coercing between sub-types of real types.
@@ -128,3 +162,71 @@ class TestSubTypes(unittest2.TestCase):
         self.assertEqual(nbo.count, 10)
         with self.assertRaises(ValueError):
             nbo.count = 0.5
+
+    def test_coerce_cache(self):
+        calls = []
+
+        def parse_level(x):
+            calls.append(x)
+            return int(x)
+
+        LevelProperty = make_property_type(
+            "LevelProperty", isa=int, coerce=parse_level, coerce_cache=2,
+        )
+        shared = CoerceCache(10)
+
+        class Reading(Record):
+            when = DatetimeProperty(coerce_cache=shared)
+            since = DatetimeProperty(coerce_cache=shared)
+            level = LevelProperty()
+            peak = LevelProperty(check=lambda x: x < 10)
+
+        level_cache = Reading.properties['level'].coerce_cache
+        self.assertIsNot(level_cache, Reading.properties['peak'].coerce_cache)
+        self.assertIs(Reading.properties['since'].coerce_cache, shared)
+
+        stamp = "2014-11-04T20:30:00"
+        readings = list(
+            Reading(when=stamp, since=stamp, level=level, peak="5")
+            for level in ("1", "2", "1", "3", "1")
+        )
+        self.assertEqual(readings[0].when, datetime(2014, 11, 4, 20, 30))
+        self.assertEqual((shared.hits, shared.misses), (9, 1))
+        self.assertEqual(sorted(calls), ["1", "2", "3", "5"])
+        self.assertEqual(len(level_cache), 2)
+        self.assertEqual(
+            repr(level_cache),
+            "<CoerceCache: 2/2 entries, 2 hit(s), 3 miss(es)>",
+        )
+
+        self.assertEqual(Reading.properties['level'].type_safe_value(1.0), 1)
+        self.assertEqual(Reading.properties['level'].type_safe_value("3"), 3)
+        # 1.0 is a different key to "1", and pushes out "3"
+        self.assertEqual(calls[-2:], [1.0, "3"])
+
+        with self.assertRaises(exc.CoerceError):
+            Reading(level="high")
+        with self.assertRaises(exc.CoerceError):
+            Reading(level="high")
+        self.assertEqual(calls[-2:], ["high", "high"])
+        with self.assertRaises(ValueError):
+            Reading(peak="11")
+
+        with self.assertRaises(exc.CoerceError):
+            Reading(level=["4"])
+        self.assertEqual(calls[-1], ["4"])
+
+        clear_coerce_caches()
+        self.assertEqual((len(shared), shared.hits, shared.misses), (0, 0, 0))
+        self.assertEqual(len(level_cache), 0)
+
+        # an empty cache is used outside the generated validators too
+        del calls[:]
+        level = Reading.properties['level']
+        for x in range(3):
+            self.assertEqual(level.type_safe_value("7"), 7)
+        self.assertEqual(calls, ["7"])
+        self.assertEqual(len(level_cache), 1)
+
+        with self.assertRaises(exc.CoerceWithoutType):
+            Property(coerce_cache=10)